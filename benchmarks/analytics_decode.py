@@ -0,0 +1,125 @@
+"""
+Benchmark the float64 analytics decoders against the Decimal ``TypeAdapter`` path.
+
+Builds multi-megabyte synthetic all-markets payloads (order books, trades and candles) and reports rows per second.
+
+    python benchmarks/analytics_decode.py [--markets 150] [--depth 200] [--trades 500] [--candles 1000]
+
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable
+
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.ohcl_schema import all_ohlc_T, decode_all_ohlc
+from nobitex.schema.orderbook import all_order_books_T, decode_all_order_books
+from nobitex.schema.trade_schema import all_trades_T, decode_all_trades
+
+
+def make_order_books(rng: random.Random, markets: int, depth: int) -> bytes:
+    payload = {}
+    for m in range(markets):
+        mid = rng.randint(10_000, 10_000_000_000)
+        payload[f"M{m}IRT"] = {
+            "lastUpdate": 1644991756704,
+            "bids": [[str(mid - (i + 1) * 10), f"{rng.random() * 5:.6f}"] for i in range(depth)],
+            "asks": [[str(mid + (i + 1) * 10), f"{rng.random() * 5:.6f}"] for i in range(depth)],
+        }
+    return json.dumps(payload).encode()
+
+
+def make_trades(rng: random.Random, markets: int, count: int) -> bytes:
+    payload = {}
+    for m in range(markets):
+        trades = []
+        for i in range(count):
+            price, amount = rng.randint(10_000, 10_000_000_000), round(rng.random() * 5, 6)
+            trades.append(
+                {
+                    "market": f"M{m}IRT",
+                    "price": str(price),
+                    "amount": f"{amount:.6f}",
+                    "total": f"{price * amount:.6f}",
+                    "type": rng.choice(["buy", "sell"]),
+                    "timestamp": f"2024-01-01T10:{i // 60 % 60:02d}:{i % 60:02d}.123456+00:00",
+                }
+            )
+        payload[f"M{m}IRT"] = {"status": "ok", "trades": trades}
+    return json.dumps(payload).encode()
+
+
+def make_ohlc(rng: random.Random, markets: int, count: int) -> bytes:
+    payload = {}
+    for m in range(markets):
+        rows, price = [], rng.randint(10_000, 10_000_000)
+        for i in range(count):
+            low, high = price - rng.randint(0, 50), price + rng.randint(0, 50)
+            close = rng.randint(low, high)
+            rows.append([1699000000 + i * 60, str(price), str(high), str(low), str(close), f"{rng.random() * 9:.4f}"])
+            price = close
+        payload[f"M{m}IRT"] = {"values": rows}
+    return json.dumps(payload).encode()
+
+
+def measure(func: Callable[[bytes], Any], data: bytes, rounds: int) -> float:
+    func(data)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(data)
+    return (time.perf_counter() - start) / rounds
+
+
+def report(title: str, data: bytes, rows: int, cases: list[tuple[str, Callable[[bytes], Any]]], rounds: int) -> None:
+    print(f"{title}: {rows} rows, {len(data) / 1e6:.2f} MB")
+    for name, func in cases:
+        seconds = measure(func, data, rounds)
+        print(f"  {name:<36} {seconds * 1e3:9.2f} ms  {rows / seconds / 1e6:6.2f} M rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markets", type=int, default=150)
+    parser.add_argument("--depth", type=int, default=200)
+    parser.add_argument("--trades", type=int, default=500)
+    parser.add_argument("--candles", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    report(
+        "order books",
+        make_order_books(rng, args.markets, args.depth),
+        args.markets * args.depth * 2,
+        [
+            ("all_order_books_T.validate_json", all_order_books_T.validate_json),
+            ("decode_all_order_books (float64)", decode_all_order_books),
+        ],
+        args.rounds,
+    )
+    report(
+        "trades",
+        make_trades(rng, args.markets, args.trades),
+        args.markets * args.trades,
+        [
+            ("all_trades_T.validate_json", all_trades_T.validate_json),
+            ("decode_all_trades (float64)", decode_all_trades),
+        ],
+        args.rounds,
+    )
+    report(
+        "ohlc",
+        make_ohlc(rng, args.markets, args.candles),
+        args.markets * args.candles,
+        [
+            ("all_ohlc_T.validate_json", all_ohlc_T.validate_json),
+            ("decode_all_ohlc (float64)", decode_all_ohlc),
+            ("decode_all_ohlc (scaled)", lambda d: decode_all_ohlc(d, MarketScale(0, 4))),
+        ],
+        args.rounds,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark decoding of the all-markets order book response.
+
+Compares ``all_order_books_T.validate_json`` against the bulk ``decode_all_order_books`` path on a synthetic
+``/v3/orderbook/all`` payload and reports levels per second.
+
+    python benchmarks/orderbook_decode.py [--markets 150] [--depth 50] [--rounds 20]
+
+"""
+import argparse
+import json
+import random
+import time
+from typing import Any, Callable
+
+from nobitex.schema.orderbook import all_order_books_T, decode_all_order_books
+
+
+def make_payload(markets: int, depth: int) -> bytes:
+    rng = random.Random(0)
+    payload: dict[str, Any] = {}
+    for m in range(markets):
+        mid = rng.randint(10_000, 10_000_000_000)
+        payload[f"M{m}IRT"] = {
+            "lastUpdate": 1644991756704,
+            "bids": [[str(mid - (i + 1) * 10), f"{rng.random() * 5:.6f}"] for i in range(depth)],
+            "asks": [[str(mid + (i + 1) * 10), f"{rng.random() * 5:.6f}"] for i in range(depth)],
+        }
+    return json.dumps(payload).encode()
+
+
+def measure(func: Callable[[bytes], Any], data: bytes, rounds: int) -> float:
+    func(data)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func(data)
+    return (time.perf_counter() - start) / rounds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--markets", type=int, default=150)
+    parser.add_argument("--depth", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    data = make_payload(args.markets, args.depth)
+    levels = args.markets * args.depth * 2
+    cases: list[tuple[str, Callable[[bytes], Any]]] = [
+        ("all_order_books_T.validate_json", all_order_books_T.validate_json),
+        ("decode_all_order_books (float64)", decode_all_order_books),
+        ("decode_all_order_books (scaled)", lambda d: decode_all_order_books(d, 0, 6)),
+    ]
+    print(f"{args.markets} markets x {args.depth * 2} levels, {len(data) / 1e6:.2f} MB")
+    for name, func in cases:
+        seconds = measure(func, data, args.rounds)
+        print(f"{name:<36} {seconds * 1e3:8.2f} ms  {levels / seconds / 1e6:6.2f} M levels/s")
+
+
+if __name__ == "__main__":
+    main()
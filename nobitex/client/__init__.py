@@ -0,0 +1,20 @@
+"""HTTP clients for the Nobitex public market-data API."""
+from nobitex.client._core import BASE_URL, NobitexAPIError
+from nobitex.client.async_client import AsyncNobitexClient
+from nobitex.client.cache import DEFAULT_TTLS, ResponseCache
+from nobitex.client.ratelimit import DEFAULT_RATE_LIMITS, RateLimit, RateLimiter, TokenBucket, shared_rate_limiter
+from nobitex.client.sync_client import NobitexClient
+
+__all__ = [
+    "AsyncNobitexClient",
+    "BASE_URL",
+    "DEFAULT_RATE_LIMITS",
+    "DEFAULT_TTLS",
+    "NobitexAPIError",
+    "NobitexClient",
+    "RateLimit",
+    "RateLimiter",
+    "ResponseCache",
+    "TokenBucket",
+    "shared_rate_limiter",
+]
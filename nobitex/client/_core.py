@@ -0,0 +1,169 @@
+"""
+Transport-independent part of the Nobitex clients: request building, response parsing and caching.
+
+Each market-data call is described by a ``Request`` carrying its endpoint name, path, query parameters and the
+function that validates the raw response bytes straight into the schema models. ``ClientCore`` holds the state
+both clients share, so they only differ in how they wait for the rate limiter and send a request.
+
+"""
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Generic, Hashable, Mapping, Optional, TypeVar, Union
+
+import httpx
+from pydantic import Field, TypeAdapter, ValidationError
+from pydantic_core import from_json
+from typing_extensions import Annotated
+
+from nobitex.client.ratelimit import RateLimiter, shared_rate_limiter
+from nobitex.schema.ohcl_schema import OHCL
+from nobitex.schema.orderbook import OrderBook
+from nobitex.schema.trade_schema import NubitexTrades, parse_epoch_ms
+
+if TYPE_CHECKING:
+    from nobitex.client.cache import ResponseCache
+
+BASE_URL = "https://api.nobitex.ir"
+USER_AGENT = "TraderBot/nobitex-python"
+
+DEFAULT_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+Timestamp = Union[int, str, datetime]
+T = TypeVar("T")
+
+# The all-books response mixes a top-level "status" string in with the symbol entries.
+_all_order_books_response_T = TypeAdapter(
+    Dict[str, Annotated[Union[OrderBook, str], Field(union_mode="left_to_right")]]
+)
+
+
+class NobitexAPIError(Exception):
+    """Error response from the Nobitex API (HTTP error status or a failed ``status`` in the body)."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None, payload: Any = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.payload = payload
+
+
+class Request(Generic[T]):
+    """One API call: ``endpoint`` names the call for per-endpoint policies, ``parse`` validates the body."""
+
+    __slots__ = ("endpoint", "path", "params", "parse")
+
+    def __init__(self, endpoint: str, path: str, params: Optional[Dict[str, Any]], parse: Callable[[bytes], T]) -> None:
+        self.endpoint = endpoint
+        self.path = path
+        self.params = params
+        self.parse = parse
+
+    @property
+    def key(self) -> Hashable:
+        """Identity of the call: requests with equal keys fetch the same resource."""
+        return self.path, None if self.params is None else tuple(sorted(self.params.items()))
+
+    def __repr__(self) -> str:
+        return f"Request({self.endpoint!r}, {self.path!r}, {self.params!r})"
+
+
+def http_options(
+    base_url: str, timeout: float, http2: bool, limits: httpx.Limits, headers: Optional[Mapping[str, str]]
+) -> Dict[str, Any]:
+    """Keyword arguments for the pooled ``httpx.Client`` / ``httpx.AsyncClient`` of a Nobitex client."""
+    return {
+        "base_url": base_url,
+        "timeout": timeout,
+        "http2": http2,
+        "limits": limits,
+        "headers": {"User-Agent": USER_AGENT, **(headers or {})},
+    }
+
+
+def _parse_all_order_books(content: bytes) -> Dict[str, OrderBook]:
+    books = _all_order_books_response_T.validate_json(content)
+    return {symbol: book for symbol, book in books.items() if isinstance(book, OrderBook)}
+
+
+def order_book_request(symbol: str) -> Request[OrderBook]:
+    return Request("orderbook", f"/v3/orderbook/{symbol}", None, OrderBook.model_validate_json)
+
+
+def all_order_books_request() -> Request[Dict[str, OrderBook]]:
+    return Request("orderbook", "/v3/orderbook/all", None, _parse_all_order_books)
+
+
+def trades_request(symbol: str) -> Request[NubitexTrades]:
+    def parse(content: bytes) -> NubitexTrades:
+        return NubitexTrades.model_validate_json(content, context={"market": symbol})
+
+    return Request("trades", f"/v2/trades/{symbol}", None, parse)
+
+
+def ohlc_request(
+    symbol: str, resolution: str, start: Timestamp, end: Timestamp, countback: Optional[int] = None
+) -> Request[OHCL]:
+    """UDF history request; ``start`` and ``end`` accept epoch seconds/milliseconds, ISO strings or datetimes."""
+    params: Dict[str, Any] = {
+        "symbol": symbol,
+        "resolution": resolution,
+        "from": parse_epoch_ms(start) // 1000,
+        "to": parse_epoch_ms(end) // 1000,
+    }
+    if countback is not None:
+        params["countback"] = countback
+    return Request("udf_history", "/market/udf/history", params, OHCL.model_validate_json)
+
+
+def _api_error(content: bytes, status_code: int) -> Optional[NobitexAPIError]:
+    try:
+        payload = from_json(content)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    status = payload.get("status", payload.get("s"))
+    if status in ("ok", "no_data"):
+        return None
+    message = payload.get("message") or payload.get("errmsg") or payload.get("code") or str(status)
+    return NobitexAPIError(str(message), status_code, payload)
+
+
+def handle_response(request: Request[T], status_code: int, content: bytes) -> T:
+    """Parse a response body, raising ``NobitexAPIError`` for HTTP errors and failed API responses."""
+    if status_code >= 400:
+        error = _api_error(content, status_code)
+        raise error or NobitexAPIError(f"HTTP {status_code} from {request.path}", status_code)
+    try:
+        return request.parse(content)
+    except ValidationError as validation_error:
+        error = _api_error(content, status_code)
+        if error is None:
+            raise
+        raise error from validation_error
+
+
+class ClientCore:
+    """
+    Cache, rate limiter and base URL of a client, with the steps around sending a request.
+
+    A subclass sets ``base_url`` once its HTTP client is built. Its send path is: return ``cached(request)`` if
+    any, otherwise acquire ``rate_limiter`` for ``request.endpoint``, send, and ``complete`` the response.
+    """
+
+    base_url: str
+
+    def __init__(self, cache: Optional["ResponseCache"], rate_limiter: Optional[RateLimiter]) -> None:
+        self.cache = cache
+        self.rate_limiter = shared_rate_limiter() if rate_limiter is None else rate_limiter
+
+    def cached(self, request: Request[T]) -> Optional[T]:
+        """The fresh cached result of ``request``, or ``None`` on a miss or without a cache."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.base_url, request)
+
+    def complete(self, request: Request[T], response: httpx.Response) -> T:
+        """Parse the ``response`` to ``request`` and cache the result."""
+        result = handle_response(request, response.status_code, response.content)
+        if self.cache is not None:
+            self.cache.put(self.base_url, request, result, len(response.content))
+        return result
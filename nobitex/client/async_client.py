@@ -0,0 +1,104 @@
+"""
+Asynchronous Nobitex market-data client.
+
+All calls share one pooled ``httpx.AsyncClient``, so connections (and their TLS sessions) are kept alive and
+reused across requests. Responses are validated from the raw bytes into the schema models.
+
+"""
+from types import TracebackType
+from typing import Dict, Mapping, Optional, Type
+
+import httpx
+
+from nobitex.client._core import (
+    BASE_URL,
+    DEFAULT_LIMITS,
+    ClientCore,
+    Request,
+    T,
+    Timestamp,
+    all_order_books_request,
+    http_options,
+    ohlc_request,
+    order_book_request,
+    trades_request,
+)
+from nobitex.client.cache import ResponseCache
+from nobitex.client.ratelimit import RateLimiter
+from nobitex.client.singleflight import AsyncSingleFlight
+from nobitex.schema.ohcl_schema import OHCL
+from nobitex.schema.orderbook import OrderBook
+from nobitex.schema.trade_schema import NubitexTrades
+
+
+class AsyncNobitexClient(ClientCore):
+    """
+    Market-data client over a single pooled ``httpx.AsyncClient``.
+
+    ``http2=True`` needs the ``h2`` package (``pip install 'httpx[http2]'``). ``limits`` sets the connection pool
+    size and keep-alive; ``transport`` is passed to httpx (e.g. a mock transport in tests). Requests wait on
+    ``rate_limiter``, by default the process-wide ``shared_rate_limiter()`` used by every client. With
+    ``coalesce`` (the default) concurrent identical calls share one request and one parsed model instance, and a
+    ``cache`` serves results still within their endpoint TTL from memory. Use as an async context manager or call
+    ``aclose`` to release the pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        *,
+        timeout: float = 10.0,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        super().__init__(cache, rate_limiter)
+        self._flights = AsyncSingleFlight() if coalesce else None
+        self._http = httpx.AsyncClient(transport=transport, **http_options(base_url, timeout, http2, limits, headers))
+        self.base_url = str(self._http.base_url)
+
+    async def _send(self, request: Request[T]) -> T:
+        cached = self.cached(request)
+        if cached is not None:
+            return cached
+        if self._flights is None:
+            return await self._fetch(request)
+        return await self._flights.do(request.key, lambda: self._fetch(request))
+
+    async def _fetch(self, request: Request[T]) -> T:
+        await self.rate_limiter.acquire_async(request.endpoint)
+        response = await self._http.get(request.path, params=request.params)
+        return self.complete(request, response)
+
+    async def order_book(self, symbol: str) -> OrderBook:
+        return await self._send(order_book_request(symbol))
+
+    async def all_order_books(self) -> Dict[str, OrderBook]:
+        return await self._send(all_order_books_request())
+
+    async def trades(self, symbol: str) -> NubitexTrades:
+        return await self._send(trades_request(symbol))
+
+    async def ohlc(
+        self, symbol: str, resolution: str, start: Timestamp, end: Timestamp, countback: Optional[int] = None
+    ) -> OHCL:
+        """Candles from the UDF history endpoint, timestamps in epoch milliseconds."""
+        return await self._send(ohlc_request(symbol, resolution, start, end, countback))
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def __aenter__(self) -> "AsyncNobitexClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.aclose()
@@ -0,0 +1,97 @@
+"""
+In-memory TTL cache of parsed market-data responses.
+
+Entries are keyed by the client's base URL and ``Request.key`` (path and query parameters), so clients of different
+hosts (e.g. testnet and production) can share a cache. They expire after the TTL of their endpoint, so a reader that
+tolerates e.g. 500 ms of staleness is served the already-parsed model without a network round trip or validation.
+The cache is bounded by the size of the cached response bodies and evicts least recently used entries.
+
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Mapping, NamedTuple, Optional
+
+from nobitex.client._core import Request
+
+DEFAULT_TTLS: Dict[str, float] = {
+    "orderbook": 0.5,
+    "trades": 0.5,
+    "udf_history": 30.0,
+}
+
+
+class _Entry(NamedTuple):
+    expires: float
+    size: int
+    value: Any
+
+
+class ResponseCache:
+    """
+    Parsed responses with per-endpoint TTLs (seconds) and LRU eviction beyond ``max_bytes``.
+
+    Endpoints without a TTL are not cached. Size is measured by response body bytes, a proxy proportional to the
+    parsed models. Cached models are shared between callers and must not be mutated. Thread-safe; one cache may
+    serve several clients.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if any(ttl <= 0 for ttl in ttls.values()) or max_bytes <= 0:
+            raise ValueError("TTLs and max_bytes must be positive")
+        self.ttls = dict(ttls)
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = self.misses = 0
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, base_url: str, request: Request[Any]) -> Optional[Any]:
+        """The fresh cached result of ``request`` sent to ``base_url``, or ``None``."""
+        if request.endpoint not in self.ttls:
+            return None
+        key = (base_url, request.key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def put(self, base_url: str, request: Request[Any], value: Any, size: int) -> None:
+        """Store the parsed ``value`` of a ``size``-byte response from ``base_url`` if its endpoint is cached."""
+        ttl = self.ttls.get(request.endpoint)
+        if ttl is None or size > self.max_bytes:
+            return
+        key = (base_url, request.key)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(self._clock() + ttl, size, value)
+            self.size += size
+            while self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: Hashable) -> None:
+        self.size -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(entries={len(self)}, bytes={self.size}, hits={self.hits}, misses={self.misses})"
@@ -0,0 +1,114 @@
+"""
+Client-side token-bucket rate limiting per API endpoint.
+
+Each endpoint (``Request.endpoint``) has a bucket of ``capacity`` tokens refilled over ``period`` seconds. Taking a
+token is a reservation under a lock: the balance may go negative and the caller waits until its token has been
+refilled, so concurrent threads and coroutines are served in arrival order without busy polling. By default all
+clients in a process share one limiter, since the API budget is per client IP/account, not per client object.
+
+"""
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Mapping, NamedTuple, Optional
+
+
+class RateLimit(NamedTuple):
+    """``requests`` per ``period`` seconds."""
+
+    requests: int
+    period: float
+
+
+# Conservative defaults for the public market-data endpoints; pass your own limits if yours differ.
+DEFAULT_RATE_LIMITS: Dict[str, RateLimit] = {
+    "orderbook": RateLimit(300, 60.0),
+    "trades": RateLimit(60, 60.0),
+    "udf_history": RateLimit(60, 60.0),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket holding up to ``capacity`` tokens, refilled at ``capacity / period`` per second."""
+
+    __slots__ = ("capacity", "rate", "_tokens", "_updated", "_clock", "_lock")
+
+    def __init__(self, capacity: int, period: float, clock: Callable[[], float] = time.monotonic) -> None:
+        if capacity <= 0 or period <= 0:
+            raise ValueError("capacity and period must be positive")
+        self.capacity = float(capacity)
+        self.rate = capacity / period
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take ``tokens`` now and return the seconds to wait before using them (0 if available)."""
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    @property
+    def available(self) -> float:
+        """Tokens that can be taken without waiting."""
+        with self._lock:
+            self._refill()
+            return max(self._tokens, 0.0)
+
+
+class RateLimiter:
+    """Per-endpoint ``TokenBucket``s; endpoints without a configured limit are not limited."""
+
+    def __init__(
+        self, limits: Mapping[str, RateLimit] = DEFAULT_RATE_LIMITS, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.limits = dict(limits)
+        self._buckets = {
+            endpoint: TokenBucket(limit.requests, limit.period, clock) for endpoint, limit in self.limits.items()
+        }
+
+    def reserve(self, endpoint: str) -> float:
+        """Take a token for ``endpoint`` and return the seconds to wait before sending."""
+        bucket = self._buckets.get(endpoint)
+        return 0.0 if bucket is None else bucket.reserve()
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the calling thread until a request to ``endpoint`` is allowed."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait without blocking the event loop until a request to ``endpoint`` is allowed."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def remaining(self, endpoint: str) -> Optional[float]:
+        """Requests ``endpoint`` can take right now, or ``None`` if it is not limited."""
+        bucket = self._buckets.get(endpoint)
+        return None if bucket is None else bucket.available
+
+    def budget(self) -> Dict[str, float]:
+        """Remaining requests of every limited endpoint, for schedulers to prioritize."""
+        return {endpoint: bucket.available for endpoint, bucket in self._buckets.items()}
+
+
+_shared_lock = threading.Lock()
+_shared: Optional[RateLimiter] = None
+
+
+def shared_rate_limiter() -> RateLimiter:
+    """The process-wide limiter used by clients created without an explicit ``rate_limiter``."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = RateLimiter()
+        return _shared
@@ -0,0 +1,102 @@
+"""
+Synchronous Nobitex market-data client.
+
+Same surface as ``AsyncNobitexClient`` over one pooled ``httpx.Client``. Request building, response parsing and
+caching come from :mod:`nobitex.client._core`, so both clients send identical requests, validate response bytes
+the same way and only differ in how they send.
+
+"""
+from types import TracebackType
+from typing import Dict, Mapping, Optional, Type
+
+import httpx
+
+from nobitex.client._core import (
+    BASE_URL,
+    DEFAULT_LIMITS,
+    ClientCore,
+    Request,
+    T,
+    Timestamp,
+    all_order_books_request,
+    http_options,
+    ohlc_request,
+    order_book_request,
+    trades_request,
+)
+from nobitex.client.cache import ResponseCache
+from nobitex.client.ratelimit import RateLimiter
+from nobitex.client.singleflight import SingleFlight
+from nobitex.schema.ohcl_schema import OHCL
+from nobitex.schema.orderbook import OrderBook
+from nobitex.schema.trade_schema import NubitexTrades
+
+
+class NobitexClient(ClientCore):
+    """
+    Blocking market-data client over a single pooled ``httpx.Client``.
+
+    Takes the same options as ``AsyncNobitexClient``, including the process-wide rate limiter, request coalescing
+    across threads and the optional response ``cache``. Use as a context manager or call ``close`` to release the
+    pool. A client may be shared between threads.
+    """
+
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        *,
+        timeout: float = 10.0,
+        http2: bool = False,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        headers: Optional[Mapping[str, str]] = None,
+        transport: Optional[httpx.BaseTransport] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        super().__init__(cache, rate_limiter)
+        self._flights = SingleFlight() if coalesce else None
+        self._http = httpx.Client(transport=transport, **http_options(base_url, timeout, http2, limits, headers))
+        self.base_url = str(self._http.base_url)
+
+    def _send(self, request: Request[T]) -> T:
+        cached = self.cached(request)
+        if cached is not None:
+            return cached
+        if self._flights is None:
+            return self._fetch(request)
+        return self._flights.do(request.key, lambda: self._fetch(request))
+
+    def _fetch(self, request: Request[T]) -> T:
+        self.rate_limiter.acquire(request.endpoint)
+        response = self._http.get(request.path, params=request.params)
+        return self.complete(request, response)
+
+    def order_book(self, symbol: str) -> OrderBook:
+        return self._send(order_book_request(symbol))
+
+    def all_order_books(self) -> Dict[str, OrderBook]:
+        return self._send(all_order_books_request())
+
+    def trades(self, symbol: str) -> NubitexTrades:
+        return self._send(trades_request(symbol))
+
+    def ohlc(
+        self, symbol: str, resolution: str, start: Timestamp, end: Timestamp, countback: Optional[int] = None
+    ) -> OHCL:
+        """Candles from the UDF history endpoint, timestamps in epoch milliseconds."""
+        return self._send(ohlc_request(symbol, resolution, start, end, countback))
+
+    def close(self) -> None:
+        self._http.close()
+
+    def __enter__(self) -> "NobitexClient":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
@@ -0,0 +1 @@
+"""Market data engines and analytics built on top of :mod:`nobitex.schema`."""
@@ -0,0 +1,102 @@
+"""
+OHLCV candles built directly from the trade stream.
+
+``CandleBuilder`` keeps one open bar per market and timeframe and updates it in O(1) per trade; a bar is emitted as
+an ``OHCLEntry`` once a trade of a later bucket arrives (or ``flush`` is called with a later time). Buckets use the
+same alignment as :mod:`nobitex.market.resample`.
+
+"""
+from decimal import Decimal
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from nobitex.market.resample import UTC, Offset, bucket_bounds, parse_timeframe
+from nobitex.schema.ohcl_schema import OHCLEntry
+from nobitex.schema.trade_schema import TradeEntry
+
+
+class ClosedCandle(NamedTuple):
+    """A finished bar of ``market`` with bucket size ``timeframe`` (milliseconds)."""
+
+    market: str
+    timeframe: int
+    candle: OHCLEntry
+
+
+class _Bar:
+    __slots__ = ("start", "end", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, end: int, price: Decimal, amount: Decimal) -> None:
+        self.start = start
+        self.end = end
+        self.open = self.high = self.low = self.close = price
+        self.volume = amount
+
+    def to_entry(self) -> OHCLEntry:
+        return OHCLEntry.model_construct(
+            timestamp=self.start, open=self.open, high=self.high, low=self.low, close=self.close, volume=self.volume
+        )
+
+
+class CandleBuilder:
+    """
+    Aggregates trades into bars for each ``timeframe`` (``"1m"``, ``"5m"``, milliseconds, ...).
+
+    Trades must be fed oldest first per market; the recent-trades endpoint returns newest first, so reverse its
+    list before feeding it. A trade falling before the open (or last flushed) bar of a timeframe cannot be applied
+    there and is counted in ``late`` once per such timeframe.
+    """
+
+    def __init__(self, timeframes: Iterable[Union[int, str]] = ("1m",), offset: Offset = UTC) -> None:
+        self.timeframes: Tuple[int, ...] = tuple(parse_timeframe(timeframe) for timeframe in timeframes)
+        self.offset = offset
+        self.late = 0
+        self._bars: Dict[Tuple[str, int], _Bar] = {}
+        self._flushed: Dict[Tuple[str, int], int] = {}
+
+    def add(self, trade: TradeEntry) -> List[ClosedCandle]:
+        """Apply one trade and return the bars it closed."""
+        timestamp, price, amount = trade.timestamp, trade.price, trade.amount
+        closed = []
+        for size in self.timeframes:
+            key = (trade.market, size)
+            bar = self._bars.get(key)
+            if bar is not None and bar.start <= timestamp < bar.end:
+                if price > bar.high:
+                    bar.high = price
+                elif price < bar.low:
+                    bar.low = price
+                bar.close = price
+                bar.volume += amount
+                continue
+            start, end = bucket_bounds(timestamp, size, self.offset)
+            if bar is None and start <= self._flushed.get(key, start - 1):
+                self.late += 1
+            elif bar is None or start > bar.start:
+                if bar is not None:
+                    closed.append(ClosedCandle(trade.market, size, bar.to_entry()))
+                self._bars[key] = _Bar(start, end, price, amount)
+            else:
+                self.late += 1
+        return closed
+
+    def update(self, trades: Iterable[TradeEntry]) -> List[ClosedCandle]:
+        """Apply trades in order and return every bar they closed."""
+        closed = []
+        for trade in trades:
+            closed.extend(self.add(trade))
+        return closed
+
+    def flush(self, now: int) -> List[ClosedCandle]:
+        """Close and return the open bars whose bucket ended at or before ``now`` (epoch ms)."""
+        closed = []
+        for (market, size), bar in list(self._bars.items()):
+            if bar.end <= now:
+                closed.append(ClosedCandle(market, size, bar.to_entry()))
+                self._flushed[(market, size)] = bar.start
+                del self._bars[(market, size)]
+        return closed
+
+    def open_bar(self, market: str, timeframe: Union[int, str]) -> Optional[OHCLEntry]:
+        """Snapshot of the bar still being built for ``market``, if any."""
+        bar = self._bars.get((market, parse_timeframe(timeframe)))
+        return None if bar is None else bar.to_entry()
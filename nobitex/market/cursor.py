@@ -0,0 +1,94 @@
+"""
+Incremental cursor over repeatedly polled recent-trades payloads.
+
+Polls of the recent-trades endpoint return overlapping windows. ``TradeCursor`` parses each payload to plain JSON
+values, walks it from the newest trade until it reaches what it has already emitted, and validates only that new
+part into ``TradeEntry`` objects. The already-seen prefix is never validated.
+
+"""
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from pydantic import TypeAdapter
+from pydantic_core import from_json
+
+from nobitex.schema.trade_schema import TradeEntry, parse_epoch_ms
+
+Fingerprint = Tuple[str, str, str]
+
+_trade_list_T = TypeAdapter(List[TradeEntry])
+
+
+def _timestamp(trade: Dict[str, Any]) -> int:
+    """Epoch ms of a schema (``timestamp``) or public endpoint (``time``) row."""
+    return parse_epoch_ms(trade["time"] if "time" in trade else trade["timestamp"])
+
+
+def _fingerprint(trade: Dict[str, Any]) -> Fingerprint:
+    return str(trade["price"]), str(trade["amount"] if "amount" in trade else trade["volume"]), str(trade["type"])
+
+
+class _Position:
+    __slots__ = ("timestamp", "seen")
+
+    def __init__(self) -> None:
+        self.timestamp: Optional[int] = None
+        self.seen: Set[Fingerprint] = set()
+
+
+class TradeCursor:
+    """
+    Remembers per market the newest trade timestamp emitted and the price/amount/type fingerprints of the trades
+    at that timestamp, which identifies the new part of the next overlapping window.
+
+    Payload trade lists may be newest first (as the API returns them) or oldest first; new trades are always
+    emitted oldest first.
+    """
+
+    def __init__(self) -> None:
+        self._positions: Dict[str, _Position] = {}
+
+    def position(self, market: str) -> Optional[int]:
+        """Epoch-ms timestamp of the newest trade emitted for ``market``."""
+        position = self._positions.get(market)
+        return None if position is None else position.timestamp
+
+    def update(self, data: Union[str, bytes, Dict[str, Any]]) -> Dict[str, List[TradeEntry]]:
+        """New trades per market of an ``all_trades_T`` payload (``{market: {"trades": [...], ...}}``)."""
+        payloads: Dict[str, Any] = from_json(data) if isinstance(data, (str, bytes)) else data
+        return {market: self.update_market(market, payload) for market, payload in payloads.items()}
+
+    def update_market(self, market: str, data: Union[str, bytes, Dict[str, Any], List[Any]]) -> List[TradeEntry]:
+        """
+        New trades of one market from a ``NubitexTrades`` payload or a bare list of trades.
+
+        Rows may use the schema keys or the ``/v2/trades`` endpoint keys (``time``, ``volume``, no ``market``).
+        """
+        payload: Any = from_json(data) if isinstance(data, (str, bytes)) else data
+        trades: List[Dict[str, Any]] = payload["trades"] if isinstance(payload, dict) else payload
+        if not trades:
+            return []
+        if _timestamp(trades[0]) < _timestamp(trades[-1]):
+            trades = trades[::-1]
+        position = self._positions.setdefault(market, _Position())
+        last = position.timestamp
+        new, newest, frontier = [], last, set()
+        for trade in trades:
+            timestamp = _timestamp(trade)
+            if last is not None and timestamp < last:
+                break
+            fingerprint = _fingerprint(trade)
+            if timestamp == last and fingerprint in position.seen:
+                continue
+            new.append(trade)
+            if newest is None or timestamp > newest:
+                newest, frontier = timestamp, {fingerprint}
+            elif timestamp == newest:
+                frontier.add(fingerprint)
+        if not new:
+            return []
+        entries = _trade_list_T.validate_python(new[::-1], context={"market": market})
+        if newest == last:
+            position.seen |= frontier
+        else:
+            position.timestamp, position.seen = newest, frontier
+        return entries
@@ -0,0 +1,99 @@
+"""
+Depth queries over an ``OrderBook`` snapshot.
+
+Cumulative base and quote sums are precomputed once per side, so fill estimates and depth-at-bps lookups are
+a binary search instead of a rescan of the ``OrderBookEntry`` lists.
+
+"""
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from itertools import accumulate
+from typing import List, NamedTuple, Optional, Sequence
+
+from nobitex.schema.orderbook import OrderBook, OrderBookEntry
+
+_ZERO = Decimal(0)
+_BPS = Decimal(10000)
+
+
+class FillEstimate(NamedTuple):
+    """Result of walking the book for a market order."""
+
+    base: Decimal
+    quote: Decimal
+    average_price: Decimal
+    worst_price: Decimal
+    slippage_bps: Decimal
+    complete: bool
+
+
+class _SideDepth:
+    __slots__ = ("prices", "base", "quote")
+
+    def __init__(self, entries: Sequence[OrderBookEntry]) -> None:
+        self.prices: List[Decimal] = [entry.price for entry in entries]
+        self.base: List[Decimal] = list(accumulate(entry.quantity for entry in entries))
+        self.quote: List[Decimal] = list(accumulate(entry.price * entry.quantity for entry in entries))
+
+    def fill(self, base: Optional[Decimal], quote: Optional[Decimal], sign: int) -> FillEstimate:
+        if (base is None) == (quote is None):
+            raise ValueError("Exactly one of base or quote must be given")
+        if not self.prices:
+            return FillEstimate(_ZERO, _ZERO, _ZERO, _ZERO, _ZERO, False)
+        by_quote = quote is not None
+        target = Decimal(quote if by_quote else base)  # type: ignore[arg-type]
+        index = bisect_left(self.quote if by_quote else self.base, target)
+        complete = index < len(self.prices)
+        if not complete:
+            index -= 1
+            filled_base, filled_quote = self.base[index], self.quote[index]
+        else:
+            price = self.prices[index]
+            prev_base = self.base[index - 1] if index else _ZERO
+            prev_quote = self.quote[index - 1] if index else _ZERO
+            if by_quote:
+                filled_base, filled_quote = prev_base + (target - prev_quote) / price, target
+            else:
+                filled_base, filled_quote = target, prev_quote + (target - prev_base) * price
+        if not filled_base:
+            return FillEstimate(_ZERO, _ZERO, _ZERO, _ZERO, _ZERO, complete)
+        best, average = self.prices[0], filled_quote / filled_base
+        slippage = sign * (average - best) / best * _BPS
+        return FillEstimate(filled_base, filled_quote, average, self.prices[index], slippage, complete)
+
+
+class DepthProfile:
+    """
+    Prefix-sum view of an ``OrderBook`` snapshot.
+
+    Build it once per snapshot (``OrderBook.depth`` caches one) and query it as often as needed; the book is
+    assumed sorted best first (bids descending, asks ascending) and not mutated afterwards.
+    """
+
+    __slots__ = ("_bids", "_asks", "_negated_bid_prices")
+
+    def __init__(self, order_book: OrderBook) -> None:
+        self._bids = _SideDepth(order_book.bids)
+        self._asks = _SideDepth(order_book.asks)
+        self._negated_bid_prices = [-price for price in self._bids.prices]
+
+    def buy(self, base: Optional[Decimal] = None, quote: Optional[Decimal] = None) -> FillEstimate:
+        """Estimate a market buy of ``base`` units, or spending ``quote``, against the asks."""
+        return self._asks.fill(base, quote, 1)
+
+    def sell(self, base: Optional[Decimal] = None, quote: Optional[Decimal] = None) -> FillEstimate:
+        """Estimate a market sell of ``base`` units, or receiving ``quote``, against the bids."""
+        return self._bids.fill(base, quote, -1)
+
+    def depth_within(self, bps: Decimal) -> tuple[Decimal, Decimal]:
+        """Cumulative ``(bid, ask)`` base quantity priced within ``bps`` basis points of the mid price."""
+        if not self._bids.prices or not self._asks.prices:
+            return _ZERO, _ZERO
+        mid = (self._bids.prices[0] + self._asks.prices[0]) / 2
+        offset = mid * Decimal(bps) / _BPS
+        bid_count = bisect_right(self._negated_bid_prices, -(mid - offset))
+        ask_count = bisect_right(self._asks.prices, mid + offset)
+        return (
+            self._bids.base[bid_count - 1] if bid_count else _ZERO,
+            self._asks.base[ask_count - 1] if ask_count else _ZERO,
+        )
@@ -0,0 +1,178 @@
+"""
+Incremental order book engine.
+
+Keeps each side as a price -> quantity map plus a sorted price index so single level updates are located by
+binary search instead of re-validating a full ``OrderBook`` snapshot.
+
+"""
+from bisect import bisect_left
+from decimal import Decimal
+from typing import Iterable, Iterator, List, Literal, NamedTuple, Optional
+
+from nobitex.schema.orderbook import OrderBook, OrderBookEntry
+
+Side = Literal["bid", "ask"]
+
+
+class LevelUpdate(NamedTuple):
+    """A change to one price level; a zero ``quantity`` removes the level."""
+
+    side: Side
+    price: Decimal
+    quantity: Decimal
+
+
+class BookSide:
+    """One side of the book, iterated best price first (descending for bids, ascending for asks)."""
+
+    __slots__ = ("levels", "_keys", "_sign")
+
+    def __init__(self, descending: bool) -> None:
+        self.levels: dict[Decimal, Decimal] = {}
+        # Bid prices are indexed negated so both sides keep an ascending, best-first index.
+        self._keys: List[Decimal] = []
+        self._sign = -1 if descending else 1
+
+    def set(self, price: Decimal, quantity: Decimal) -> bool:
+        """Set or remove (``quantity <= 0``) a level; return whether the book changed."""
+        if quantity <= 0:
+            return self.delete(price)
+        old = self.levels.get(price)
+        if old == quantity:
+            return False
+        if old is None:
+            key = self._sign * price
+            self._keys.insert(bisect_left(self._keys, key), key)
+        self.levels[price] = quantity
+        return True
+
+    def delete(self, price: Decimal) -> bool:
+        if self.levels.pop(price, None) is None:
+            return False
+        key = self._sign * price
+        del self._keys[bisect_left(self._keys, key)]
+        return True
+
+    def clear(self) -> None:
+        self.levels.clear()
+        self._keys.clear()
+
+    def items(self) -> Iterator[tuple[Decimal, Decimal]]:
+        """``(price, quantity)`` pairs best first."""
+        sign, levels = self._sign, self.levels
+        for key in self._keys:
+            yield sign * key, levels[sign * key]
+
+    def prices(self) -> List[Decimal]:
+        """Prices best first."""
+        sign = self._sign
+        return [sign * key for key in self._keys]
+
+    def best(self) -> Optional[OrderBookEntry]:
+        if not self._keys:
+            return None
+        price = self._sign * self._keys[0]
+        return OrderBookEntry.model_construct(price=price, quantity=self.levels[price])
+
+    def entries(self, depth: Optional[int] = None) -> List[OrderBookEntry]:
+        keys = self._keys if depth is None else self._keys[:depth]
+        sign, levels = self._sign, self.levels
+        return [OrderBookEntry.model_construct(price=sign * key, quantity=levels[sign * key]) for key in keys]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class OrderBookEngine:
+    """
+    Order book that is updated level by level.
+
+    ``apply`` and ``apply_snapshot`` return only the levels that actually changed, so consumers can forward
+    deltas downstream instead of whole books.
+    """
+
+    def __init__(self, order_book: Optional[OrderBook] = None) -> None:
+        self.bids = BookSide(descending=True)
+        self.asks = BookSide(descending=False)
+        if order_book is not None:
+            self.apply_snapshot(order_book)
+
+    def _side(self, side: Side) -> BookSide:
+        if side == "bid":
+            return self.bids
+        if side == "ask":
+            return self.asks
+        raise ValueError(f"Unknown side {side!r}")
+
+    def apply(self, updates: Iterable[LevelUpdate]) -> List[LevelUpdate]:
+        """Apply level updates (set, or delete when ``quantity`` is zero) and return the effective ones."""
+        changed = []
+        for update in updates:
+            if self._side(update.side).set(update.price, update.quantity):
+                changed.append(update if update.quantity > 0 else update._replace(quantity=Decimal(0)))
+        return changed
+
+    def apply_snapshot(self, order_book: OrderBook) -> List[LevelUpdate]:
+        """Replace the book with a full snapshot and return the level changes against the previous state."""
+        changed = diff_levels("bid", self.bids.items(), _pairs(order_book.bids), descending=True)
+        changed += diff_levels("ask", self.asks.items(), _pairs(order_book.asks), descending=False)
+        for update in changed:
+            self._side(update.side).set(update.price, update.quantity)
+        return changed
+
+    def snapshot(self, depth: Optional[int] = None) -> OrderBook:
+        """Materialize the current state as an ``OrderBook`` (bids descending, asks ascending)."""
+        return OrderBook.model_construct(bids=self.bids.entries(depth), asks=self.asks.entries(depth))
+
+
+def _pairs(entries: Iterable[OrderBookEntry]) -> Iterator[tuple[Decimal, Decimal]]:
+    for entry in entries:
+        yield entry.price, entry.quantity
+
+
+def diff_levels(
+    side: Side,
+    old: Iterable[tuple[Decimal, Decimal]],
+    new: Iterable[tuple[Decimal, Decimal]],
+    descending: bool,
+) -> List[LevelUpdate]:
+    """
+    Merge two best-first sorted ``(price, quantity)`` sequences of one side in a single linear pass.
+
+    Returns a zero-quantity update for every removed level and the new quantity for every added or resized one.
+    Levels with a non-positive quantity in ``new`` are treated as absent.
+    """
+    changes: List[LevelUpdate] = []
+    zero = Decimal(0)
+    old_iter, new_iter = iter(old), (level for level in new if level[1] > 0)
+    old_level, new_level = next(old_iter, None), next(new_iter, None)
+    while old_level is not None and new_level is not None:
+        old_price, new_price = old_level[0], new_level[0]
+        if old_price == new_price:
+            if old_level[1] != new_level[1]:
+                changes.append(LevelUpdate(side, new_price, new_level[1]))
+            old_level, new_level = next(old_iter, None), next(new_iter, None)
+        elif (old_price > new_price) == descending:
+            changes.append(LevelUpdate(side, old_price, zero))
+            old_level = next(old_iter, None)
+        else:
+            changes.append(LevelUpdate(side, new_price, new_level[1]))
+            new_level = next(new_iter, None)
+    while old_level is not None:
+        changes.append(LevelUpdate(side, old_level[0], zero))
+        old_level = next(old_iter, None)
+    while new_level is not None:
+        changes.append(LevelUpdate(side, new_level[0], new_level[1]))
+        new_level = next(new_iter, None)
+    return changes
+
+
+def diff_order_books(old: OrderBook, new: OrderBook) -> List[LevelUpdate]:
+    """
+    Compute the minimal level changes turning ``old`` into ``new`` for the same market.
+
+    Both books must have their sides sorted best first (bids descending, asks ascending), as the API returns them.
+    """
+    changes = diff_levels("bid", _pairs(old.bids), _pairs(new.bids), descending=True)
+    changes += diff_levels("ask", _pairs(old.asks), _pairs(new.asks), descending=False)
+    return changes
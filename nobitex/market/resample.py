@@ -0,0 +1,162 @@
+"""
+OHLC resampling from a fine timeframe (e.g. 1m) to coarser ones (5m, 15m, 1h, 1D, ...).
+
+Candles are aggregated in a single linear pass into a ``CandleSeries``. Buckets are aligned to UTC, a fixed offset
+or a time zone such as ``TEHRAN``, and the ``Resampler`` keeps the rows of the open bucket so a revised last input
+bar only recomputes the last output bar. Timestamps are epoch milliseconds.
+
+"""
+from datetime import date, datetime, time, tzinfo
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.ohcl_schema import OHCL, CandleSeries, OHCLEntry
+
+MINUTE = 60_000
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+WEEK = 7 * DAY
+
+UTC = 0
+# Iran observed UTC+04:30 daylight saving every summer until 2022, so historical bars need the zone, not +03:30.
+TEHRAN = ZoneInfo("Asia/Tehran")
+
+Offset = Union[int, tzinfo]
+
+_UNITS = {"m": MINUTE, "h": HOUR, "D": DAY, "W": WEEK}
+# Weeks start on Monday; the epoch (1970-01-01) was a Thursday.
+_MONDAY_OFFSET = 4 * DAY
+_EPOCH_DAY = date(1970, 1, 1).toordinal()
+_MONDAY_DAY = _EPOCH_DAY + 4
+
+
+def parse_timeframe(timeframe: Union[int, str]) -> int:
+    """
+    Bucket size in milliseconds of ``"5m"``, ``"1h"``, ``"1D"``, ``"1W"`` or a UDF resolution (``"15"``, ``"D"``).
+
+    Integers are taken as milliseconds.
+    """
+    if isinstance(timeframe, int):
+        size = timeframe
+    elif timeframe.isdigit():
+        size = int(timeframe) * MINUTE
+    elif timeframe and timeframe[-1] in _UNITS and (timeframe[:-1].isdigit() or not timeframe[:-1]):
+        size = int(timeframe[:-1] or 1) * _UNITS[timeframe[-1]]
+    else:
+        raise ValueError(f"Unknown timeframe {timeframe!r}")
+    if size <= 0:
+        raise ValueError(f"Timeframe must be positive, got {timeframe!r}")
+    return size
+
+
+def bucket_bounds(timestamp: int, size: int, offset: Offset = UTC) -> Tuple[int, int]:
+    """
+    ``(start, end)`` epoch milliseconds of the ``size`` bucket containing ``timestamp``.
+
+    ``offset`` is a fixed UTC offset in milliseconds or a ``tzinfo``. With a ``tzinfo``, buckets of whole days start
+    at local midnight (following daylight saving); shorter ones are counted from the local midnight of their day,
+    and the last one of a day ends at the next midnight, so a 23 or 25 hour day never yields overlapping buckets.
+    Buckets of whole weeks start on Monday.
+    """
+    weekly = size % WEEK == 0
+    if isinstance(offset, tzinfo):
+        if size % DAY == 0:
+            return _local_day_bounds(timestamp, size // DAY, weekly, offset)
+        day_start, day_end = _local_day_bounds(timestamp, 1, False, offset)
+        start = timestamp - (timestamp - day_start) % size
+        return start, min(start + size, day_end)
+    start = timestamp - (timestamp + offset - (_MONDAY_OFFSET if weekly else 0)) % size
+    return start, start + size
+
+
+def _local_day_bounds(timestamp: int, days: int, weekly: bool, zone: tzinfo) -> Tuple[int, int]:
+    day = datetime.fromtimestamp(timestamp / 1000, zone).date().toordinal()
+    first = day - (day - (_MONDAY_DAY if weekly else _EPOCH_DAY)) % days
+    return _local_midnight(first, zone), _local_midnight(first + days, zone)
+
+
+def _local_midnight(day: int, zone: tzinfo) -> int:
+    return int(datetime.combine(date.fromordinal(day), time(), zone).timestamp()) * 1000
+
+
+class Resampler:
+    """
+    Incrementally aggregates ``(timestamp, open, high, low, close, volume)`` rows into ``series``.
+
+    Rows must arrive in timestamp order. A row repeating the last timestamp replaces that row (a still-forming
+    input bar), and only the last output bar is recomputed. The last bar of ``series`` is partial until a row of a
+    later bucket arrives.
+    """
+
+    __slots__ = ("size", "offset", "series", "_rows", "_bucket", "_bucket_end")
+
+    def __init__(self, timeframe: Union[int, str], offset: Offset = UTC, scale: Optional[MarketScale] = None) -> None:
+        self.size = parse_timeframe(timeframe)
+        self.offset = offset
+        self.series = CandleSeries(scale)
+        self._rows: List[Sequence[Any]] = []
+        self._bucket: Optional[int] = None
+        self._bucket_end: Optional[int] = None
+
+    def bucket(self, timestamp: int) -> int:
+        """Start of the bucket containing ``timestamp``."""
+        return bucket_bounds(timestamp, self.size, self.offset)[0]
+
+    def update(self, rows: Iterable[Sequence[Any]]) -> None:
+        series = self.series
+        highs, lows, closes, volumes = series.highs, series.lows, series.closes, series.volumes
+        size, offset = self.size, self.offset
+        buffer, bucket, end = self._rows, self._bucket, self._bucket_end
+        try:
+            for row in rows:
+                timestamp, open_, high, low, close, volume = row[:6]
+                if buffer and timestamp <= buffer[-1][0]:
+                    if timestamp < buffer[-1][0]:
+                        raise ValueError(f"Candle at {timestamp} is older than the last candle at {buffer[-1][0]}")
+                    buffer[-1] = row
+                    self._recompute()
+                    continue
+                if bucket is None or end is None or not bucket <= timestamp < end:
+                    start, stop = bucket_bounds(timestamp, size, offset)
+                    series.append_row((start, open_, high, low, close, volume))
+                    bucket, end = start, stop
+                    buffer.clear()
+                else:
+                    if high > highs[-1]:
+                        highs[-1] = high
+                    if low < lows[-1]:
+                        lows[-1] = low
+                    closes[-1] = close
+                    volumes[-1] += volume
+                buffer.append(row)
+        finally:
+            self._bucket, self._bucket_end = bucket, end
+
+    def update_entries(self, entries: Iterable[OHCLEntry]) -> None:
+        """Feed ``OHCLEntry`` candles, encoded with the output scale."""
+        scale = self.series.scale
+        if scale is not None:
+            self.update(entry.to_scaled(scale) for entry in entries)
+        else:
+            self.update(
+                (entry.timestamp, *map(float, (entry.open, entry.high, entry.low, entry.close, entry.volume)))
+                for entry in entries
+            )
+
+    def _recompute(self) -> None:
+        series, rows = self.series, self._rows
+        series.opens[-1] = rows[0][1]
+        series.highs[-1] = max(row[2] for row in rows)
+        series.lows[-1] = min(row[3] for row in rows)
+        series.closes[-1] = rows[-1][4]
+        series.volumes[-1] = sum(row[5] for row in rows)
+
+
+def resample(candles: Union[CandleSeries, OHCL], timeframe: Union[int, str], offset: Offset = UTC) -> CandleSeries:
+    """Aggregate a whole series into ``timeframe`` buckets in one pass; the last bucket may be partial."""
+    if isinstance(candles, OHCL):
+        candles = candles.to_series()
+    resampler = Resampler(timeframe, offset, candles.scale)
+    resampler.update(candles.rows())
+    return resampler.series
@@ -0,0 +1,138 @@
+"""
+Rolling trade aggregates over time windows.
+
+Each window keeps its trades in a deque with running sums that are updated as trades enter and expire, so VWAP,
+buy/sell volume, trade count and imbalance cost O(1) amortized per trade instead of a rescan of the trade list.
+Sums are ``Decimal``, so adding and removing trades never drifts.
+
+"""
+from collections import deque
+from decimal import Decimal
+from typing import Deque, Dict, Iterable, NamedTuple, Optional, Tuple, Union
+
+from nobitex.market.resample import parse_timeframe
+from nobitex.schema.symbols import TradeSide
+from nobitex.schema.trade_schema import TradeEntry
+
+_ZERO = Decimal(0)
+
+
+class TradeStats(NamedTuple):
+    """Aggregates of the trades in one window; ``vwap`` and ``imbalance`` are ``None`` without volume."""
+
+    trades: int
+    volume: Decimal
+    buy_volume: Decimal
+    sell_volume: Decimal
+    quote_volume: Decimal
+    vwap: Optional[Decimal]
+    imbalance: Optional[Decimal]
+
+
+class RollingWindow:
+    """Trades of one market whose timestamp is within ``window`` milliseconds of the newest time seen."""
+
+    __slots__ = ("window", "_trades", "_now", "_buy", "_sell", "_quote")
+
+    def __init__(self, window: Union[int, str]) -> None:
+        self.window = parse_timeframe(window)
+        self._trades: Deque[Tuple[int, Decimal, Decimal, bool]] = deque()
+        self._now: Optional[int] = None
+        self._buy = self._sell = self._quote = _ZERO
+
+    def add(self, trade: TradeEntry) -> None:
+        """Add a trade; trades older than the window are ignored."""
+        timestamp, amount, now = trade.timestamp, trade.amount, self._now
+        if now is None or timestamp > now:
+            self.advance(timestamp)
+            now = timestamp
+        elif timestamp <= now - self.window:
+            return
+        quote = trade.price * amount
+        buy = trade.type == TradeSide.BUY
+        trades, entry = self._trades, (timestamp, amount, quote, buy)
+        if trades and timestamp < trades[-1][0]:
+            # Late trades are rare and usually recent: find their place from the right to keep the deque ordered.
+            index = len(trades) - 1
+            while index and trades[index - 1][0] > timestamp:
+                index -= 1
+            trades.insert(index, entry)
+        else:
+            trades.append(entry)
+        if buy:
+            self._buy += amount
+        else:
+            self._sell += amount
+        self._quote += quote
+
+    def advance(self, now: int) -> None:
+        """Move the window end to ``now`` (epoch ms) and expire trades at or before ``now - window``."""
+        if self._now is not None and now <= self._now:
+            return
+        self._now = now
+        trades, cutoff = self._trades, now - self.window
+        while trades and trades[0][0] <= cutoff:
+            _, amount, quote, buy = trades.popleft()
+            if buy:
+                self._buy -= amount
+            else:
+                self._sell -= amount
+            self._quote -= quote
+        if not trades:
+            # Reset so an emptied window reports plain zeros rather than e.g. Decimal("0.000").
+            self._buy = self._sell = self._quote = _ZERO
+
+    def stats(self) -> TradeStats:
+        buy, sell = self._buy, self._sell
+        volume = buy + sell
+        return TradeStats(
+            trades=len(self._trades),
+            volume=volume,
+            buy_volume=buy,
+            sell_volume=sell,
+            quote_volume=self._quote,
+            vwap=self._quote / volume if volume else None,
+            imbalance=(buy - sell) / volume if volume else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self._trades)
+
+
+class RollingTradeStats:
+    """
+    Per-market ``RollingWindow`` aggregates for each configured window (``"1m"``, ``"5m"``, milliseconds, ...).
+
+    Trades should arrive in time order; a late trade still inside a window is counted and expires by its own
+    timestamp, and one older than the window is ignored. ``advance`` expires trades when no new trade arrives.
+    """
+
+    def __init__(self, windows: Iterable[Union[int, str]] = ("1m",)) -> None:
+        self.windows = tuple(parse_timeframe(window) for window in windows)
+        self._markets: Dict[str, Tuple[RollingWindow, ...]] = {}
+
+    def _market(self, market: str) -> Tuple[RollingWindow, ...]:
+        windows = self._markets.get(market)
+        if windows is None:
+            windows = self._markets[market] = tuple(RollingWindow(window) for window in self.windows)
+        return windows
+
+    def add(self, trade: TradeEntry) -> None:
+        for window in self._market(trade.market):
+            window.add(trade)
+
+    def update(self, trades: Iterable[TradeEntry]) -> None:
+        for trade in trades:
+            self.add(trade)
+
+    def advance(self, now: int) -> None:
+        for windows in self._markets.values():
+            for window in windows:
+                window.advance(now)
+
+    def stats(self, market: str, window: Union[int, str]) -> TradeStats:
+        """Aggregates of ``market`` over ``window``, which must be one of the configured windows."""
+        size = parse_timeframe(window)
+        if size not in self.windows:
+            raise ValueError(f"Window {window!r} is not configured")
+        return self._market(market)[self.windows.index(size)].stats()
@@ -0,0 +1,128 @@
+"""
+Columnar trade tape partitioned by market.
+
+Each market is a ``TradeColumns`` partition kept in timestamp order, so time-range queries are binary searches
+over the int64 timestamp column and exports to NumPy or Arrow share the column buffers.
+
+"""
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from nobitex.schema.numeric import extend_columns as extend_all, market_scale
+from nobitex.schema.symbols import intern_market
+from nobitex.schema.trade_schema import TradeColumns, TradeEntry
+
+_COLUMNS = TradeColumns.__slots__[:-1]
+
+
+class TradeTape:
+    """
+    Trades stored column-wise per market; read methods raise ``KeyError`` for markets without a partition.
+
+    Partitions are float64, or exact fixed-point integers using each market's ``market_scale`` when ``scaled`` is
+    set. Trades of a market must be added in non-decreasing timestamp order.
+    """
+
+    __slots__ = ("scaled", "partitions")
+
+    def __init__(self, scaled: bool = False) -> None:
+        self.scaled = scaled
+        self.partitions: Dict[str, TradeColumns] = {}
+
+    def partition(self, market: str) -> TradeColumns:
+        """Columns of ``market``, created empty on first use."""
+        columns = self.partitions.get(market)
+        if columns is None:
+            market = intern_market(market)
+            columns = self.partitions[market] = TradeColumns(market_scale(market) if self.scaled else None)
+        return columns
+
+    def append(self, trade: TradeEntry) -> None:
+        columns = self.partition(trade.market)
+        if columns.timestamps and trade.timestamp < columns.timestamps[-1]:
+            raise ValueError(f"{trade.market}: trade at {trade.timestamp} is older than {columns.timestamps[-1]}")
+        columns.append(trade)
+
+    def extend(self, trades: Iterable[TradeEntry]) -> None:
+        for trade in trades:
+            self.append(trade)
+
+    def extend_columns(self, market: str, columns: TradeColumns) -> None:
+        """
+        Append decoded columns (e.g. from ``decode_all_trades``) to the partition of ``market``.
+
+        Newest-first batches, as returned by the recent-trades endpoint, are reversed first.
+        """
+        partition = self.partition(market)
+        if columns.scale != partition.scale:
+            raise ValueError(f"{market}: columns scale {columns.scale} does not match the tape {partition.scale}")
+        if not columns.timestamps:
+            return
+        newest_first = columns.timestamps[0] > columns.timestamps[-1]
+        source = {name: getattr(columns, name)[::-1] if newest_first else getattr(columns, name) for name in _COLUMNS}
+        timestamps = source["timestamps"]
+        if any(earlier > later for earlier, later in zip(timestamps, timestamps[1:])):
+            raise ValueError(f"{market}: columns are not in timestamp order")
+        if partition.timestamps and timestamps[0] < partition.timestamps[-1]:
+            raise ValueError(f"{market}: columns start before the end of the tape")
+        extend_all(partition.columns(), [source[name] for name in _COLUMNS])
+
+    def index(self, market: str, timestamp: int) -> int:
+        """Position in the ``market`` partition of the first trade at or after ``timestamp``."""
+        return bisect_left(self.partitions[market].timestamps, timestamp)
+
+    def between(self, market: str, start: Optional[int] = None, end: Optional[int] = None) -> TradeColumns:
+        """Copy of the ``market`` trades with ``start <= timestamp < end``; either bound may be omitted."""
+        partition = self.partitions[market]
+        first = 0 if start is None else bisect_left(partition.timestamps, start)
+        window = slice(first, len(partition) if end is None else bisect_left(partition.timestamps, end))
+        columns = TradeColumns(partition.scale)
+        for name in _COLUMNS:
+            getattr(columns, name).extend(getattr(partition, name)[window])
+        return columns
+
+    def to_numpy(self, market: str) -> Dict[str, Any]:
+        """Zero-copy NumPy views of the ``market`` partition (requires numpy)."""
+        return self.partitions[market].to_numpy()
+
+    def to_arrow(self, market: str) -> Any:
+        """
+        Zero-copy ``pyarrow.Table`` of the ``market`` partition (requires pyarrow).
+
+        ``timestamp`` is ``timestamp[ms, UTC]`` and ``side`` is int8. Scaled partitions keep int64 prices, amounts
+        and totals; their decimal places are stored in the schema metadata (totals use ``price_scale``). While the
+        table is alive the partition cannot grow.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError("Arrow export requires pyarrow: pip install 'nobitex-python[arrow]'") from None
+        partition = self.partitions[market]
+        scale = partition.scale
+        number = pa.float64() if scale is None else pa.int64()
+        types = {
+            "timestamp": pa.timestamp("ms", tz="UTC"),
+            "price": number,
+            "amount": number,
+            "total": number,
+            "side": pa.int8(),
+        }
+        columns = [_arrow_array(pa, getattr(partition, name), kind) for name, kind in zip(_COLUMNS, types.values())]
+        metadata = {"market": market}
+        if scale is not None:
+            metadata.update(price_scale=str(scale.price), amount_scale=str(scale.amount))
+        return pa.table(columns, schema=pa.schema(list(types.items()), metadata=metadata))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.partitions)
+
+    def __len__(self) -> int:
+        return sum(len(columns) for columns in self.partitions.values())
+
+    def __repr__(self) -> str:
+        return f"TradeTape(markets={len(self.partitions)}, trades={len(self)}, scaled={self.scaled})"
+
+
+def _arrow_array(pa: Any, column: "array[Any]", kind: Any) -> Any:
+    return pa.Array.from_buffers(kind, len(column), [None, pa.py_buffer(column)])
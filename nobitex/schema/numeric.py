@@ -0,0 +1,131 @@
+"""
+Numeric helpers shared by the columnar schema types.
+
+A column is stored either as scaled integers (``array('q')``) when a decimal scale is given, or as float64
+(``array('d')``) when the scale is ``None``. Scaled integers round-trip to ``Decimal`` exactly and must fit in
+int64, so every decimal place of a scale costs a factor of ten of range.
+
+"""
+from array import array
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, NamedTuple, Optional, Sequence, Union
+
+Number = Union[int, float]
+
+
+class MarketScale(NamedTuple):
+    """Decimal places kept for prices and amounts of one market in scaled-integer mode."""
+
+    price: int
+    amount: int
+
+
+# Defaults by quote currency: IRT prices are whole rials, USDT prices carry up to 8 decimals. Amounts keep 6
+# decimals, leaving int64 room for volumes up to ~9.2e12 units (e.g. SHIB); register finer scales per market.
+_QUOTE_SCALES = {"IRT": MarketScale(0, 6), "USDT": MarketScale(8, 6)}
+DEFAULT_SCALE = MarketScale(8, 6)
+_INT64_MAX = 2**63 - 1
+_market_scales: dict[str, MarketScale] = {}
+
+
+def register_market_scale(symbol: str, price: int, amount: int) -> None:
+    """Set the scale used for ``symbol`` (e.g. ``"BTCIRT"``), overriding the quote currency default."""
+    _market_scales[symbol.upper()] = MarketScale(price, amount)
+
+
+def market_scale(symbol: str) -> MarketScale:
+    """Return the registered scale of ``symbol``, falling back to its quote currency default."""
+    symbol = symbol.upper()
+    scale = _market_scales.get(symbol)
+    if scale is not None:
+        return scale
+    for quote, quote_scale in _QUOTE_SCALES.items():
+        if symbol.endswith(quote):
+            return quote_scale
+    return DEFAULT_SCALE
+
+
+def new_column(scale: Optional[int]) -> "array[Any]":
+    """Return an empty column for the given scale (``'q'`` if scaled, ``'d'`` otherwise)."""
+    return array("q") if scale is not None else array("d")
+
+
+def append_columns(columns: Sequence["array[Any]"], values: Sequence[Number]) -> None:
+    """
+    Append ``values[i]`` to ``columns[i]`` for every column, or to none of them.
+
+    A column exported to a live ``memoryview`` or NumPy view cannot grow and raises ``BufferError``; the columns
+    already grown are then shrunk back so the columns stay aligned.
+    """
+    grown = 0
+    try:
+        for column, value in zip(columns, values):
+            column.append(value)
+            grown += 1
+    except BaseException:
+        for column in columns[:grown]:
+            column.pop()
+        raise
+
+
+def extend_columns(columns: Sequence["array[Any]"], values: Sequence[Iterable[Number]]) -> None:
+    """``append_columns`` for many rows: extend ``columns[i]`` by ``values[i]`` for every column, or for none."""
+    lengths = [len(column) for column in columns]
+    grown = 0
+    try:
+        for column, column_values in zip(columns, values):
+            column.extend(column_values)
+            grown += 1
+    except BaseException:
+        for column, length in zip(columns[:grown], lengths):
+            del column[length:]
+        raise
+
+
+def encode(value: Any, scale: Optional[int], rounding: Optional[str] = None) -> Number:
+    """Encode ``value`` as float64 (``scale is None``) or as an int64 scaled by ``10 ** scale``.
+
+    Raises ``ValueError`` if the scaled value is outside the int64 range, or if the value has more decimal places
+    than ``scale`` allows and no ``decimal`` ``rounding`` mode (e.g. ``ROUND_HALF_EVEN``) is given.
+    """
+    if scale is None:
+        return float(value)
+    if isinstance(value, str):
+        whole, _, fraction = value.partition(".")
+        fraction = fraction.rstrip("0")
+        if len(fraction) <= scale and whole.lstrip("+-").isdigit() and (not fraction or fraction.isdigit()):
+            return _check_range(int(whole + fraction.ljust(scale, "0")), value, scale)
+    try:
+        scaled = Decimal(value if isinstance(value, (str, int, Decimal)) else str(value)).scaleb(scale)
+        integral = scaled.to_integral_value(rounding)
+    except InvalidOperation:
+        raise ValueError(f"{value!r} is not a valid number") from None
+    if rounding is None and scaled != integral:
+        raise ValueError(f"{value!r} has more than {scale} decimal places")
+    return _check_range(int(integral), value, scale)
+
+
+def _check_range(scaled: int, value: Any, scale: int) -> int:
+    if not -_INT64_MAX <= scaled <= _INT64_MAX:
+        raise ValueError(f"{value!r} does not fit in int64 at {scale} decimal places; register a smaller scale")
+    return scaled
+
+
+def decode(value: Number, scale: Optional[int]) -> Decimal:
+    """Decode a column value back to ``Decimal`` (exact for scaled integers)."""
+    if scale is None:
+        return Decimal(repr(value))
+    return Decimal(value).scaleb(-scale)
+
+
+def to_numpy(column: Union["array[Any]", memoryview]) -> Any:
+    """
+    Zero-copy NumPy view of a column or a ``memoryview`` slice of one (``int64``, ``float64`` or ``int8``).
+
+    NumPy is an optional dependency. While a view is alive the underlying column cannot be resized.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("NumPy export requires numpy: pip install 'nobitex-python[analytics]'") from None
+    return np.frombuffer(column, dtype=column.typecode if isinstance(column, array) else column.format)
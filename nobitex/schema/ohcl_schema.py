@@ -4,14 +4,30 @@ Schema has been defined using Pydantic to validate the data format of Nubitex AP
 Also it should be checked with actual API response to ensure correctness
 
 """
+from array import array
+from bisect import bisect_left
 from decimal import Decimal
-from typing import List, Any
-from pydantic import BaseModel, Field, TypeAdapter, model_validator
+from typing import List, Any, NamedTuple, Optional, Iterable, Iterator, Dict, Sequence, Union
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from typing_extensions import TypedDict
+
+from nobitex.schema.numeric import MarketScale, append_columns, decode, encode, new_column, to_numpy
+
+
+class ScaledCandle(NamedTuple):
+    """``OHCLEntry`` with fixed-point integer prices (``scale.price``) and volume (``scale.amount``)."""
+
+    timestamp: int
+    open: int
+    high: int
+    low: int
+    close: int
+    volume: int
 
 
 class OHCLEntry(BaseModel):
 
-    timestamp: int = Field(..., description="Timestamp (in seconds or milliseconds")
+    timestamp: int = Field(..., description="Epoch timestamp (milliseconds once parsed as part of an OHCL series)")
     open: Decimal = Field(..., description="Opening price")
     high: Decimal = Field(..., description="Highest price")
     low: Decimal = Field(..., description="Lowest price")
@@ -19,12 +35,6 @@ class OHCLEntry(BaseModel):
     volume: Decimal = Field(..., description="Trading volume")
 
     @model_validator(mode="before")
-    def validate_high_low(self) -> 'OHCLEntry':
-       if self.high < max(self.open, self.close):
-           raise ValueError("High must be >= max(open, close)")
-       if self.low > min(self.open, self.close):
-           raise ValueError("Low must be <= min(open, close)")
-       return self
     @classmethod
     def parse_list(cls, values: Any) -> Any:
         if isinstance(values, (list, tuple)):
@@ -47,11 +57,385 @@ class OHCLEntry(BaseModel):
                     "volume": Decimal("0"),
                 }
         return values
-    
+
+    def to_scaled(self, scale: MarketScale) -> ScaledCandle:
+        """Convert to fixed-point integers; raises ``ValueError`` if precision would be lost."""
+        return ScaledCandle(
+            self.timestamp,
+            int(encode(self.open, scale.price)),
+            int(encode(self.high, scale.price)),
+            int(encode(self.low, scale.price)),
+            int(encode(self.close, scale.price)),
+            int(encode(self.volume, scale.amount)),
+        )
+
+    @classmethod
+    def from_scaled(cls, candle: ScaledCandle, scale: MarketScale) -> 'OHCLEntry':
+        return cls.model_construct(
+            timestamp=candle.timestamp,
+            open=decode(candle.open, scale.price),
+            high=decode(candle.high, scale.price),
+            low=decode(candle.low, scale.price),
+            close=decode(candle.close, scale.price),
+            volume=decode(candle.volume, scale.amount),
+        )
+
+
+_SECONDS_LIMIT = 10**11
+
+
+def epoch_ms_factor(timestamps: Sequence[int]) -> int:
+    """
+    Multiplier bringing a series of epoch timestamps to milliseconds: 1000 if they are in seconds, 1 otherwise.
+
+    The unit is decided once per series from its endpoints; values below 10^11 (early 1973 in milliseconds)
+    are seconds.
+    """
+    if not timestamps:
+        return 1
+    return 1000 if max(abs(timestamps[0]), abs(timestamps[-1])) < _SECONDS_LIMIT else 1
+
+
+def parse_udf_history(data: Dict[str, Any]) -> List[List[Any]]:
+    """
+    Rows of a UDF history response (``{"s": "ok", "t": [...], "o": [...], ..., "v": [...]}``).
+
+    ``"no_data"`` gives no rows; any other status raises ``ValueError`` with the response ``errmsg``.
+    """
+    status = data["s"]
+    if status == "no_data":
+        return []
+    if status != "ok":
+        raise ValueError(f"UDF history error: {data.get('errmsg', status)}")
+    columns = [data["t"], data["o"], data["h"], data["l"], data["c"]]
+    if "v" in data:
+        columns.append(data["v"])
+    return [list(row) for row in zip(*columns)]
+
+
+class CandleValidationError(ValueError):
+    """Raised with every offending candle index, grouped by the failed check."""
+
+    def __init__(self, issues: Dict[str, List[int]]) -> None:
+        self.issues = issues
+        super().__init__("; ".join(f"{check} at indexes {indexes}" for check, indexes in issues.items()))
+
+
+def find_invalid_candles(rows: Iterable[Sequence[Any]]) -> Dict[str, List[int]]:
+    """
+    Check a whole series of ``(timestamp, open, high, low, close, volume)`` rows in one pass.
+
+    Returns the offending indexes per failed check: high >= max(open, close), low <= min(open, close),
+    strictly increasing timestamps and non-negative volume. An empty dict means the series is valid.
+    """
+    high, low, order, volume = [], [], [], []
+    previous = None
+    for index, (timestamp, open_, high_, low_, close, volume_) in enumerate(rows):
+        if high_ < open_ or high_ < close:
+            high.append(index)
+        if low_ > open_ or low_ > close:
+            low.append(index)
+        if previous is not None and timestamp <= previous:
+            order.append(index)
+        if volume_ < 0:
+            volume.append(index)
+        previous = timestamp
+    checks = {
+        "high < max(open, close)": high,
+        "low > min(open, close)": low,
+        "timestamp not increasing": order,
+        "negative volume": volume,
+    }
+    return {check: indexes for check, indexes in checks.items() if indexes}
+
+
+def validate_candles(rows: Iterable[Sequence[Any]]) -> None:
+    """Raise ``CandleValidationError`` listing all offending indexes if ``find_invalid_candles`` finds any."""
+    issues = find_invalid_candles(rows)
+    if issues:
+        raise CandleValidationError(issues)
+
+
 class OHCL(BaseModel):
+    """
+    Candles of one market. Timestamps are normalized to epoch milliseconds for the whole series (seconds are
+    detected once from its endpoints) before the series is validated.
+    """
 
     values : list[OHCLEntry] = Field(..., description="List of OHCL entries")
 
+    @model_validator(mode="before")
+    @classmethod
+    def parse_rows(cls, data: Any) -> Any:
+        if isinstance(data, (list, tuple)):
+            return {"values": data}
+        if isinstance(data, dict) and "s" in data and "values" not in data:
+            return {"values": parse_udf_history(data)}
+        return data
+
+    @model_validator(mode="after")
+    def validate_series(self) -> 'OHCL':
+        values = self.values
+        if values and epoch_ms_factor([values[0].timestamp, values[-1].timestamp]) != 1:
+            # Copies: entries passed in as models are not copied by pydantic and belong to the caller.
+            self.values = [entry.model_copy(update={"timestamp": entry.timestamp * 1000}) for entry in values]
+        validate_candles((v.timestamp, v.open, v.high, v.low, v.close, v.volume) for v in self.values)
+        return self
+
+    def to_series(self, scale: Optional[MarketScale] = None) -> 'CandleSeries':
+        """Convert to a columnar ``CandleSeries`` (scaled integers if ``scale`` is given, float64 otherwise)."""
+        return CandleSeries.from_entries(self.values, scale)
+
+
+all_ohlc_T = TypeAdapter(Dict[str, OHCL])
+
+
+class CandleSeries:
+    """
+    Candles of one market stored as parallel columns: int64 timestamps and open/high/low/close/volume.
+
+    Prices and volume are float64, or fixed-point integers when a ``MarketScale`` is given. The series grows
+    append-only in timestamp order, so time lookups (``index``, ``between``, ``last``) are binary searches and
+    return ``CandleView`` windows that share the columns instead of copying them.
+    """
+
+    __slots__ = ("timestamps", "opens", "highs", "lows", "closes", "volumes", "scale")
+
+    def __init__(self, scale: Optional[MarketScale] = None) -> None:
+        self.scale = scale
+        price_scale = None if scale is None else scale.price
+        self.timestamps = new_column(0)
+        self.opens = new_column(price_scale)
+        self.highs = new_column(price_scale)
+        self.lows = new_column(price_scale)
+        self.closes = new_column(price_scale)
+        self.volumes = new_column(None if scale is None else scale.amount)
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[OHCLEntry], scale: Optional[MarketScale] = None) -> 'CandleSeries':
+        series = cls(scale)
+        for entry in entries:
+            series.append(entry)
+        return series
+
+    def append(self, entry: OHCLEntry) -> None:
+        """Append a candle; raises ``ValueError`` unless it is newer than the last one."""
+        if self.timestamps and entry.timestamp <= self.timestamps[-1]:
+            raise ValueError(f"Candle at {entry.timestamp} is not after the last candle at {self.timestamps[-1]}")
+        price_scale = None if self.scale is None else self.scale.price
+        self.append_row((
+            entry.timestamp,
+            encode(entry.open, price_scale),
+            encode(entry.high, price_scale),
+            encode(entry.low, price_scale),
+            encode(entry.close, price_scale),
+            encode(entry.volume, None if self.scale is None else self.scale.amount),
+        ))
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """
+        Append already encoded ``(timestamp, open, high, low, close, volume)`` to all columns or none.
+
+        Raises ``BufferError`` while a view of a column (``CandleView``, ``to_numpy``) is alive.
+        """
+        append_columns((self.timestamps, self.opens, self.highs, self.lows, self.closes, self.volumes), row)
+
+    def entry(self, index: int) -> OHCLEntry:
+        price_scale = None if self.scale is None else self.scale.price
+        return OHCLEntry.model_construct(
+            timestamp=self.timestamps[index],
+            open=decode(self.opens[index], price_scale),
+            high=decode(self.highs[index], price_scale),
+            low=decode(self.lows[index], price_scale),
+            close=decode(self.closes[index], price_scale),
+            volume=decode(self.volumes[index], None if self.scale is None else self.scale.amount),
+        )
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        return zip(self.timestamps, self.opens, self.highs, self.lows, self.closes, self.volumes)
+
+    def validate(self) -> None:
+        """Run the batch candle checks over the columns; raises ``CandleValidationError``."""
+        validate_candles(self.rows())
+
+    def index(self, timestamp: int) -> int:
+        """Position of the first candle at or after ``timestamp``."""
+        return bisect_left(self.timestamps, timestamp)
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> 'CandleView':
+        start, stop, _ = slice(start, stop).indices(len(self))
+        return CandleView(self, start, max(start, stop))
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> 'CandleView':
+        """Candles with ``start <= timestamp < end``; either bound may be omitted."""
+        return self.view(0 if start is None else self.index(start), len(self) if end is None else self.index(end))
+
+    def last(self, count: int, before: Optional[int] = None) -> 'CandleView':
+        """The last ``count`` candles with a timestamp before ``before`` (or the last ``count`` overall)."""
+        stop = len(self) if before is None else self.index(before)
+        return self.view(max(0, stop - count), stop)
+
+    def to_entries(self) -> List[OHCLEntry]:
+        return [self.entry(index) for index in range(len(self))]
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of the columns (requires numpy)."""
+        return {
+            "timestamp": to_numpy(self.timestamps),
+            "open": to_numpy(self.opens),
+            "high": to_numpy(self.highs),
+            "low": to_numpy(self.lows),
+            "close": to_numpy(self.closes),
+            "volume": to_numpy(self.volumes),
+        }
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __repr__(self) -> str:
+        return f"CandleSeries(candles={len(self)}, scaled={self.scale is not None})"
+
+
+class CandleView:
+    """
+    Read-only window ``[start, stop)`` over a ``CandleSeries``; nothing is copied.
+
+    Column attributes are ``memoryview`` slices. While one is alive the series cannot grow, so release them
+    (or let them go out of scope) before appending.
+    """
+
+    __slots__ = ("series", "start", "stop")
+
+    def __init__(self, series: CandleSeries, start: int, stop: int) -> None:
+        self.series = series
+        self.start = start
+        self.stop = stop
+
+    def _column(self, column: "array[Any]") -> memoryview:
+        return memoryview(column)[self.start:self.stop]
+
+    @property
+    def timestamps(self) -> memoryview:
+        return self._column(self.series.timestamps)
+
+    @property
+    def opens(self) -> memoryview:
+        return self._column(self.series.opens)
+
+    @property
+    def highs(self) -> memoryview:
+        return self._column(self.series.highs)
+
+    @property
+    def lows(self) -> memoryview:
+        return self._column(self.series.lows)
+
+    @property
+    def closes(self) -> memoryview:
+        return self._column(self.series.closes)
+
+    @property
+    def volumes(self) -> memoryview:
+        return self._column(self.series.volumes)
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        # Iterates over slice copies so an abandoned iterator never pins the series' buffers.
+        window = slice(self.start, self.stop)
+        series = self.series
+        return zip(
+            series.timestamps[window],
+            series.opens[window],
+            series.highs[window],
+            series.lows[window],
+            series.closes[window],
+            series.volumes[window],
+        )
+
+    def entry(self, index: int) -> OHCLEntry:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("candle index out of range")
+        return self.series.entry(self.start + index)
+
+    def to_entries(self) -> List[OHCLEntry]:
+        return [self.series.entry(index) for index in range(self.start, self.stop)]
+
+    def to_series(self) -> CandleSeries:
+        """Copy the window into a standalone ``CandleSeries``."""
+        series = CandleSeries(self.series.scale)
+        for name in CandleSeries.__slots__[:-1]:
+            getattr(series, name).extend(getattr(self.series, name)[self.start:self.stop])
+        return series
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of the window (requires numpy)."""
+        return {
+            "timestamp": to_numpy(self.timestamps),
+            "open": to_numpy(self.opens),
+            "high": to_numpy(self.highs),
+            "low": to_numpy(self.lows),
+            "close": to_numpy(self.closes),
+            "volume": to_numpy(self.volumes),
+        }
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __repr__(self) -> str:
+        return f"CandleView(candles={len(self)}, start={self.start}, stop={self.stop})"
+
+
+class _RawFloatOHCL(TypedDict):
+    values: List[List[float]]
+
+
+class _RawStrOHCL(TypedDict):
+    __pydantic_config__ = ConfigDict(coerce_numbers_to_str=True)  # type: ignore[misc]
+
+    values: List[List[str]]
+
+
+_raw_float_ohlc_T = TypeAdapter(Dict[str, _RawFloatOHCL])
+_raw_str_ohlc_T = TypeAdapter(Dict[str, _RawStrOHCL])
+
 
-all_ohlc_T = TypeAdapter(Any)
+def decode_all_ohlc(
+    data: Union[str, bytes], scale: Optional[MarketScale] = None, validate: bool = True
+) -> Dict[str, CandleSeries]:
+    """
+    Columnar decoding of multi-symbol ``{symbol: {"values": [[t, o, h, l, c, v], ...]}}`` payloads.
 
+    Rows are validated as plain lists by pydantic-core, without the per-row ``OHCLEntry`` callbacks, and stored
+    in ``CandleSeries`` columns: float64 by default, or exact fixed-point integers when ``scale`` is given.
+    5-element rows get a zero volume and timestamps are normalized to epoch milliseconds. Each series is checked
+    with ``validate_candles`` unless ``validate`` is off.
+    """
+    raw_series = (_raw_float_ohlc_T if scale is None else _raw_str_ohlc_T).validate_json(data)
+    price_scale = None if scale is None else scale.price
+    volume_scale = None if scale is None else scale.amount
+    result = {}
+    for symbol, raw in raw_series.items():
+        rows: List[List[Any]] = raw["values"]
+        if any(len(row) < 5 for row in rows):
+            raise ValueError(f"{symbol}: candle rows need at least 5 values")
+        series = CandleSeries(scale)
+        timestamps = [int(row[0]) for row in rows]
+        factor = epoch_ms_factor(timestamps)
+        series.timestamps.extend(timestamps if factor == 1 else [timestamp * factor for timestamp in timestamps])
+        if scale is None:
+            series.opens.extend([row[1] for row in rows])
+            series.highs.extend([row[2] for row in rows])
+            series.lows.extend([row[3] for row in rows])
+            series.closes.extend([row[4] for row in rows])
+            series.volumes.extend([row[5] if len(row) > 5 else 0.0 for row in rows])
+        else:
+            series.opens.extend([encode(row[1], price_scale) for row in rows])
+            series.highs.extend([encode(row[2], price_scale) for row in rows])
+            series.lows.extend([encode(row[3], price_scale) for row in rows])
+            series.closes.extend([encode(row[4], price_scale) for row in rows])
+            series.volumes.extend([encode(row[5], volume_scale) if len(row) > 5 else 0 for row in rows])
+        if validate:
+            series.validate()
+        result[symbol] = series
+    return result
@@ -1,7 +1,14 @@
 from decimal import Decimal
-from typing import Any, List
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Iterator, List, Mapping, Optional, Sequence, Union
 
-from pydantic import BaseModel, Field, TypeAdapter, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from typing_extensions import Annotated, TypedDict
+
+from nobitex.schema.numeric import MarketScale, decode, encode, new_column, to_numpy
+
+if TYPE_CHECKING:
+    from nobitex.market.depth import DepthProfile
 
 
 class OrderBookEntry(BaseModel):
@@ -15,10 +22,246 @@ class OrderBookEntry(BaseModel):
             return {"price": data[0], "quantity": data[1]}
         return data
 
+    def to_scaled(self, scale: MarketScale) -> tuple[int, int]:
+        """Return ``(price, quantity)`` as fixed-point integers; raises ``ValueError`` if precision would be lost."""
+        return int(encode(self.price, scale.price)), int(encode(self.quantity, scale.amount))
+
+    @classmethod
+    def from_scaled(cls, price: int, quantity: int, scale: MarketScale) -> "OrderBookEntry":
+        return cls.model_construct(price=decode(price, scale.price), quantity=decode(quantity, scale.amount))
+
+
+def _price(entry: OrderBookEntry) -> Decimal:
+    return entry.price
+
+
+def _sort_sides(bids: List[OrderBookEntry], asks: List[OrderBookEntry]) -> None:
+    """Sort both sides best first in place, skipping the sort when a side is already ordered."""
+    if any(bids[i].price < bids[i + 1].price for i in range(len(bids) - 1)):
+        bids.sort(key=_price, reverse=True)
+    if any(asks[i].price > asks[i + 1].price for i in range(len(asks) - 1)):
+        asks.sort(key=_price)
+
+
+# cached_property values of OrderBook, stored in the instance __dict__.
+_CACHED_FIELDS = ("best_bid", "best_ask", "mid", "spread", "spread_bps", "depth")
+
 
 class OrderBook(BaseModel):
+    """
+    Order book snapshot.
+
+    Validated books always have their sides sorted best first: ``bids`` by descending and ``asks`` by ascending
+    price. Derived fields (top of book, ``depth``) are computed on first access and cached, so the snapshot
+    should not be mutated afterwards; ``model_copy(update=...)`` drops them from the copy.
+    """
+
     bids: List[OrderBookEntry] = Field(..., description="List of bid orders")
     asks: List[OrderBookEntry] = Field(..., description="List of ask orders")
 
+    @model_validator(mode="after")
+    def sort_sides(self) -> "OrderBook":
+        _sort_sides(self.bids, self.asks)
+        return self
+
+    def model_copy(self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False) -> "OrderBook":
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            for name in _CACHED_FIELDS:
+                copy.__dict__.pop(name, None)
+        return copy
+
+    @cached_property
+    def best_bid(self) -> Optional[OrderBookEntry]:
+        return self.bids[0] if self.bids else None
+
+    @cached_property
+    def best_ask(self) -> Optional[OrderBookEntry]:
+        return self.asks[0] if self.asks else None
+
+    @cached_property
+    def mid(self) -> Optional[Decimal]:
+        """Mid price, or ``None`` when either side is empty."""
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return (self.best_bid.price + self.best_ask.price) / 2
+
+    @cached_property
+    def spread(self) -> Optional[Decimal]:
+        if self.best_bid is None or self.best_ask is None:
+            return None
+        return self.best_ask.price - self.best_bid.price
+
+    @cached_property
+    def spread_bps(self) -> Optional[Decimal]:
+        """Spread relative to the mid price, in basis points."""
+        if self.spread is None or not self.mid:
+            return None
+        return self.spread / self.mid * 10000
+
+    def to_columnar(self, scale: Optional[MarketScale] = None) -> "ColumnarOrderBook":
+        """Convert to a ``ColumnarOrderBook`` (scaled integers if ``scale`` is given, float64 otherwise)."""
+        if scale is None:
+            return ColumnarOrderBook.from_order_book(self)
+        return ColumnarOrderBook.from_order_book(self, scale.price, scale.amount)
+
+    @cached_property
+    def depth(self) -> "DepthProfile":
+        """Prefix-sum depth profile of this snapshot, built on first access."""
+        from nobitex.market.depth import DepthProfile
+
+        return DepthProfile(self)
+
 
 all_order_books_T = TypeAdapter(dict[str, OrderBook])
+
+
+class ColumnarOrderBook:
+    """
+    Order book stored as parallel price/quantity arrays instead of one pydantic object per level.
+
+    With ``price_scale`` and ``quantity_scale`` set, values are kept as integers scaled by ``10 ** scale``
+    (exact); with both left as ``None`` they are kept as float64. Levels keep the order they were built from,
+    which is best first for API payloads and ``OrderBook`` instances.
+    """
+
+    __slots__ = ("bid_prices", "bid_quantities", "ask_prices", "ask_quantities", "price_scale", "quantity_scale")
+
+    def __init__(self, price_scale: Optional[int] = None, quantity_scale: Optional[int] = None) -> None:
+        if (price_scale is None) != (quantity_scale is None):
+            raise ValueError("price_scale and quantity_scale must both be set or both be None")
+        self.price_scale = price_scale
+        self.quantity_scale = quantity_scale
+        self.bid_prices = new_column(price_scale)
+        self.bid_quantities = new_column(quantity_scale)
+        self.ask_prices = new_column(price_scale)
+        self.ask_quantities = new_column(quantity_scale)
+
+    @property
+    def scaled(self) -> bool:
+        return self.price_scale is not None
+
+    @classmethod
+    def from_lists(
+        cls,
+        bids: Sequence[Sequence[Any]],
+        asks: Sequence[Sequence[Any]],
+        price_scale: Optional[int] = None,
+        quantity_scale: Optional[int] = None,
+    ) -> "ColumnarOrderBook":
+        """Build directly from raw ``[[price, quantity], ...]`` lists as returned by the API."""
+        book = cls(price_scale, quantity_scale)
+        book.bid_prices.extend([encode(level[0], price_scale) for level in bids])
+        book.bid_quantities.extend([encode(level[1], quantity_scale) for level in bids])
+        book.ask_prices.extend([encode(level[0], price_scale) for level in asks])
+        book.ask_quantities.extend([encode(level[1], quantity_scale) for level in asks])
+        return book
+
+    @classmethod
+    def from_order_book(
+        cls, order_book: OrderBook, price_scale: Optional[int] = None, quantity_scale: Optional[int] = None
+    ) -> "ColumnarOrderBook":
+        return cls.from_lists(
+            [(entry.price, entry.quantity) for entry in order_book.bids],
+            [(entry.price, entry.quantity) for entry in order_book.asks],
+            price_scale,
+            quantity_scale,
+        )
+
+    def to_order_book(self) -> OrderBook:
+        bids = [OrderBookEntry.model_construct(price=p, quantity=q) for p, q in self.iter_bids()]
+        asks = [OrderBookEntry.model_construct(price=p, quantity=q) for p, q in self.iter_asks()]
+        _sort_sides(bids, asks)
+        return OrderBook.model_construct(bids=bids, asks=asks)
+
+    @property
+    def mid(self) -> Optional[Decimal]:
+        if not self.bid_prices or not self.ask_prices:
+            return None
+        return decode(self.bid_prices[0] + self.ask_prices[0], self.price_scale) / 2
+
+    @property
+    def spread(self) -> Optional[Decimal]:
+        """Best ask minus best bid, computed in column units and decoded once."""
+        if not self.bid_prices or not self.ask_prices:
+            return None
+        return decode(self.ask_prices[0] - self.bid_prices[0], self.price_scale)
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Zero-copy NumPy views of the four columns (requires numpy)."""
+        return {
+            "bid_prices": to_numpy(self.bid_prices),
+            "bid_quantities": to_numpy(self.bid_quantities),
+            "ask_prices": to_numpy(self.ask_prices),
+            "ask_quantities": to_numpy(self.ask_quantities),
+        }
+
+    def iter_bids(self) -> Iterator[tuple[Decimal, Decimal]]:
+        for price, quantity in zip(self.bid_prices, self.bid_quantities):
+            yield decode(price, self.price_scale), decode(quantity, self.quantity_scale)
+
+    def iter_asks(self) -> Iterator[tuple[Decimal, Decimal]]:
+        for price, quantity in zip(self.ask_prices, self.ask_quantities):
+            yield decode(price, self.price_scale), decode(quantity, self.quantity_scale)
+
+    def __len__(self) -> int:
+        return len(self.bid_prices) + len(self.ask_prices)
+
+    def __repr__(self) -> str:
+        return f"ColumnarOrderBook(bids={len(self.bid_prices)}, asks={len(self.ask_prices)}, scaled={self.scaled})"
+
+
+class _RawFloatOrderBook(TypedDict):
+    bids: List[tuple[float, float]]
+    asks: List[tuple[float, float]]
+
+
+class _RawStrOrderBook(TypedDict):
+    __pydantic_config__ = ConfigDict(coerce_numbers_to_str=True)  # type: ignore[misc]
+
+    bids: List[tuple[str, str]]
+    asks: List[tuple[str, str]]
+
+
+# Plain string members of the response (e.g. ``"status": "ok"``) are accepted and skipped.
+_raw_float_order_books_T = TypeAdapter(
+    dict[str, Annotated[Union[_RawFloatOrderBook, str], Field(union_mode="left_to_right")]]
+)
+_raw_str_order_books_T = TypeAdapter(
+    dict[str, Annotated[Union[_RawStrOrderBook, str], Field(union_mode="left_to_right")]]
+)
+
+
+def iter_all_order_books(
+    data: Union[str, bytes], price_scale: Optional[int] = None, quantity_scale: Optional[int] = None
+) -> Iterator[tuple[str, ColumnarOrderBook]]:
+    """
+    Decode a ``/v3/orderbook/all`` response in one pydantic-core pass and yield ``(symbol, book)`` pairs.
+
+    Levels are validated as plain tuples without the per-level ``OrderBookEntry.parse_list`` callback and
+    stored straight into a ``ColumnarOrderBook`` (float64, or scaled integers when scales are given).
+    """
+    if price_scale is None and quantity_scale is None:
+        for symbol, raw in _raw_float_order_books_T.validate_json(data).items():
+            if not isinstance(raw, dict):
+                continue
+            book = ColumnarOrderBook()
+            bids, asks = raw["bids"], raw["asks"]
+            book.bid_prices.extend([level[0] for level in bids])
+            book.bid_quantities.extend([level[1] for level in bids])
+            book.ask_prices.extend([level[0] for level in asks])
+            book.ask_quantities.extend([level[1] for level in asks])
+            yield symbol, book
+    else:
+        for symbol, raw_str in _raw_str_order_books_T.validate_json(data).items():
+            if isinstance(raw_str, dict):
+                yield symbol, ColumnarOrderBook.from_lists(
+                    raw_str["bids"], raw_str["asks"], price_scale, quantity_scale
+                )
+
+
+def decode_all_order_books(
+    data: Union[str, bytes], price_scale: Optional[int] = None, quantity_scale: Optional[int] = None
+) -> dict[str, ColumnarOrderBook]:
+    """Bulk counterpart of ``all_order_books_T.validate_json`` returning columnar books."""
+    return dict(iter_all_order_books(data, price_scale, quantity_scale))
@@ -0,0 +1,58 @@
+"""
+Process-wide registry of market symbols and the compact trade side.
+
+Every market symbol seen is interned once (``sys.intern``) and given a small integer id, so trades share one
+string object per market and can be grouped by integer comparison. ``TradeSide`` is a ``str`` enum: members are
+singletons that still compare equal to ``"buy"`` / ``"sell"``.
+
+"""
+import sys
+from enum import Enum
+from threading import Lock
+from typing import Dict, List
+
+_lock = Lock()
+_market_ids: Dict[str, int] = {}
+_markets: List[str] = []
+
+
+def intern_market(symbol: str) -> str:
+    """Return the shared instance of ``symbol``, registering it on first use."""
+    if symbol in _market_ids:
+        return _markets[_market_ids[symbol]]
+    with _lock:
+        if symbol not in _market_ids:
+            symbol = sys.intern(symbol)
+            # Append before publishing the id: the lock-free fast path above may read it at any time.
+            _markets.append(symbol)
+            _market_ids[symbol] = len(_markets) - 1
+        return _markets[_market_ids[symbol]]
+
+
+def market_id(symbol: str) -> int:
+    """Small integer id of ``symbol`` (registered on first use)."""
+    result = _market_ids.get(symbol)
+    if result is None:
+        result = _market_ids[intern_market(symbol)]
+    return result
+
+
+def market_symbol(market_id: int) -> str:
+    """Symbol registered under ``market_id``; raises ``IndexError`` for unknown ids."""
+    if market_id < 0:
+        raise IndexError(f"Unknown market id {market_id}")
+    return _markets[market_id]
+
+
+class TradeSide(str, Enum):
+    """Taker side of a trade; ``sign`` is +1 for buys and -1 for sells."""
+
+    BUY = "buy"
+    SELL = "sell"
+
+    @property
+    def sign(self) -> int:
+        return 1 if self is TradeSide.BUY else -1
+
+    def __str__(self) -> str:
+        return self.value
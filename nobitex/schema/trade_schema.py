@@ -1,28 +1,225 @@
-from decimal import Decimal
-from typing import List, Any, Literal, Dict
-from datetime import datetime
+from array import array
+from decimal import ROUND_HALF_EVEN, Decimal
+from functools import cached_property
+from typing import List, Any, Literal, Dict, NamedTuple, Optional, Tuple, Union, Iterable
+from datetime import datetime, timedelta, timezone
 
-from pydantic import BaseModel, Field, TypeAdapter, field_validator, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, ValidationInfo, field_validator, model_validator, ConfigDict
+from typing_extensions import TypedDict
+
+from nobitex.schema.numeric import MarketScale, append_columns, decode, encode, market_scale, new_column, to_numpy
+from nobitex.schema.symbols import TradeSide, intern_market, market_id
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MILLISECOND = timedelta(milliseconds=1)
+
+
+def parse_epoch_ms(value: Any) -> int:
+    """Convert an epoch (seconds or milliseconds), ISO-8601 string or ``datetime`` to epoch milliseconds."""
+    if isinstance(value, str) and not value.lstrip("-").isdigit():
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if isinstance(value, datetime):
+        moment: datetime = value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+        return (moment - _EPOCH) // _MILLISECOND
+    epoch = int(value)
+    # Anything below 10^11 cannot be a millisecond timestamp after 1973, so it is taken as seconds.
+    return epoch * 1000 if abs(epoch) < 10**11 else epoch
+
+
+def _api_row_fields(row: Dict[str, Any], market: Optional[str]) -> Dict[str, Any]:
+    """Rename the keys of a public trades endpoint row to ``TradeEntry`` fields, leaving out missing values."""
+    fields = {
+        "market": row.get("market") or market,
+        "price": row.get("price"),
+        "amount": row.get("volume"),
+        "total": row.get("total"),
+        "type": row.get("type"),
+        "timestamp": row["time"] if "time" in row else row.get("timestamp"),
+    }
+    return {name: value for name, value in fields.items() if value is not None}
+
+
+class ScaledTrade(NamedTuple):
+    """``TradeEntry`` with fixed-point integer numbers; ``total`` is rounded half-even to ``scale.price`` places."""
+
+    market: str
+    price: int
+    amount: int
+    total: int
+    type: TradeSide
+    timestamp: int
 
 class TradeEntry(BaseModel):
 
-    market: str = Field(..., description="Trading Pair Market")
+    market: str = Field(..., description="Trading Pair Market (interned, see nobitex.schema.symbols)")
     price: Decimal = Field(..., description="Trade Price")
     amount: Decimal = Field(..., description="Trade Amount")
-    total: Decimal = Field(..., description="Total Value (price * amount)")
-    type: Literal['buy', 'sell'] = Field(..., description="Trade Type")
-    timestamp: str = Field(..., description="Trade Timestamp")
+    total: Decimal = Field(Decimal(0), description="Total Value (price * amount, computed when missing)")
+    type: TradeSide = Field(..., description="Trade Type (compares equal to 'buy' / 'sell')")
+    timestamp: int = Field(..., description="Trade Timestamp (epoch milliseconds)")
+
+    @model_validator(mode='before')
+    @classmethod
+    def parse_api_row(cls, data: Any, info: ValidationInfo) -> Any:
+        """
+        Accept the public trades endpoint rows (``time``, ``price``, ``volume``, ``type``).
+
+        The market comes from the validation context (``context={"market": symbol}``). Only keys are renamed here;
+        missing or malformed values are reported by field validation.
+        """
+        if isinstance(data, dict) and "volume" in data and "amount" not in data:
+            data = _api_row_fields(data, (info.context or {}).get("market"))
+        return data
+
+    @model_validator(mode='after')
+    def compute_total(self) -> 'TradeEntry':
+        if "total" not in self.model_fields_set:
+            self.total = self.price * self.amount
+        return self
+
+    @field_validator('market')
+    @classmethod
+    def validate_market(cls, v: str) -> str:
+        return intern_market(v)
 
     @field_validator('timestamp', mode='before')
     @classmethod
-    def validate_timestamp(cls, v: Any) -> str:
-        if isinstance(v, datetime):
-            return v.isoformat()
-        return str(v)
+    def validate_timestamp(cls, v: Any) -> int:
+        return parse_epoch_ms(v)
+
+    @cached_property
+    def time(self) -> datetime:
+        """Trade time as an aware UTC ``datetime``, computed on first access."""
+        return _EPOCH + self.timestamp * _MILLISECOND
+
+    @cached_property
+    def iso_timestamp(self) -> str:
+        return self.time.isoformat()
+
+    @property
+    def market_id(self) -> int:
+        return market_id(self.market)
+
+    def to_scaled(self, scale: Optional[MarketScale] = None) -> ScaledTrade:
+        """Convert to fixed-point integers using ``scale`` or the registered scale of the market."""
+        scale = scale or market_scale(self.market)
+        return ScaledTrade(
+            self.market,
+            int(encode(self.price, scale.price)),
+            int(encode(self.amount, scale.amount)),
+            int(encode(self.total, scale.price, ROUND_HALF_EVEN)),
+            self.type,
+            self.timestamp,
+        )
+
+    @classmethod
+    def from_scaled(cls, trade: ScaledTrade, scale: Optional[MarketScale] = None) -> "TradeEntry":
+        scale = scale or market_scale(trade.market)
+        return cls.model_construct(
+            market=trade.market,
+            price=decode(trade.price, scale.price),
+            amount=decode(trade.amount, scale.amount),
+            total=decode(trade.total, scale.price),
+            type=trade.type,
+            timestamp=trade.timestamp,
+        )
     
 class NubitexTrades(BaseModel):
 
     trades: List[TradeEntry] = Field(..., description="List of Trade Entries")
     status: str = Field(..., description="Response Status")
 
-all_trades_T = TypeAdapter(Dict[str, NubitexTrades])
\ No newline at end of file
+all_trades_T = TypeAdapter(Dict[str, NubitexTrades])
+
+
+class _RawFloatTrade(TypedDict):
+    price: float
+    amount: float
+    total: float
+    type: Literal['buy', 'sell']
+    timestamp: Union[int, str]
+
+
+class _RawFloatTrades(TypedDict):
+    trades: List[_RawFloatTrade]
+
+
+_raw_float_trades_T = TypeAdapter(Dict[str, _RawFloatTrades])
+
+
+class TradeColumns:
+    """
+    Trades of one market stored column-wise: epoch-ms timestamps, price, amount, total and side (+1 buy, -1 sell).
+
+    Numbers are float64, or fixed-point int64 when a ``MarketScale`` is given (``total`` is then rounded half-even
+    to ``scale.price`` places, the precision of the quote currency, so it fits in int64).
+    """
+
+    __slots__ = ("timestamps", "prices", "amounts", "totals", "sides", "scale")
+
+    def __init__(self, scale: Optional[MarketScale] = None) -> None:
+        self.scale = scale
+        self.timestamps = new_column(0)
+        self.prices = new_column(None if scale is None else scale.price)
+        self.amounts = new_column(None if scale is None else scale.amount)
+        self.totals = new_column(None if scale is None else scale.price)
+        self.sides = array("b")
+
+    @classmethod
+    def from_trades(cls, trades: Iterable["TradeEntry"], scale: Optional[MarketScale] = None) -> "TradeColumns":
+        columns = cls(scale)
+        for trade in trades:
+            columns.append(trade)
+        return columns
+
+    def append(self, trade: "TradeEntry") -> None:
+        """Append one trade to all columns or none; raises ``BufferError`` while a column view is alive."""
+        scale = self.scale
+        append_columns(self.columns(), (
+            trade.timestamp,
+            encode(trade.price, None if scale is None else scale.price),
+            encode(trade.amount, None if scale is None else scale.amount),
+            encode(trade.total, None if scale is None else scale.price, ROUND_HALF_EVEN),
+            1 if trade.type == TradeSide.BUY else -1,
+        ))
+
+    def columns(self) -> Tuple["array[Any]", ...]:
+        """``(timestamps, prices, amounts, totals, sides)``."""
+        return self.timestamps, self.prices, self.amounts, self.totals, self.sides
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Zero-copy NumPy views of the columns (requires numpy)."""
+        return {
+            "timestamp": to_numpy(self.timestamps),
+            "price": to_numpy(self.prices),
+            "amount": to_numpy(self.amounts),
+            "total": to_numpy(self.totals),
+            "side": to_numpy(self.sides),
+        }
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __repr__(self) -> str:
+        return f"TradeColumns(trades={len(self)}, scaled={self.scale is not None})"
+
+
+def decode_all_trades(data: Union[str, bytes]) -> Dict[str, TradeColumns]:
+    """
+    Float64 analytics counterpart of ``all_trades_T.validate_json``.
+
+    Numbers are decoded straight to float64 by pydantic-core and stored in ``TradeColumns`` without building
+    ``TradeEntry`` objects.
+    """
+    result = {}
+    for market, raw in _raw_float_trades_T.validate_json(data).items():
+        trades = raw["trades"]
+        columns = TradeColumns()
+        columns.timestamps.extend([parse_epoch_ms(trade["timestamp"]) for trade in trades])
+        columns.prices.extend([trade["price"] for trade in trades])
+        columns.amounts.extend([trade["amount"] for trade in trades])
+        columns.totals.extend([trade["total"] for trade in trades])
+        columns.sides.extend([1 if trade["type"] == 'buy' else -1 for trade in trades])
+        result[market] = columns
+    return result
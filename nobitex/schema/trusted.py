@@ -0,0 +1,233 @@
+"""
+Trusted-input construction of schema models.
+
+Payloads that were already validated once (e.g. replayed recordings) can skip pydantic validation: JSON is parsed
+with ``pydantic_core.from_json`` and models are built directly, the same way ``model_construct`` does, with the
+list-to-field mapping done in bulk. Trusted mode is selected per call with ``trusted=True`` or process-wide with
+``set_trusted_input(True)``; the ``load_*`` functions fall back to regular validation otherwise.
+
+"""
+import gc
+from contextlib import contextmanager
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic_core import from_json
+
+from nobitex.schema.ohcl_schema import OHCL, OHCLEntry, epoch_ms_factor, parse_udf_history
+from nobitex.schema.orderbook import OrderBook, OrderBookEntry, _sort_sides, all_order_books_T
+from nobitex.schema.symbols import TradeSide, intern_market
+from nobitex.schema.trade_schema import NubitexTrades, TradeEntry, _api_row_fields, all_trades_T, parse_epoch_ms
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_trusted_input = False
+_new = object.__new__
+_set = object.__setattr__
+_ZERO = Decimal(0)
+
+
+def set_trusted_input(enabled: bool) -> None:
+    """Make ``load_*`` skip validation by default (``trusted=None``)."""
+    global _trusted_input
+    _trusted_input = enabled
+
+
+def trusted_input_enabled() -> bool:
+    return _trusted_input
+
+
+def _construct(cls: Type[ModelT], fields: Dict[str, Any]) -> ModelT:
+    # Equivalent to ``cls.model_construct(**fields)`` for models with no defaults, aliases or private attributes.
+    model = _new(cls)
+    _set(model, "__dict__", fields)
+    _set(model, "__pydantic_fields_set__", set(fields))
+    _set(model, "__pydantic_extra__", None)
+    _set(model, "__pydantic_private__", None)
+    return model
+
+
+def _parse(data: Union[str, bytes, Any]) -> Any:
+    return from_json(data) if isinstance(data, (str, bytes)) else data
+
+
+@contextmanager
+def _paused_gc() -> Iterator[None]:
+    # Bulk construction only allocates acyclic objects; cyclic GC passes over them are pure overhead.
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class _Builder:
+    """Builds models for one payload, sharing ``Decimal`` instances for repeated number strings."""
+
+    __slots__ = ("_decimals",)
+
+    def __init__(self) -> None:
+        self._decimals: Dict[Tuple[type, Any], Decimal] = {}
+
+    def decimal(self, value: Any) -> Decimal:
+        # Keyed by type too: 1 and 1.0 hash equal but validate to Decimal('1') and Decimal('1.0').
+        key = (type(value), value)
+        result = self._decimals.get(key)
+        if result is None:
+            result = self._decimals[key] = Decimal(repr(value)) if type(value) is float else Decimal(value)
+        return result
+
+    def _entries(self, levels: List[Any]) -> List[OrderBookEntry]:
+        decimal = self.decimal
+        return [
+            (
+                _construct(OrderBookEntry, {"price": decimal(level[0]), "quantity": decimal(level[1])})
+                if isinstance(level, (list, tuple))
+                else _construct(
+                    OrderBookEntry, {"price": decimal(level["price"]), "quantity": decimal(level["quantity"])}
+                )
+            )
+            for level in levels
+        ]
+
+    def order_book(self, data: Any) -> OrderBook:
+        bids, asks = self._entries(data["bids"]), self._entries(data["asks"])
+        _sort_sides(bids, asks)
+        return _construct(OrderBook, {"bids": bids, "asks": asks})
+
+    def trade(self, row: Any, market: Optional[str] = None) -> TradeEntry:
+        """Mirrors ``TradeEntry`` validation, including endpoint rows (``time``, ``volume``) and computed totals."""
+        if "volume" in row and "amount" not in row:
+            row = _api_row_fields(row, market)
+        decimal = self.decimal
+        price, amount, total = decimal(row["price"]), decimal(row["amount"]), row.get("total")
+        return _construct(
+            TradeEntry,
+            {
+                "market": intern_market(row["market"]),
+                "price": price,
+                "amount": amount,
+                "total": price * amount if total is None else decimal(total),
+                "type": TradeSide(row["type"]),
+                "timestamp": parse_epoch_ms(row["timestamp"]),
+            },
+        )
+
+    def trades(self, data: Any, market: Optional[str] = None) -> NubitexTrades:
+        trades = [self.trade(row, market) for row in data["trades"]]
+        return _construct(NubitexTrades, {"trades": trades, "status": data["status"]})
+
+    def candle(self, row: Any) -> OHCLEntry:
+        decimal = self.decimal
+        if isinstance(row, (list, tuple)):
+            return _construct(
+                OHCLEntry,
+                {
+                    "timestamp": int(row[0]),
+                    "open": decimal(row[1]),
+                    "high": decimal(row[2]),
+                    "low": decimal(row[3]),
+                    "close": decimal(row[4]),
+                    "volume": decimal(row[5]) if len(row) > 5 else _ZERO,
+                },
+            )
+        return _construct(
+            OHCLEntry,
+            {
+                "timestamp": int(row["timestamp"]),
+                "open": decimal(row["open"]),
+                "high": decimal(row["high"]),
+                "low": decimal(row["low"]),
+                "close": decimal(row["close"]),
+                "volume": decimal(row["volume"]),
+            },
+        )
+
+    def ohlc(self, data: Any) -> OHCL:
+        """Mirrors ``OHCL.parse_rows``: a ``{"values": [...]}`` payload, a bare row list or a UDF history response."""
+        if isinstance(data, (list, tuple)):
+            rows = data
+        elif "s" in data and "values" not in data:
+            rows = parse_udf_history(data)
+        else:
+            rows = data["values"]
+        values = [self.candle(row) for row in rows]
+        if values and epoch_ms_factor([values[0].timestamp, values[-1].timestamp]) != 1:
+            for entry in values:
+                entry.__dict__["timestamp"] *= 1000
+        return _construct(OHCL, {"values": values})
+
+
+def construct_order_book(data: Any) -> OrderBook:
+    """Build an ``OrderBook`` from an already-validated payload without validation."""
+    with _paused_gc():
+        return _Builder().order_book(_parse(data))
+
+
+def construct_trades(data: Any, market: Optional[str] = None) -> NubitexTrades:
+    """
+    Build ``NubitexTrades`` from an already-validated payload without validation.
+
+    ``market`` is used for endpoint rows without one, like ``context={"market": ...}`` in validation.
+    """
+    with _paused_gc():
+        return _Builder().trades(_parse(data), market)
+
+
+def construct_ohlc(data: Any) -> OHCL:
+    """Build ``OHCL`` from an already-validated payload without validation."""
+    with _paused_gc():
+        return _Builder().ohlc(_parse(data))
+
+
+def _is_trusted(trusted: Optional[bool]) -> bool:
+    return _trusted_input if trusted is None else trusted
+
+
+def load_order_book(data: Any, trusted: Optional[bool] = None) -> OrderBook:
+    if _is_trusted(trusted):
+        return construct_order_book(data)
+    if isinstance(data, (str, bytes)):
+        return OrderBook.model_validate_json(data)
+    return OrderBook.model_validate(data)
+
+
+def load_all_order_books(data: Any, trusted: Optional[bool] = None) -> Dict[str, OrderBook]:
+    if _is_trusted(trusted):
+        with _paused_gc():
+            builder = _Builder()
+            return {symbol: builder.order_book(book) for symbol, book in _parse(data).items()}
+    if isinstance(data, (str, bytes)):
+        return all_order_books_T.validate_json(data)
+    return all_order_books_T.validate_python(data)
+
+
+def load_trades(data: Any, trusted: Optional[bool] = None, market: Optional[str] = None) -> NubitexTrades:
+    """Trades of one market; ``market`` fills in the market of ``/v2/trades`` endpoint rows."""
+    if _is_trusted(trusted):
+        return construct_trades(data, market)
+    context = {"market": market}
+    if isinstance(data, (str, bytes)):
+        return NubitexTrades.model_validate_json(data, context=context)
+    return NubitexTrades.model_validate(data, context=context)
+
+
+def load_all_trades(data: Any, trusted: Optional[bool] = None) -> Dict[str, NubitexTrades]:
+    if _is_trusted(trusted):
+        with _paused_gc():
+            builder = _Builder()
+            return {market: builder.trades(trades) for market, trades in _parse(data).items()}
+    if isinstance(data, (str, bytes)):
+        return all_trades_T.validate_json(data)
+    return all_trades_T.validate_python(data)
+
+
+def load_ohlc(data: Any, trusted: Optional[bool] = None) -> OHCL:
+    if _is_trusted(trusted):
+        return construct_ohlc(data)
+    if isinstance(data, (str, bytes)):
+        return OHCL.model_validate_json(data)
+    return OHCL.model_validate(data)
@@ -0,0 +1,51 @@
+import json
+
+import httpx
+from pytest import fixture
+
+ORDER_BOOK = {
+    "status": "ok",
+    "lastUpdate": 1700000000000,
+    "lastTradePrice": "101",
+    "asks": [["101", "0.5"], ["102", "2"]],
+    "bids": [["100", "1"], ["99", "3"]],
+}
+TRADES = {
+    "status": "ok",
+    "trades": [
+        {"time": 1700000001000, "price": "101", "volume": "0.25", "type": "buy"},
+        {"time": 1700000000000, "price": "100", "volume": "1.5", "type": "sell"},
+    ],
+}
+UDF_HISTORY = {
+    "s": "ok",
+    "t": [1700000000, 1700000060],
+    "o": [100, 101],
+    "h": [102, 103],
+    "l": [99, 100],
+    "c": [101, 102],
+    "v": [1.5, 2],
+}
+
+
+class FakeNobitex:
+    """Routes httpx requests to canned Nobitex responses and records every request received."""
+
+    def __init__(self):
+        self.requests = []
+        self.responses = {
+            "/v3/orderbook/BTCIRT": (200, ORDER_BOOK),
+            "/v3/orderbook/all": (200, {"status": "ok", "BTCIRT": ORDER_BOOK, "ETHIRT": ORDER_BOOK}),
+            "/v2/trades/BTCIRT": (200, TRADES),
+            "/market/udf/history": (200, UDF_HISTORY),
+        }
+
+    def __call__(self, request):
+        self.requests.append(request)
+        status, body = self.responses.get(request.url.path, (404, {"status": "failed", "message": "Not found"}))
+        return httpx.Response(status, content=body if isinstance(body, bytes) else json.dumps(body).encode())
+
+
+@fixture
+def fake_api():
+    return FakeNobitex()
@@ -0,0 +1,111 @@
+import asyncio
+from decimal import Decimal
+
+import httpx
+from pydantic import ValidationError
+from pytest import raises
+
+from nobitex.client import AsyncNobitexClient, NobitexAPIError
+from nobitex.schema.ohcl_schema import OHCL
+from nobitex.schema.orderbook import OrderBook
+
+
+def run(fake_api, call, **kwargs):
+    async def main():
+        async with AsyncNobitexClient(transport=httpx.MockTransport(fake_api), **kwargs) as client:
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncNobitexClient:
+    def test_order_book(self, fake_api):
+        book = run(fake_api, lambda client: client.order_book("BTCIRT"))
+
+        assert isinstance(book, OrderBook)
+        assert book.best_bid.price == Decimal("100")
+        assert book.spread == Decimal("1")
+        assert fake_api.requests[0].url == "https://api.nobitex.ir/v3/orderbook/BTCIRT"
+        assert fake_api.requests[0].headers["User-Agent"].startswith("TraderBot/")
+
+    def test_all_order_books(self, fake_api):
+        """Test the top-level status member is dropped from the all-books response."""
+        books = run(fake_api, lambda client: client.all_order_books())
+
+        assert sorted(books) == ["BTCIRT", "ETHIRT"]
+        assert books["ETHIRT"].best_ask.price == Decimal("101")
+
+    def test_trades(self, fake_api):
+        """Test API trade rows (time/volume) become TradeEntry with the requested market and computed total."""
+        trades = run(fake_api, lambda client: client.trades("BTCIRT"))
+
+        assert trades.status == "ok"
+        assert [trade.market for trade in trades.trades] == ["BTCIRT", "BTCIRT"]
+        assert trades.trades[0].amount == Decimal("0.25")
+        assert trades.trades[0].total == Decimal("25.25")
+        assert trades.trades[1].timestamp == 1700000000000
+
+    def test_ohlc(self, fake_api):
+        ohlc = run(fake_api, lambda client: client.ohlc("BTCIRT", "1", 1700000000, "2023-11-14T22:14:20Z"))
+
+        assert isinstance(ohlc, OHCL)
+        assert [entry.timestamp for entry in ohlc.values] == [1700000000000, 1700000060000]
+        assert ohlc.values[1].volume == 2
+        assert dict(fake_api.requests[0].url.params) == {
+            "symbol": "BTCIRT",
+            "resolution": "1",
+            "from": "1700000000",
+            "to": "1700000060",
+        }
+
+    def test_ohlc_no_data(self, fake_api):
+        fake_api.responses["/market/udf/history"] = (200, {"s": "no_data"})
+
+        assert run(fake_api, lambda client: client.ohlc("BTCIRT", "D", 0, 1, countback=5)).values == []
+        assert fake_api.requests[0].url.params["countback"] == "5"
+
+    def test_api_errors(self, fake_api):
+        """Test HTTP errors and failed statuses raise NobitexAPIError with the API message."""
+        with raises(NobitexAPIError, match="Not found") as error:
+            run(fake_api, lambda client: client.order_book("XYZIRT"))
+        assert error.value.status_code == 404
+
+        fake_api.responses["/v2/trades/BTCIRT"] = (200, {"status": "failed", "code": "InvalidSymbol"})
+        with raises(NobitexAPIError, match="InvalidSymbol"):
+            run(fake_api, lambda client: client.trades("BTCIRT"))
+
+        fake_api.responses["/market/udf/history"] = (200, {"s": "error", "errmsg": "Bad resolution"})
+        with raises(NobitexAPIError, match="Bad resolution"):
+            run(fake_api, lambda client: client.ohlc("BTCIRT", "7", 0, 1))
+
+        fake_api.responses["/v2/trades/BTCIRT"] = (200, {"status": "ok", "trades": [{"time": 1, "volume": "1"}]})
+        with raises(ValidationError):
+            run(fake_api, lambda client: client.trades("BTCIRT"))
+
+        fake_api.responses["/v3/orderbook/all"] = (502, b"<html>Bad Gateway</html>")
+        with raises(NobitexAPIError, match="HTTP 502"):
+            run(fake_api, lambda client: client.all_order_books())
+
+    def test_unexpected_payload(self, fake_api):
+        """Test validation errors of successful responses are not masked."""
+        fake_api.responses["/v3/orderbook/BTCIRT"] = (200, {"status": "ok"})
+        with raises(ValueError):
+            run(fake_api, lambda client: client.order_book("BTCIRT"))
+
+        fake_api.responses["/v3/orderbook/BTCIRT"] = (200, [])
+        with raises(ValueError):
+            run(fake_api, lambda client: client.order_book("BTCIRT"))
+
+    def test_connection_reuse(self, fake_api):
+        """Test consecutive calls go through the same pooled httpx client."""
+        async def main():
+            client = AsyncNobitexClient(transport=httpx.MockTransport(fake_api), limits=httpx.Limits(max_connections=1))
+            http = client._http
+            await client.order_book("BTCIRT")
+            await client.trades("BTCIRT")
+            assert client._http is http and not http.is_closed
+            await client.aclose()
+            return http.is_closed
+
+        assert asyncio.run(main())
+        assert len(fake_api.requests) == 2
@@ -0,0 +1,126 @@
+import asyncio
+
+import httpx
+from pytest import fixture, mark, raises
+
+from nobitex.client import AsyncNobitexClient, NobitexClient, RateLimiter, ResponseCache
+from nobitex.client._core import ohlc_request, order_book_request, trades_request
+
+
+URL = "https://api.nobitex.ir/"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache:
+    def test_ttl(self):
+        """Test an entry is served until its endpoint TTL has passed."""
+        clock = FakeClock()
+        cache = ResponseCache({"orderbook": 0.5, "udf_history": 30.0}, clock=clock)
+        book, history = order_book_request("BTCIRT"), ohlc_request("BTCIRT", "D", 0, 1)
+        cache.put(URL, book, "book", 10)
+        cache.put(URL, history, "history", 10)
+
+        clock.now += 0.4
+        assert cache.get(URL, book) == "book"
+        assert cache.get(URL, order_book_request("ETHIRT")) is None
+        clock.now += 0.1
+        assert cache.get(URL, book) is None
+        assert cache.get(URL, history) == "history"
+        assert len(cache) == 1 and cache.size == 10
+        assert (cache.hits, cache.misses) == (2, 2)
+
+    def test_uncached_endpoint(self):
+        """Test endpoints without a TTL are neither stored nor looked up."""
+        cache = ResponseCache({"orderbook": 0.5})
+        request = trades_request("BTCIRT")
+        cache.put(URL, request, "trades", 10)
+
+        assert cache.get(URL, request) is None
+        assert len(cache) == 0 and cache.misses == 0
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted to stay within max_bytes."""
+        cache = ResponseCache(max_bytes=100)
+        requests = [order_book_request(symbol) for symbol in ("BTCIRT", "ETHIRT", "USDTIRT")]
+        cache.put(URL, requests[0], 0, 40)
+        cache.put(URL, requests[1], 1, 40)
+        cache.get(URL, requests[0])
+        cache.put(URL, requests[2], 2, 40)
+
+        assert [cache.get(URL, request) for request in requests] == [0, None, 2]
+        assert cache.size == 80
+
+        cache.put(URL, requests[0], 0, 60)
+        assert cache.size == 100
+        cache.put(URL, requests[1], 1, 101)
+        assert cache.get(URL, requests[1]) is None
+
+    @mark.parametrize("ttls, max_bytes", [({"orderbook": 0}, 100), ({"orderbook": 1}, 0)])
+    def test_invalid(self, ttls, max_bytes):
+        with raises(ValueError):
+            ResponseCache(ttls, max_bytes)
+
+
+@fixture
+def transport(fake_api):
+    return httpx.MockTransport(fake_api)
+
+
+class TestClientCache:
+    def test_sync_client(self, fake_api, transport):
+        """Test fresh responses are served from memory as the same parsed model."""
+        clock = FakeClock()
+        cache = ResponseCache(clock=clock)
+        with NobitexClient(transport=transport, rate_limiter=RateLimiter({}), cache=cache) as client:
+            book = client.order_book("BTCIRT")
+            assert client.order_book("BTCIRT") is book
+            assert len(fake_api.requests) == 1
+
+            clock.now += 1
+            assert client.order_book("BTCIRT") is not book
+            assert len(fake_api.requests) == 2
+
+    def test_errors_not_cached(self, fake_api, transport):
+        cache = ResponseCache()
+        with NobitexClient(transport=transport, rate_limiter=RateLimiter({}), cache=cache) as client:
+            for _ in range(2):
+                with raises(Exception):
+                    client.order_book("XYZIRT")
+
+        assert len(fake_api.requests) == 2
+        assert len(cache) == 0
+
+    def test_base_urls_separate(self, fake_api, transport):
+        """Test clients of different hosts sharing a cache do not serve each other's data."""
+        cache = ResponseCache()
+        with NobitexClient(transport=transport, rate_limiter=RateLimiter({}), cache=cache) as client:
+            book = client.order_book("BTCIRT")
+        with NobitexClient(
+            "https://testnet.nobitex.ir", transport=transport, rate_limiter=RateLimiter({}), cache=cache
+        ) as testnet:
+            assert testnet.order_book("BTCIRT") is not book
+            assert testnet.order_book("BTCIRT") is testnet.order_book("BTCIRT")
+
+        assert [request.url.host for request in fake_api.requests] == ["api.nobitex.ir", "testnet.nobitex.ir"]
+
+    def test_async_client(self, fake_api, transport):
+        """Test a cache shared with the async client serves both."""
+        cache = ResponseCache()
+
+        async def main():
+            async with AsyncNobitexClient(
+                transport=httpx.MockTransport(fake_api), rate_limiter=RateLimiter({}), cache=cache
+            ) as client:
+                return await client.trades("BTCIRT")
+
+        trades = asyncio.run(main())
+        with NobitexClient(transport=transport, rate_limiter=RateLimiter({}), cache=cache) as client:
+            assert client.trades("BTCIRT") is trades
+        assert len(fake_api.requests) == 1
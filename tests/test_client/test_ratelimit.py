@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+
+import httpx
+from pytest import approx, mark, raises
+
+from nobitex.client import AsyncNobitexClient, NobitexClient, RateLimit, RateLimiter, TokenBucket, shared_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_reserve(self):
+        """Test a burst up to capacity is free and further requests wait for their refill."""
+        clock = FakeClock()
+        bucket = TokenBucket(3, 1.5, clock)
+
+        assert [bucket.reserve() for _ in range(3)] == [0, 0, 0]
+        assert bucket.reserve() == approx(0.5)
+        assert bucket.reserve() == approx(1.0)
+        assert bucket.available == 0
+
+        clock.now += 1.25
+        assert bucket.available == approx(0.5)
+        clock.now += 60
+        assert bucket.available == 3
+
+    @mark.parametrize("capacity, period", [(0, 1), (1, 0)])
+    def test_invalid(self, capacity, period):
+        with raises(ValueError):
+            TokenBucket(capacity, period)
+
+    def test_threads(self):
+        """Test concurrent reservations never hand out more than the capacity for free."""
+        bucket = TokenBucket(50, 1000)
+        delays = []
+
+        def worker():
+            for _ in range(20):
+                delays.append(bucket.reserve())
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sum(delay == 0 for delay in delays) == 50
+        assert sorted(delays)[-1] == approx(1000, rel=0.01)
+
+
+class TestRateLimiter:
+    def test_budget(self):
+        clock = FakeClock()
+        limiter = RateLimiter({"trades": RateLimit(2, 60)}, clock)
+
+        assert limiter.reserve("trades") == 0
+        assert limiter.remaining("trades") == 1
+        assert limiter.budget() == {"trades": 1}
+        assert limiter.reserve("orderbook") == 0
+        assert limiter.remaining("orderbook") is None
+
+    def test_acquire_waits(self):
+        limiter = RateLimiter({"trades": RateLimit(1, 0.02)})
+        start = time.monotonic()
+        limiter.acquire("trades")
+        limiter.acquire("trades")
+        asyncio.run(limiter.acquire_async("trades"))
+
+        assert time.monotonic() - start >= 0.035
+
+    def test_shared(self):
+        with NobitexClient() as client:
+            assert client.rate_limiter is shared_rate_limiter() is shared_rate_limiter()
+        assert AsyncNobitexClient().rate_limiter is shared_rate_limiter()
+
+    def test_clients_take_tokens(self, fake_api):
+        """Test each client request takes a token from its endpoint bucket."""
+        limiter = RateLimiter({"orderbook": RateLimit(10, 60), "trades": RateLimit(10, 60)}, FakeClock())
+        with NobitexClient(transport=httpx.MockTransport(fake_api), rate_limiter=limiter) as client:
+            client.order_book("BTCIRT")
+            client.all_order_books()
+
+        async def main():
+            async with AsyncNobitexClient(transport=httpx.MockTransport(fake_api), rate_limiter=limiter) as client:
+                await client.trades("BTCIRT")
+
+        asyncio.run(main())
+        assert limiter.budget() == {"orderbook": 8, "trades": 9}
@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+
+import httpx
+
+from nobitex.client import AsyncNobitexClient, NobitexAPIError, NobitexClient
+from nobitex.client.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def slow(fake_api, delay):
+    async def handler(request):
+        await asyncio.sleep(delay)
+        return fake_api(request)
+
+    return handler
+
+
+class TestAsyncSingleFlight:
+    def test_coalesced_calls(self, fake_api):
+        """Test concurrent identical calls share one request and the same parsed model."""
+        async def main():
+            async with AsyncNobitexClient(transport=httpx.MockTransport(slow(fake_api, 0.05))) as client:
+                books = await asyncio.gather(*(client.order_book("BTCIRT") for _ in range(5)))
+                trades = await asyncio.gather(client.trades("BTCIRT"), client.trades("BTCIRT"))
+                assert len(client._flights) == 0
+                return books, trades
+
+        books, trades = asyncio.run(main())
+
+        assert all(book is books[0] for book in books)
+        assert trades[0] is trades[1]
+        assert [request.url.path for request in fake_api.requests] == ["/v3/orderbook/BTCIRT", "/v2/trades/BTCIRT"]
+
+    def test_distinct_calls(self, fake_api):
+        async def main():
+            async with AsyncNobitexClient(transport=httpx.MockTransport(slow(fake_api, 0.01))) as client:
+                await asyncio.gather(client.ohlc("BTCIRT", "D", 0, 1), client.ohlc("BTCIRT", "D", 0, 2))
+            transport = httpx.MockTransport(slow(fake_api, 0.01))
+            async with AsyncNobitexClient(transport=transport, coalesce=False) as client:
+                await asyncio.gather(client.order_book("BTCIRT"), client.order_book("BTCIRT"))
+
+        asyncio.run(main())
+        assert len(fake_api.requests) == 4
+
+    def test_errors_shared(self, fake_api):
+        async def main():
+            async with AsyncNobitexClient(transport=httpx.MockTransport(slow(fake_api, 0.01))) as client:
+                return await asyncio.gather(*(client.order_book("XYZIRT") for _ in range(3)), return_exceptions=True)
+
+        errors = asyncio.run(main())
+
+        assert all(isinstance(error, NobitexAPIError) for error in errors)
+        assert len(fake_api.requests) == 1
+
+    def test_cancellation(self):
+        """Test cancelling the leader or a waiter leaves the shared call running for the other callers."""
+        async def main():
+            flights = AsyncSingleFlight()
+
+            async def work():
+                await asyncio.sleep(0.02)
+                return "done"
+
+            leader = asyncio.ensure_future(flights.do("key", work))
+            waiter = asyncio.ensure_future(flights.do("key", work))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            assert await leader == "done"
+
+            leader = asyncio.ensure_future(flights.do("key", work))
+            waiter = asyncio.ensure_future(flights.do("key", work))
+            await asyncio.sleep(0)
+            leader.cancel()
+            assert await waiter == "done"
+            assert leader.cancelled() and not waiter.cancelled()
+            assert len(flights) == 0
+
+        asyncio.run(main())
+
+
+class TestSingleFlight:
+    def test_threads(self, fake_api):
+        """Test threads asking for the same book at once share one request and one result."""
+        def handler(request):
+            time.sleep(0.2)
+            return fake_api(request)
+
+        results = []
+        with NobitexClient(transport=httpx.MockTransport(handler)) as client:
+            threads = [threading.Thread(target=lambda: results.append(client.order_book("BTCIRT"))) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(results) == 4
+        assert all(result is results[0] for result in results)
+        assert len(fake_api.requests) == 1
+
+    def test_disabled(self, fake_api):
+        with NobitexClient(transport=httpx.MockTransport(fake_api), coalesce=False) as client:
+            assert client.order_book("BTCIRT") is not client.order_book("BTCIRT")
+
+    def test_errors(self):
+        flights = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+        errors = []
+
+        def fail():
+            started.set()
+            release.wait()
+            raise RuntimeError("boom")
+
+        def call():
+            try:
+                flights.do("key", fail)
+            except RuntimeError as error:
+                errors.append(error)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        time.sleep(0.05)
+        release.set()
+        leader.join()
+        follower.join()
+
+        assert len(errors) == 2 and errors[0] is errors[1]
+        assert len(flights) == 0
+        assert flights.do("key", lambda: 1) == 1
@@ -0,0 +1,41 @@
+import asyncio
+
+import httpx
+from pytest import raises
+
+from nobitex.client import AsyncNobitexClient, NobitexAPIError, NobitexClient
+
+
+class TestNobitexClient:
+    def test_market_data(self, fake_api):
+        with NobitexClient(transport=httpx.MockTransport(fake_api)) as client:
+            book = client.order_book("BTCIRT")
+            books = client.all_order_books()
+            trades = client.trades("BTCIRT")
+            ohlc = client.ohlc("BTCIRT", "1", 1700000000, 1700000060)
+
+        assert book.best_ask.price == 101
+        assert sorted(books) == ["BTCIRT", "ETHIRT"]
+        assert trades.trades[0].market == "BTCIRT"
+        assert len(ohlc.values) == 2
+        assert client._http.is_closed
+
+    def test_api_error(self, fake_api):
+        with NobitexClient(transport=httpx.MockTransport(fake_api)) as client:
+            with raises(NobitexAPIError):
+                client.order_book("XYZIRT")
+
+    def test_same_as_async(self, fake_api):
+        """Test both clients send identical requests and return equal models."""
+        with NobitexClient(transport=httpx.MockTransport(fake_api)) as client:
+            sync_results = [client.order_book("BTCIRT"), client.trades("BTCIRT"), client.ohlc("BTCIRT", "D", 0, 1)]
+        sync_requests = [(request.url, request.headers["User-Agent"]) for request in fake_api.requests]
+        fake_api.requests.clear()
+
+        async def main():
+            async with AsyncNobitexClient(transport=httpx.MockTransport(fake_api)) as client:
+                return [await client.order_book("BTCIRT"), await client.trades("BTCIRT"),
+                        await client.ohlc("BTCIRT", "D", 0, 1)]
+
+        assert asyncio.run(main()) == sync_results
+        assert [(request.url, request.headers["User-Agent"]) for request in fake_api.requests] == sync_requests
@@ -0,0 +1,69 @@
+from decimal import Decimal
+
+from nobitex.market.candles import CandleBuilder, ClosedCandle
+from nobitex.market.resample import DAY, HOUR, MINUTE, TEHRAN
+from nobitex.schema.ohcl_schema import OHCLEntry
+from nobitex.schema.trade_schema import TradeEntry
+
+T0 = 28_333_335 * MINUTE  # 2023-11-14T22:15:00Z, aligned to 5 minutes
+
+
+def trade(offset, price, amount="1", market="BTCIRT"):
+    total = Decimal(price) * Decimal(amount)
+    return TradeEntry(market=market, price=price, amount=amount, total=total, type="buy", timestamp=T0 + offset)
+
+
+class TestCandleBuilder:
+    def test_bars(self):
+        """Test trades build OHLCV bars that are emitted once a later bucket starts."""
+        builder = CandleBuilder(["1m", "5m"])
+        closed = builder.update([trade(1000, "10"), trade(2000, "12", "2"), trade(3000, "9"), trade(4000, "11", "0.5")])
+        bar = OHCLEntry(timestamp=T0, open=10, high=12, low=9, close=11, volume="4.5")
+
+        assert closed == []
+        assert builder.open_bar("BTCIRT", "1m") == bar
+
+        assert builder.add(trade(MINUTE + 1, "13")) == [ClosedCandle("BTCIRT", MINUTE, bar)]
+        assert builder.open_bar("BTCIRT", "5m").close == 13
+        assert builder.open_bar("BTCIRT", "5m").volume == Decimal("5.5")
+
+    def test_markets_are_separate(self):
+        builder = CandleBuilder()
+        builder.update([trade(0, "10"), trade(0, "2", market="ETHIRT")])
+
+        assert builder.open_bar("BTCIRT", "1m").open == 10
+        assert builder.open_bar("ETHIRT", "1m").open == 2
+        assert builder.open_bar("USDTIRT", "1m") is None
+
+    def test_iso_timestamps(self):
+        builder = CandleBuilder()
+        timestamp = "2023-11-14T22:16:30Z"
+        builder.add(TradeEntry(market="BTCIRT", price=1, amount=1, total=1, type="sell", timestamp=timestamp))
+
+        assert builder.open_bar("BTCIRT", "1m").timestamp == T0 + MINUTE
+
+    def test_late_and_flush(self):
+        """Test out-of-order trades are counted and flushed bars are not reopened."""
+        builder = CandleBuilder(["1m"])
+        builder.update([trade(MINUTE, "10"), trade(1, "11")])
+        assert builder.late == 1
+
+        assert builder.flush(T0 + MINUTE + 1) == []
+        closed = builder.flush(T0 + 2 * MINUTE)
+        assert [candle.candle.timestamp for candle in closed] == [T0 + MINUTE]
+        assert builder.open_bar("BTCIRT", "1m") is None
+
+        builder.add(trade(MINUTE + 5, "10"))
+        assert builder.late == 2
+        builder.add(trade(2 * MINUTE, "10"))
+        assert builder.open_bar("BTCIRT", "1m").timestamp == T0 + 2 * MINUTE
+
+    def test_tehran_days(self):
+        """Test daily bars close at Tehran midnight (20:30 UTC, T0 is 01:45 local)."""
+        builder = CandleBuilder(["1D"], TEHRAN)
+        builder.add(trade(0, "10"))
+        start = T0 - HOUR - 45 * MINUTE
+
+        assert builder.open_bar("BTCIRT", "1D").timestamp == start
+        assert builder.flush(start + DAY - 1) == []
+        assert builder.add(trade(start + DAY - T0, "11"))[0].candle.timestamp == start
@@ -0,0 +1,78 @@
+import json
+
+from nobitex.market.cursor import TradeCursor
+from nobitex.schema.trade_schema import TradeEntry
+
+T0 = 1700000000000
+
+
+def raw(offset, price="10", amount="1", side="buy", market="BTCIRT"):
+    return {"market": market, "price": price, "amount": amount, "total": "10", "type": side, "timestamp": T0 + offset}
+
+
+def window(*trades):
+    """Newest-first recent-trades payload, as the API returns it."""
+    return {"trades": sorted(trades, key=lambda trade: -trade["timestamp"]), "status": "ok"}
+
+
+class TestTradeCursor:
+    def test_overlapping_polls(self):
+        """Test only trades after the previous window are emitted, oldest first."""
+        cursor = TradeCursor()
+        first = cursor.update_market("BTCIRT", window(raw(0), raw(1), raw(2)))
+        second = cursor.update_market("BTCIRT", json.dumps(window(raw(1), raw(2), raw(3), raw(4))))
+
+        assert [trade.timestamp - T0 for trade in first] == [0, 1, 2]
+        assert [trade.timestamp - T0 for trade in second] == [3, 4]
+        assert all(isinstance(trade, TradeEntry) for trade in second)
+        assert cursor.update_market("BTCIRT", window(raw(3), raw(4))) == []
+        assert cursor.position("BTCIRT") == T0 + 4
+
+    def test_same_timestamp(self):
+        """Test trades sharing the last timestamp are told apart by price, amount and side."""
+        cursor = TradeCursor()
+        cursor.update_market("BTCIRT", window(raw(0), raw(5, "10")))
+        new = cursor.update_market("BTCIRT", window(raw(5, "10"), raw(5, "11"), raw(5, "10", side="sell")))
+
+        assert [(trade.price, trade.type) for trade in new] == [(10, "sell"), (11, "buy")]
+        assert cursor.update_market("BTCIRT", window(raw(5, "10"), raw(5, "11"))) == []
+
+    def test_endpoint_rows(self):
+        """Test rows in the /v2/trades format (time/volume, no market) take the market from the call."""
+        def row(offset, price="10"):
+            return {"time": T0 + offset, "price": price, "volume": "0.5", "type": "buy"}
+
+        cursor = TradeCursor()
+        cursor.update_market("BTCIRT", {"status": "ok", "trades": [row(1), row(0)]})
+        new = cursor.update({"BTCIRT": {"status": "ok", "trades": [row(2), row(1, "11"), row(1)]}})["BTCIRT"]
+
+        assert [(trade.timestamp - T0, trade.price) for trade in new] == [(1, 11), (2, 10)]
+        assert {trade.market for trade in new} == {"BTCIRT"}
+        assert new[0].total == 5.5
+        assert cursor.position("BTCIRT") == T0 + 2
+
+    def test_prefix_not_validated(self):
+        """Test an already-seen (here invalid) prefix is never validated."""
+        cursor = TradeCursor()
+        cursor.update_market("BTCIRT", window(raw(0), raw(1)))
+        stale = raw(0, price="not a number")
+
+        assert [trade.timestamp - T0 for trade in cursor.update_market("BTCIRT", [raw(2), raw(1), stale])] == [2]
+
+    def test_all_markets(self):
+        cursor = TradeCursor()
+        payload = {"BTCIRT": window(raw(0)), "ETHIRT": window(raw(0, market="ETHIRT"), raw(1, market="ETHIRT"))}
+
+        assert {market: len(trades) for market, trades in cursor.update(json.dumps(payload)).items()} == {
+            "BTCIRT": 1,
+            "ETHIRT": 2,
+        }
+        assert cursor.update(payload) == {"BTCIRT": [], "ETHIRT": []}
+        assert cursor.update_market("USDTIRT", {"trades": [], "status": "ok"}) == []
+        assert cursor.position("USDTIRT") is None
+
+    def test_oldest_first_payload(self):
+        cursor = TradeCursor()
+        cursor.update_market("BTCIRT", [raw(0), raw(1)])
+
+        assert [trade.timestamp - T0 for trade in cursor.update_market("BTCIRT", [raw(1), raw(2), raw(3)])] == [2, 3]
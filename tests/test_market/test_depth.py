@@ -0,0 +1,75 @@
+from decimal import Decimal
+
+from pytest import fixture, mark, raises
+
+from nobitex.market.depth import DepthProfile
+from nobitex.schema.orderbook import OrderBook
+
+
+@fixture
+def order_book():
+    return OrderBook.model_validate(
+        {
+            "bids": [["100", "1"], ["99", "2"], ["98", "3"]],
+            "asks": [["101", "1"], ["102", "2"], ["103", "3"]],
+        }
+    )
+
+
+class TestDepthProfile:
+    def test_cached_per_snapshot(self, order_book):
+        """Test OrderBook.depth is built once and reused."""
+        assert order_book.depth is order_book.depth
+        assert isinstance(order_book.depth, DepthProfile)
+
+    @mark.parametrize(
+        "kwargs, base, quote, worst, complete",
+        [
+            ({"base": Decimal("1")}, "1", "101", "101", True),
+            ({"base": Decimal("2")}, "2", "203", "102", True),
+            ({"base": Decimal("6")}, "6", "614", "103", True),
+            ({"base": Decimal("10")}, "6", "614", "103", False),
+            ({"quote": Decimal("305")}, "3", "305", "102", True),
+        ],
+    )
+    def test_buy(self, order_book, kwargs, base, quote, worst, complete):
+        """Test buy estimates walk the asks."""
+        fill = order_book.depth.buy(**kwargs)
+
+        assert fill.base == Decimal(base)
+        assert fill.quote == Decimal(quote)
+        assert fill.average_price == Decimal(quote) / Decimal(base)
+        assert fill.worst_price == Decimal(worst)
+        assert fill.complete is complete
+
+    def test_buy_partial_level_by_quote(self, order_book):
+        fill = order_book.depth.buy(quote=Decimal("152"))
+
+        assert fill.base == Decimal("1.5")
+        assert fill.worst_price == Decimal("102")
+        assert fill.slippage_bps == (Decimal("152") / Decimal("1.5") - 101) / 101 * 10000
+
+    def test_sell(self, order_book):
+        """Test sell estimates walk the bids and report positive slippage."""
+        fill = order_book.depth.sell(base=Decimal("1.5"))
+
+        assert fill.quote == Decimal("149.5")
+        assert fill.worst_price == Decimal("99")
+        assert fill.slippage_bps > 0
+
+    def test_zero_and_empty(self, order_book):
+        assert order_book.depth.buy(base=Decimal(0)).base == 0
+        empty = OrderBook(bids=[], asks=[])
+        assert empty.depth.sell(base=Decimal(1)).complete is False
+        assert empty.depth.depth_within(Decimal(100)) == (0, 0)
+
+    def test_requires_one_target(self, order_book):
+        with raises(ValueError):
+            order_book.depth.buy()
+        with raises(ValueError):
+            order_book.depth.sell(base=Decimal(1), quote=Decimal(1))
+
+    @mark.parametrize("bps, expected", [(0, (0, 0)), (100, (1, 1)), (200, (3, 3)), (10000, (6, 6))])
+    def test_depth_within(self, order_book, bps, expected):
+        """Test cumulative depth within N bps of mid."""
+        assert order_book.depth.depth_within(Decimal(bps)) == tuple(Decimal(value) for value in expected)
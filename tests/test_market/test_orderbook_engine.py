@@ -0,0 +1,150 @@
+from decimal import Decimal
+
+from pytest import fixture, mark, raises
+
+from nobitex.market.orderbook import LevelUpdate, OrderBookEngine, diff_order_books
+from nobitex.schema.orderbook import OrderBook
+
+
+@fixture
+def order_book():
+    return OrderBook.model_validate(
+        {
+            "bids": [["100", "1"], ["99", "2"], ["98", "3"]],
+            "asks": [["101", "1"], ["102", "2"], ["103", "3"]],
+        }
+    )
+
+
+class TestOrderBookEngine:
+    def test_snapshot_round_trip(self, order_book):
+        """Test the engine reproduces the snapshot it was built from."""
+        engine = OrderBookEngine(order_book)
+
+        assert engine.snapshot() == order_book
+        assert engine.snapshot(depth=1) == OrderBook(bids=[["100", "1"]], asks=[["101", "1"]])
+        assert len(engine.bids) == 3
+
+    @mark.parametrize(
+        "update, expected_bids",
+        [
+            (LevelUpdate("bid", Decimal("99.5"), Decimal("4")), ["100", "99.5", "99", "98"]),
+            (LevelUpdate("bid", Decimal("101"), Decimal("4")), ["101", "100", "99", "98"]),
+            (LevelUpdate("bid", Decimal("97"), Decimal("4")), ["100", "99", "98", "97"]),
+            (LevelUpdate("bid", Decimal("99"), Decimal("0")), ["100", "98"]),
+            (LevelUpdate("bid", Decimal("99"), Decimal("5")), ["100", "99", "98"]),
+        ],
+    )
+    def test_apply_keeps_bids_sorted(self, order_book, update, expected_bids):
+        """Test set/delete keeps bids in descending order."""
+        engine = OrderBookEngine(order_book)
+
+        assert engine.apply([update]) == [update]
+        assert engine.bids.prices() == [Decimal(price) for price in expected_bids]
+
+    def test_apply_keeps_asks_sorted(self, order_book):
+        """Test set/delete keeps asks in ascending order."""
+        engine = OrderBookEngine(order_book)
+        engine.apply(
+            [
+                LevelUpdate("ask", Decimal("100.5"), Decimal("1")),
+                LevelUpdate("ask", Decimal("102"), Decimal("0")),
+            ]
+        )
+
+        assert engine.asks.prices() == [Decimal("100.5"), Decimal("101"), Decimal("103")]
+        assert engine.asks.best().price == Decimal("100.5")
+
+    def test_apply_emits_only_changes(self, order_book):
+        """Test no-op updates are not emitted."""
+        engine = OrderBookEngine(order_book)
+        updates = [
+            LevelUpdate("bid", Decimal("100"), Decimal("1")),  # unchanged
+            LevelUpdate("ask", Decimal("150"), Decimal("0")),  # delete missing level
+            LevelUpdate("ask", Decimal("101"), Decimal("-1")),  # negative quantity deletes
+        ]
+
+        assert engine.apply(updates) == [LevelUpdate("ask", Decimal("101"), Decimal("0"))]
+
+    def test_apply_snapshot_delta(self, order_book):
+        """Test replacing the snapshot returns just the changed levels."""
+        engine = OrderBookEngine(order_book)
+        new_book = OrderBook.model_validate(
+            {
+                "bids": [["100", "1"], ["99", "2.5"]],
+                "asks": [["101", "1"], ["102", "2"], ["103", "3"], ["104", "4"]],
+            }
+        )
+
+        changes = engine.apply_snapshot(new_book)
+
+        assert sorted(changes) == sorted(
+            [
+                LevelUpdate("bid", Decimal("99"), Decimal("2.5")),
+                LevelUpdate("bid", Decimal("98"), Decimal("0")),
+                LevelUpdate("ask", Decimal("104"), Decimal("4")),
+            ]
+        )
+        assert engine.snapshot() == new_book
+
+    def test_empty_engine(self):
+        engine = OrderBookEngine()
+
+        assert engine.bids.best() is None
+        assert engine.snapshot() == OrderBook(bids=[], asks=[])
+
+    def test_invalid_side(self):
+        with raises(ValueError):
+            OrderBookEngine().apply([LevelUpdate("mid", Decimal("1"), Decimal("1"))])
+
+
+class TestDiffOrderBooks:
+    @mark.parametrize(
+        "new_bids, new_asks, expected",
+        [
+            # unchanged
+            ([["100", "1"], ["99", "2"], ["98", "3"]], [["101", "1"], ["102", "2"], ["103", "3"]], []),
+            # resized, added in the middle, removed at the tail
+            (
+                [["100", "1.5"], ["99.5", "1"], ["99", "2"]],
+                [["101", "1"], ["102", "2"], ["103", "3"]],
+                [("bid", "100", "1.5"), ("bid", "99.5", "1"), ("bid", "98", "0")],
+            ),
+            # new best ask, removed inner ask, added outer ask
+            (
+                [["100", "1"], ["99", "2"], ["98", "3"]],
+                [["100.5", "1"], ["101", "1"], ["103", "3"], ["104", "1"]],
+                [("ask", "100.5", "1"), ("ask", "102", "0"), ("ask", "104", "1")],
+            ),
+            # emptied book
+            (
+                [],
+                [],
+                [("bid", "100", "0"), ("bid", "99", "0"), ("bid", "98", "0")]
+                + [("ask", "101", "0"), ("ask", "102", "0"), ("ask", "103", "0")],
+            ),
+        ],
+    )
+    def test_diff(self, order_book, new_bids, new_asks, expected):
+        """Test the merge pass finds exactly the changed levels."""
+        new_book = OrderBook.model_validate({"bids": new_bids, "asks": new_asks})
+
+        changes = diff_order_books(order_book, new_book)
+
+        assert changes == [LevelUpdate(side, Decimal(price), Decimal(quantity)) for side, price, quantity in expected]
+
+    def test_diff_applies_to_engine(self, order_book):
+        """Test applying the diff to the old book yields the new one."""
+        new_book = OrderBook.model_validate({"bids": [["101", "1"], ["98", "7"]], "asks": [["102", "2"]]})
+        engine = OrderBookEngine(order_book)
+
+        engine.apply(diff_order_books(order_book, new_book))
+
+        assert engine.snapshot() == new_book
+
+    def test_zero_quantity_levels_are_absent(self, order_book):
+        new_book = OrderBook.model_validate({"bids": [["100", "0"]], "asks": []})
+
+        changes = diff_order_books(OrderBook(bids=[], asks=[]), new_book)
+
+        assert changes == []
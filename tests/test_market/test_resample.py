@@ -0,0 +1,189 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pytest import mark, raises
+
+from nobitex.market.resample import (
+    DAY,
+    HOUR,
+    MINUTE,
+    TEHRAN,
+    Resampler,
+    bucket_bounds,
+    parse_timeframe,
+    resample,
+)
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.ohcl_schema import OHCL, CandleSeries, OHCLEntry
+
+
+def epoch_ms(*args):
+    return int(datetime(*args, tzinfo=timezone.utc).timestamp()) * 1000
+
+
+def minute_rows(count, start=0):
+    """(t, o, h, l, c, v) rows where bar i opens at i, spans [i - 1, i + 2], closes at i + 1 with volume 1."""
+    return [(start + i * MINUTE, i, i + 2, i - 1, i + 1, 1) for i in range(count)]
+
+
+class TestParseTimeframe:
+    @mark.parametrize(
+        "timeframe, expected",
+        [("5m", 5 * MINUTE), ("1h", HOUR), ("1D", DAY), ("D", DAY), ("15", 15 * MINUTE), (1000, 1000)],
+    )
+    def test_parse(self, timeframe, expected):
+        assert parse_timeframe(timeframe) == expected
+
+    @mark.parametrize("timeframe", ["", "5x", "m5", "0m", -1])
+    def test_invalid(self, timeframe):
+        with raises(ValueError):
+            parse_timeframe(timeframe)
+
+
+class TestBucketBounds:
+    @mark.parametrize(
+        "timestamp, offset, expected",
+        [
+            (epoch_ms(2024, 5, 15, 12), 0, (epoch_ms(2024, 5, 13), epoch_ms(2024, 5, 20))),
+            (epoch_ms(2024, 5, 13), 0, (epoch_ms(2024, 5, 13), epoch_ms(2024, 5, 20))),
+            (epoch_ms(2024, 5, 12, 21), TEHRAN, (epoch_ms(2024, 5, 12, 20, 30), epoch_ms(2024, 5, 19, 20, 30))),
+        ],
+    )
+    def test_weeks_start_monday(self, timestamp, offset, expected):
+        """Test weekly buckets start on Monday (local midnight), not on the Thursday of the epoch."""
+        assert bucket_bounds(timestamp, 7 * DAY, offset) == expected
+
+    @mark.parametrize(
+        "timestamp, expected",
+        [
+            # Summer 2021: UTC+04:30, local midnight is 19:30 UTC.
+            (epoch_ms(2021, 7, 1, 12), (epoch_ms(2021, 6, 30, 19, 30), epoch_ms(2021, 7, 1, 19, 30))),
+            # Day of the 2021 spring transition (00:00 -> 01:00): 23 hours long.
+            (epoch_ms(2021, 3, 22, 6), (epoch_ms(2021, 3, 21, 20, 30), epoch_ms(2021, 3, 22, 19, 30))),
+            # No daylight saving since 2023: UTC+03:30.
+            (epoch_ms(2023, 7, 1, 12), (epoch_ms(2023, 6, 30, 20, 30), epoch_ms(2023, 7, 1, 20, 30))),
+        ],
+    )
+    def test_tehran_days(self, timestamp, expected):
+        """Test Tehran days follow local midnight through historical daylight saving."""
+        assert bucket_bounds(timestamp, DAY, TEHRAN) == expected
+
+    def test_tehran_hours(self):
+        assert bucket_bounds(epoch_ms(2021, 7, 1, 12, 40), HOUR, TEHRAN) == (
+            epoch_ms(2021, 7, 1, 12, 30),
+            epoch_ms(2021, 7, 1, 13, 30),
+        )
+        assert bucket_bounds(epoch_ms(2021, 7, 1, 12, 40), HOUR, 12_600_000)[0] == epoch_ms(2021, 7, 1, 12, 30)
+
+    def test_tehran_hours_across_dst_end(self):
+        """Test sub-day buckets restart at local midnight when the 25-hour day of 2021-09-21 ends."""
+        resampler = Resampler("4h", TEHRAN)
+        resampler.update(minute_rows(600, epoch_ms(2021, 9, 21, 12)))
+
+        assert [(t, v) for t, *_, v in resampler.series.rows()] == [
+            (epoch_ms(2021, 9, 21, 11, 30), 210),
+            (epoch_ms(2021, 9, 21, 15, 30), 240),
+            (epoch_ms(2021, 9, 21, 19, 30), 60),
+            (epoch_ms(2021, 9, 21, 20, 30), 90),
+        ]
+        assert bucket_bounds(epoch_ms(2021, 9, 21, 20), 4 * HOUR, TEHRAN) == (
+            epoch_ms(2021, 9, 21, 19, 30),
+            epoch_ms(2021, 9, 21, 20, 30),
+        )
+
+
+class TestResample:
+    def test_five_minutes(self):
+        """Test OHLCV aggregation of 1m rows into 5m buckets, with a partial last bucket."""
+        series = CandleSeries(MarketScale(0, 0))
+        series.timestamps.extend(row[0] for row in minute_rows(12))
+        for index, column in enumerate((series.opens, series.highs, series.lows, series.closes, series.volumes), 1):
+            column.extend(row[index] for row in minute_rows(12))
+
+        result = resample(series, "5m")
+
+        assert list(result.rows()) == [
+            (0, 0, 6, -1, 5, 5),
+            (5 * MINUTE, 5, 11, 4, 10, 5),
+            (10 * MINUTE, 10, 13, 9, 12, 2),
+        ]
+        assert result.scale == MarketScale(0, 0)
+
+    def test_tehran_day(self):
+        """Test daily buckets start at Tehran midnight (20:30 UTC)."""
+        start = DAY - 4 * HOUR  # 20:00 UTC, 23:30 in Tehran
+        resampler = Resampler("1D", TEHRAN)
+        resampler.update(minute_rows(60, start))
+
+        assert list(resampler.series.timestamps) == [DAY - 27 * HOUR - 30 * MINUTE, DAY - 3 * HOUR - 30 * MINUTE]
+        assert list(resampler.series.volumes) == [30, 30]
+        assert list(Resampler("1D").series.timestamps) == []
+
+    def test_tehran_day_dst(self):
+        """Test a 2021 summer day spans local midnight to midnight (UTC+04:30)."""
+        start = epoch_ms(2021, 6, 30, 19)
+        resampler = Resampler("1D", TEHRAN)
+        resampler.update(minute_rows(60, start))
+
+        assert list(resampler.series.timestamps) == [epoch_ms(2021, 6, 29, 19, 30), epoch_ms(2021, 6, 30, 19, 30)]
+        assert list(resampler.series.volumes) == [30, 30]
+
+    def test_ohcl(self):
+        ohcl = OHCL.model_validate([[1699999200 + i * 60, "1", "2", "0.5", "1.5", "0.25"] for i in range(3)])
+
+        assert resample(ohcl, "1h").to_entries() == [
+            OHCLEntry(timestamp=1699999200000, open=1, high=2, low=0.5, close=1.5, volume=0.75)
+        ]
+
+
+class TestResampler:
+    def test_incremental_matches_batch(self):
+        """Test feeding rows in chunks gives the same bars as one pass."""
+        rows = minute_rows(200)
+        resampler = Resampler("15m")
+        for index in range(0, len(rows), 7):
+            resampler.update(rows[index:index + 7])
+
+        expected = Resampler("15m")
+        expected.update(rows)
+        assert list(resampler.series.rows()) == list(expected.series.rows())
+
+    def test_revised_last_bar(self):
+        """Test a repeated last timestamp replaces that input bar and recomputes only the partial bar."""
+        resampler = Resampler("5m")
+        resampler.update(minute_rows(7))
+        resampler.update([(6 * MINUTE, 6, 20, 6, 3, 4)])
+
+        assert list(resampler.series.rows())[-1] == (5 * MINUTE, 5, 20, 4, 3, 5)
+        assert list(resampler.series.rows())[0] == (0, 0, 6, -1, 5, 5)
+        with raises(ValueError):
+            resampler.update([(5 * MINUTE, 1, 1, 1, 1, 1)])
+
+    def test_live_view(self):
+        """Test a new bucket blocked by a live view is not half-appended and can be retried."""
+        resampler = Resampler("5m")
+        resampler.update(minute_rows(5))
+        view = resampler.series.view(0, 1).closes
+
+        with raises(BufferError):
+            resampler.update(minute_rows(1, 5 * MINUTE))
+        assert len(resampler.series.timestamps) == len(resampler.series.closes) == 1
+
+        view.release()
+        resampler.update(minute_rows(1, 5 * MINUTE))
+        assert list(resampler.series.timestamps) == [0, 5 * MINUTE]
+
+    def test_update_entries(self):
+        entries = [
+            OHCLEntry(timestamp=0, open="1.5", high="2", low="1", close="1.25", volume="0.5"),
+            OHCLEntry(timestamp=MINUTE, open="1.25", high="3", low="1.2", close="2.75", volume="0.25"),
+        ]
+        scaled = Resampler("1h", scale=MarketScale(2, 2))
+        scaled.update_entries(entries)
+        floats = Resampler("1h")
+        floats.update_entries(entries)
+
+        assert scaled.series.to_entries() == [
+            OHCLEntry(timestamp=0, open="1.5", high="3", low="1", close="2.75", volume="0.75")
+        ]
+        assert floats.series.entry(0).close == Decimal("2.75")
@@ -0,0 +1,94 @@
+from decimal import Decimal
+
+from pytest import mark, raises
+
+from nobitex.market.resample import MINUTE
+from nobitex.market.rolling import RollingTradeStats, RollingWindow, TradeStats
+from nobitex.schema.trade_schema import TradeEntry
+
+T0 = 1700000000000
+
+
+def trade(offset, price, amount, side="buy", market="BTCIRT"):
+    total = Decimal(price) * Decimal(amount)
+    return TradeEntry(market=market, price=price, amount=amount, total=total, type=side, timestamp=T0 + offset)
+
+
+class TestRollingWindow:
+    def test_stats(self):
+        """Test VWAP, volumes, count and imbalance of the trades in the window."""
+        window = RollingWindow("1m")
+        for item in [trade(0, "100", "1"), trade(1000, "110", "3", "sell"), trade(2000, "90", "1")]:
+            window.add(item)
+
+        assert window.stats() == TradeStats(
+            trades=3,
+            volume=Decimal(5),
+            buy_volume=Decimal(2),
+            sell_volume=Decimal(3),
+            quote_volume=Decimal(520),
+            vwap=Decimal(104),
+            imbalance=Decimal("-0.2"),
+        )
+
+    def test_expiry(self):
+        """Test trades leave the window exactly `window` ms after they happened."""
+        window = RollingWindow("1m")
+        window.add(trade(0, "100", "1"))
+        window.add(trade(30000, "200", "1", "sell"))
+        window.add(trade(MINUTE, "300", "1"))
+
+        assert len(window) == 2
+        assert window.stats().vwap == 250
+
+        window.advance(T0 + MINUTE + 30000)
+        assert window.stats().quote_volume == 300
+        window.advance(T0 + 2 * MINUTE)
+        assert window.stats() == TradeStats(0, 0, 0, 0, 0, None, None)
+
+    def test_late_trades(self):
+        """Test late trades are kept in time order and expire by their own timestamp."""
+        window = RollingWindow("1m")
+        window.add(trade(MINUTE, "100", "1"))
+        window.add(trade(0, "100", "1"))
+        window.add(trade(1000, "1000", "1"))
+        window.add(trade(30000, "200", "1"))
+
+        assert window.stats().trades == 3
+        window.advance(T0 + MINUTE + 1000)
+        assert window.stats().trades == 2
+        window.advance(T0 + 115000)
+        assert window.stats().trades == 1
+        assert window.stats().vwap == 100
+
+    def test_matches_rescan(self):
+        """Test the running sums agree with recomputing the window from scratch."""
+        trades = [trade(i * 7000, str(100 + i % 13), f"0.{i % 7 + 1}", "buy" if i % 3 else "sell") for i in range(60)]
+        window = RollingWindow("1m")
+        for index, item in enumerate(trades):
+            window.add(item)
+            current = [t for t in trades[:index + 1] if t.timestamp > item.timestamp - MINUTE]
+            volume = sum(t.amount for t in current)
+
+            assert window.stats().trades == len(current)
+            assert window.stats().vwap == sum(t.price * t.amount for t in current) / volume
+
+
+class TestRollingTradeStats:
+    def test_markets_and_windows(self):
+        stats = RollingTradeStats(["1m", "5m"])
+        stats.update([trade(0, "100", "1"), trade(2 * MINUTE, "200", "1"), trade(0, "5", "2", market="ETHIRT")])
+
+        assert stats.stats("BTCIRT", "1m").trades == 1
+        assert stats.stats("BTCIRT", "5m").vwap == 150
+        assert stats.stats("ETHIRT", "5m").imbalance == 1
+        assert stats.stats("USDTIRT", "1m").trades == 0
+
+        stats.advance(T0 + 5 * MINUTE)
+        assert stats.stats("BTCIRT", "5m").trades == 1
+        assert stats.stats("ETHIRT", "5m").trades == 0
+
+    @mark.parametrize("window", ["15m", 1000])
+    def test_unknown_window(self, window):
+        with raises(ValueError):
+            RollingTradeStats(["1m"]).stats("BTCIRT", window)
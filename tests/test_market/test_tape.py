@@ -0,0 +1,118 @@
+import json
+
+from pytest import importorskip, mark, raises
+
+from nobitex.market.tape import TradeTape
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.trade_schema import TradeColumns, TradeEntry, decode_all_trades
+
+T0 = 1700000000000
+
+
+def trade(offset, price="10", market="BTCIRT", side="buy"):
+    return TradeEntry(market=market, price=price, amount="0.5", total="5", type=side, timestamp=T0 + offset)
+
+
+class TestTradeTape:
+    def test_partitions(self):
+        """Test trades are stored per market and must stay in time order."""
+        tape = TradeTape()
+        tape.extend([trade(0), trade(0, market="ETHIRT"), trade(5), trade(5, market="ETHIRT", side="sell")])
+
+        assert list(tape) == ["BTCIRT", "ETHIRT"]
+        assert len(tape) == 4
+        assert list(tape.partitions["ETHIRT"].sides) == [1, -1]
+        assert "markets=2" in repr(tape)
+        with raises(ValueError):
+            tape.append(trade(4))
+
+    def test_scaled(self):
+        tape = TradeTape(scaled=True)
+        tape.append(trade(0, "10.5", market="BTCUSDT"))
+
+        assert tape.partitions["BTCUSDT"].scale == MarketScale(8, 6)
+        assert list(tape.partitions["BTCUSDT"].prices) == [1050000000]
+
+    @mark.parametrize(
+        "market, price, amount, total, expected",
+        [
+            ("BTCIRT", "110000000000", "1", "110000000000", 110000000000),
+            ("BTCUSDT", "95000.12", "0.01", "950.0012", 95000120000),
+            ("SHIBIRT", "2", "200000000000", "400000000000", 400000000000),
+        ],
+    )
+    def test_scaled_realistic(self, market, price, amount, total, expected):
+        """Test realistic trades fit int64 at the default market scales."""
+        tape = TradeTape(scaled=True)
+        tape.append(TradeEntry(market=market, price=price, amount=amount, total=total, type="buy", timestamp=T0))
+
+        assert list(tape.partitions[market].totals) == [expected]
+
+    def test_live_view(self):
+        """Test appends blocked by a live column view leave the partition aligned."""
+        importorskip("numpy")
+        tape = TradeTape()
+        tape.append(trade(0))
+        prices = tape.to_numpy("BTCIRT")["price"]
+
+        with raises(BufferError):
+            tape.append(trade(1))
+        with raises(BufferError):
+            tape.extend_columns("BTCIRT", TradeColumns.from_trades([trade(2)]))
+        assert [len(column) for column in tape.partitions["BTCIRT"].columns()] == [1] * 5
+
+        del prices
+        tape.append(trade(3, "11"))
+        assert list(tape.between("BTCIRT", T0 + 1).prices) == [11]
+
+    @mark.parametrize(
+        "start, end, expected", [(None, None, [0, 1, 2, 3]), (1, 3, [1, 2]), (2, None, [2, 3]), (None, 0, [])]
+    )
+    def test_between(self, start, end, expected):
+        """Test time-range queries bisect the timestamp column."""
+        tape = TradeTape()
+        tape.extend([trade(offset) for offset in range(4)])
+        window = tape.between("BTCIRT", None if start is None else T0 + start, None if end is None else T0 + end)
+
+        assert [timestamp - T0 for timestamp in window.timestamps] == expected
+        assert tape.index("BTCIRT", T0 + 2) == 2
+        with raises(KeyError):
+            tape.between("ETHIRT")
+
+    def test_extend_columns(self):
+        """Test newest-first decoded batches are appended in time order."""
+        trades = [
+            {"price": 10 + index, "amount": 1, "total": 10, "type": "buy", "timestamp": T0 + index}
+            for index in (3, 2, 1)
+        ]
+        tape = TradeTape()
+        tape.append(trade(0))
+        tape.extend_columns("BTCIRT", decode_all_trades(json.dumps({"BTCIRT": {"trades": trades}}))["BTCIRT"])
+        tape.extend_columns("BTCIRT", TradeColumns())
+
+        assert [timestamp - T0 for timestamp in tape.partitions["BTCIRT"].timestamps] == [0, 1, 2, 3]
+        assert list(tape.partitions["BTCIRT"].prices) == [10, 11, 12, 13]
+
+        with raises(ValueError):
+            tape.extend_columns("BTCIRT", TradeColumns.from_trades([trade(1)]))
+        with raises(ValueError):
+            tape.extend_columns("BTCIRT", TradeColumns.from_trades([trade(5), trade(4), trade(6)]))
+        with raises(ValueError):
+            tape.extend_columns("BTCIRT", TradeColumns(MarketScale(0, 8)))
+
+    def test_to_numpy(self):
+        importorskip("numpy")
+        tape = TradeTape()
+        tape.extend([trade(0), trade(1, side="sell")])
+
+        assert tape.to_numpy("BTCIRT")["side"].tolist() == [1, -1]
+
+    def test_to_arrow(self):
+        importorskip("pyarrow")
+        tape = TradeTape(scaled=True)
+        tape.extend([trade(0), trade(1, side="sell")])
+        table = tape.to_arrow("BTCIRT")
+
+        assert table.column_names == ["timestamp", "price", "amount", "total", "side"]
+        assert table.column("price").to_pylist() == [10, 10]
+        assert table.schema.metadata[b"amount_scale"] == b"6"
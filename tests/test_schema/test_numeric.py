@@ -0,0 +1,64 @@
+from decimal import ROUND_HALF_EVEN, Decimal
+
+from pytest import fixture, mark, raises
+
+from nobitex.schema import numeric
+from nobitex.schema.numeric import DEFAULT_SCALE, MarketScale, decode, encode, market_scale, register_market_scale
+
+
+class TestEncode:
+    @mark.parametrize(
+        "value, scale, expected",
+        [
+            ("1476091000", 0, 1476091000),
+            ("0.126571", 6, 126571),
+            ("1.0160", 3, 1016),
+            ("-0.5", 2, -50),
+            (Decimal("2.5"), 1, 25),
+            (3, 2, 300),
+            (0.25, 2, 25),
+            ("1e-3", 3, 1),
+            ("0.1", None, 0.1),
+        ],
+    )
+    def test_encode(self, value, scale, expected):
+        """Test scaled and float64 encoding of the supported input types."""
+        assert encode(value, scale) == expected
+
+    @mark.parametrize(
+        "value, scale", [("0.123", 2), ("abc", 2), (Decimal("1.5"), 0), ("200000000000", 8), (2e11, 8), (-2**63, 0)]
+    )
+    def test_encode_invalid(self, value, scale):
+        """Test inexact, non-numeric or out of int64 range values are rejected."""
+        with raises(ValueError):
+            encode(value, scale)
+
+    @mark.parametrize("value, expected", [("0.125", 12), ("0.135", 14), ("-0.125", -12), (Decimal("0.5"), 50)])
+    def test_encode_rounding(self, value, expected):
+        """Test a rounding mode rounds excess decimal places instead of raising."""
+        assert encode(value, 2, ROUND_HALF_EVEN) == expected
+
+    @mark.parametrize("value, scale, expected", [(126571, 6, "0.126571"), (25, 0, "25"), (0.25, None, "0.25")])
+    def test_decode(self, value, scale, expected):
+        assert decode(value, scale) == Decimal(expected)
+
+
+class TestMarketScale:
+    @fixture(autouse=True)
+    def clean_registry(self):
+        yield
+        numeric._market_scales.clear()
+
+    @mark.parametrize(
+        "symbol, expected",
+        [("BTCIRT", MarketScale(0, 6)), ("btcusdt", MarketScale(8, 6)), ("Bitcoin-﷼", DEFAULT_SCALE)],
+    )
+    def test_defaults(self, symbol, expected):
+        """Test quote currency defaults."""
+        assert market_scale(symbol) == expected
+
+    def test_register(self):
+        register_market_scale("shibirt", 2, 0)
+
+        assert market_scale("SHIBIRT") == MarketScale(2, 0)
+        assert market_scale("BTCIRT") == MarketScale(0, 6)
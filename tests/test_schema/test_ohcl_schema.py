@@ -0,0 +1,308 @@
+import json
+from decimal import Decimal
+
+from pydantic import ValidationError
+from pytest import importorskip, mark, raises
+
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.ohcl_schema import (
+    OHCL,
+    CandleSeries,
+    CandleValidationError,
+    OHCLEntry,
+    ScaledCandle,
+    all_ohlc_T,
+    decode_all_ohlc,
+    epoch_ms_factor,
+    find_invalid_candles,
+    validate_candles,
+)
+
+ALL_OHLC = """{
+    "BTCUSDT": {"values": [[1699000000000, "50000", "51000", "49500", "50500", "100.5"],
+                           [1699000060000, "50500", "50600", "50400", "50450"]]},
+    "ETHUSDT": {"values": []}
+}"""
+
+
+class TestScaledCandle:
+    entry = OHCLEntry.model_construct(
+        timestamp=1699000000,
+        open=Decimal("50000.5"),
+        high=Decimal("51000.0"),
+        low=Decimal("49500.25"),
+        close=Decimal("50500"),
+        volume=Decimal("100.125"),
+    )
+
+    def test_round_trip(self):
+        """Test conversion to fixed-point integers and back is exact."""
+        scale = MarketScale(2, 3)
+        scaled = self.entry.to_scaled(scale)
+
+        assert scaled == ScaledCandle(1699000000, 5000050, 5100000, 4950025, 5050000, 100125)
+        assert OHCLEntry.from_scaled(scaled, scale) == self.entry
+
+    def test_precision_loss(self):
+        with raises(ValueError):
+            self.entry.to_scaled(MarketScale(1, 3))
+
+
+class TestCandleSeries:
+    entries = [
+        TestScaledCandle.entry,
+        OHCLEntry.model_construct(
+            timestamp=1699000060,
+            open=Decimal("50500"),
+            high=Decimal("50600.5"),
+            low=Decimal("50400"),
+            close=Decimal("50450"),
+            volume=Decimal("3"),
+        ),
+    ]
+
+    def test_scaled_round_trip(self):
+        """Test scaled columns reproduce the entries exactly."""
+        series = CandleSeries.from_entries(self.entries, MarketScale(2, 3))
+
+        assert len(series) == 2
+        assert series.opens.typecode == "q"
+        assert list(series.highs) == [5100000, 5060050]
+        assert series.to_entries() == self.entries
+
+    def test_float_columns(self):
+        series = CandleSeries.from_entries(self.entries)
+
+        assert series.closes.typecode == "d"
+        assert list(series.volumes) == [100.125, 3.0]
+        assert series.entry(1).low == Decimal("50400.0")
+        assert "candles=2" in repr(series)
+
+    def test_to_numpy(self):
+        importorskip("numpy")
+        arrays = CandleSeries.from_entries(self.entries).to_numpy()
+
+        assert arrays["timestamp"].dtype == "int64"
+        assert arrays["high"].tolist() == [51000.0, 50600.5]
+
+    def test_append_only(self):
+        series = CandleSeries.from_entries(self.entries)
+
+        with raises(ValueError):
+            series.append(self.entries[1])
+
+    def test_append_with_live_view(self):
+        """Test an append blocked by a live column view leaves all columns aligned."""
+        series = self._minute_series()
+        opens = series.last(2).opens
+        entry = OHCLEntry.model_construct(timestamp=600, open=1, high=1, low=1, close=1, volume=1)
+
+        with raises(BufferError):
+            series.append(entry)
+        assert {len(column) for column in (series.timestamps, series.opens, series.volumes)} == {10}
+        assert series.last(1).to_entries()[0].timestamp == 540
+
+        opens.release()
+        series.append(entry)
+        assert len(series.opens) == len(series.timestamps) == 11
+
+    def _minute_series(self):
+        series = CandleSeries(MarketScale(0, 0))
+        series.timestamps.extend(range(0, 600, 60))
+        for column in (series.opens, series.highs, series.lows, series.closes, series.volumes):
+            column.extend(range(10))
+        return series
+
+    @mark.parametrize(
+        "start, end, expected",
+        [(60, 240, [60, 120, 180]), (61, 240, [120, 180]), (None, 120, [0, 60]), (500, None, [540]), (700, 900, [])],
+    )
+    def test_between(self, start, end, expected):
+        """Test time-range lookups return the half-open window [start, end)."""
+        assert list(self._minute_series().between(start, end).timestamps) == expected
+
+    @mark.parametrize(
+        "count, before, expected", [(3, None, [420, 480, 540]), (2, 180, [60, 120]), (5, 61, [0, 60]), (2, 0, [])]
+    )
+    def test_last(self, count, before, expected):
+        assert list(self._minute_series().last(count, before).timestamps) == expected
+
+    def test_view(self):
+        """Test views share the series columns and release them for further appends."""
+        series = self._minute_series()
+        view = series.last(2)
+
+        assert len(view) == 2
+        assert view.entry(-1).timestamp == 540
+        assert view.entry(0) == series.entry(8)
+        assert view.to_entries() == series.to_entries()[8:]
+        assert list(view.rows()) == list(series.rows())[8:]
+        assert list(view.to_series().closes) == [8, 9]
+        assert "start=8" in repr(view)
+        with raises(IndexError):
+            view.entry(2)
+
+        closes = view.closes
+        series.closes[9] = 42
+        assert closes[1] == 42
+        with raises(BufferError):
+            series.closes.append(0)
+        closes.release()
+        series.append(OHCLEntry.model_construct(timestamp=600, open=1, high=1, low=1, close=1, volume=1))
+        assert len(series) == 11
+
+    def test_view_to_numpy(self):
+        importorskip("numpy")
+        arrays = self._minute_series().between(120, 300).to_numpy()
+
+        assert arrays["timestamp"].tolist() == [120, 180, 240]
+        assert arrays["close"].dtype == "int64"
+
+
+class TestOHCLEntry:
+    @mark.parametrize(
+        "data",
+        [
+            [1699000000, "50000.5", "51000", "49500", "50500", "100.5"],
+            (1699000000, "50000.5", "51000", "49500", "50500", "100.5", "extra"),
+            {
+                "timestamp": 1699000000,
+                "open": "50000.5",
+                "high": "51000",
+                "low": "49500",
+                "close": "50500",
+                "volume": "100.5",
+            },
+        ],
+    )
+    def test_formats(self, data):
+        """Test list, tuple and dict rows are accepted."""
+        entry = OHCLEntry.model_validate(data)
+
+        assert entry.open == Decimal("50000.5")
+        assert entry.volume == Decimal("100.5")
+
+    def test_without_volume(self):
+        assert OHCLEntry.model_validate([1699000000, "1", "2", "0.5", "1.5"]).volume == 0
+
+    def test_bounds_checked_per_series(self):
+        """Test a single entry is no longer checked on its own; the series validator does it."""
+        assert OHCLEntry.model_validate([1699000000, "100", "99", "90", "95", "1"]).high == 99
+
+
+class TestValidateCandles:
+    rows = [
+        [1699000000, 100, 110, 90, 105, 1],
+        [1699000060, 100, 99, 90, 95, 1],
+        [1699000120, 100, 110, 101, 105, 1],
+        [1699000120, 100, 110, 90, 105, -1],
+        [1699000180, 100, 110, 90, 105, 0],
+    ]
+
+    def test_all_indexes_reported(self):
+        """Test every failed check lists all offending indexes in one pass."""
+        assert find_invalid_candles([self.rows[0], self.rows[4]]) == {}
+
+        with raises(ValidationError) as error:
+            OHCL.model_validate(self.rows)
+
+        cause = error.value.errors()[0]["ctx"]["error"]
+        assert isinstance(cause, CandleValidationError)
+        assert cause.issues == {
+            "high < max(open, close)": [1],
+            "low > min(open, close)": [2],
+            "timestamp not increasing": [3],
+            "negative volume": [3],
+        }
+
+    def test_series_validate(self):
+        series = CandleSeries(MarketScale(0, 0))
+        for name, column in zip(CandleSeries.__slots__, zip(*self.rows)):
+            getattr(series, name).extend(column)
+
+        with raises(CandleValidationError, match="indexes \\[1\\]"):
+            series.validate()
+        validate_candles(list(series.rows())[4:])
+
+    def test_decode_validates(self):
+        row = '[1699000000000, "1", "2", "0.5", "1.5"]'
+        data = f'{{"BTCUSDT": {{"values": [{row}, {row}]}}}}'
+
+        with raises(CandleValidationError):
+            decode_all_ohlc(data)
+        assert len(decode_all_ohlc(data, validate=False)["BTCUSDT"]) == 2
+
+
+class TestTimestampUnit:
+    @mark.parametrize(
+        "timestamps, factor", [([], 1), ([1699000000], 1000), ([1699000000000, 1699000060000], 1), ([0, 60], 1000)]
+    )
+    def test_factor(self, timestamps, factor):
+        assert epoch_ms_factor(timestamps) == factor
+
+    @mark.parametrize("first, second", [(1699000000, 1699000060), (1699000000000, 1699000060000)])
+    def test_normalized_to_ms(self, first, second):
+        """Test OHCL, all_ohlc_T and decode_all_ohlc store epoch milliseconds whatever the payload unit."""
+        rows = [[first, "1", "2", "0.5", "1.5"], [second, "1", "2", "0.5", "1.5"]]
+        expected = [1699000000000, 1699000060000]
+
+        assert [entry.timestamp for entry in OHCL.model_validate(rows).values] == expected
+        assert [entry.timestamp for entry in all_ohlc_T.validate_python({"BTCIRT": rows})["BTCIRT"].values] == expected
+        assert list(decode_all_ohlc(json.dumps({"BTCIRT": {"values": rows}}))["BTCIRT"].timestamps) == expected
+
+    def test_input_entries_unchanged(self):
+        """Test normalizing to milliseconds does not rescale entries owned by the caller."""
+        entries = [
+            OHCLEntry(timestamp=1700000000 + i * 60, open=1, high=2, low=0.5, close=1.5, volume=1) for i in range(2)
+        ]
+
+        ohlc = OHCL(values=entries)
+
+        assert [entry.timestamp for entry in entries] == [1700000000, 1700000060]
+        assert [entry.timestamp for entry in ohlc.values] == [1700000000000, 1700000060000]
+
+
+class TestAllOHLC:
+    def test_typed_adapter(self):
+        """Test all_ohlc_T parses multi-symbol list-format payloads into OHCL models."""
+        all_ohlc = all_ohlc_T.validate_json(ALL_OHLC)
+
+        assert isinstance(all_ohlc["BTCUSDT"], OHCL)
+        assert all_ohlc["BTCUSDT"].values[1].close == Decimal("50450")
+        assert all_ohlc["BTCUSDT"].values[1].volume == 0
+        assert all_ohlc["ETHUSDT"].values == []
+
+    def test_bare_rows(self):
+        all_ohlc = all_ohlc_T.validate_python({"BTCUSDT": [[1699000000, "1", "2", "0.5", "1.5", "3"]]})
+
+        assert all_ohlc["BTCUSDT"].values[0].volume == Decimal("3")
+
+    def test_to_series(self):
+        ohlc = all_ohlc_T.validate_json(ALL_OHLC)["BTCUSDT"]
+
+        assert ohlc.to_series(MarketScale(0, 1)).to_entries() == ohlc.values
+
+
+class TestDecodeAllOHLC:
+    def test_decode(self):
+        """Test float64 decoding of multi-symbol candles, with and without volume."""
+        series = decode_all_ohlc(ALL_OHLC)
+
+        assert list(series["BTCUSDT"].timestamps) == [1699000000000, 1699000060000]
+        assert list(series["BTCUSDT"].volumes) == [100.5, 0.0]
+        assert list(series["BTCUSDT"].lows) == [49500.0, 50400.0]
+        assert len(series["ETHUSDT"]) == 0
+
+    def test_short_row(self):
+        with raises(ValueError):
+            decode_all_ohlc('{"BTCUSDT": {"values": [[1699000000000, "1", "2", "0"]]}}')
+
+    def test_scaled_matches_adapter(self):
+        """Test the scaled columnar output is exact against all_ohlc_T."""
+        series = decode_all_ohlc(ALL_OHLC.encode(), MarketScale(0, 1))
+        expected = all_ohlc_T.validate_json(ALL_OHLC)
+
+        assert series["BTCUSDT"].scale == MarketScale(0, 1)
+        assert {symbol: s.to_entries() for symbol, s in series.items()} == {
+            symbol: ohlc.values for symbol, ohlc in expected.items()
+        }
@@ -1,9 +1,17 @@
+import json
 from decimal import Decimal
 
 from pydantic import ValidationError
-from pytest import mark
+from pytest import importorskip, mark, raises
 
-from nobitex.schema.orderbook import OrderBook, OrderBookEntry, all_order_books_T
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.orderbook import (
+    ColumnarOrderBook,
+    OrderBook,
+    OrderBookEntry,
+    all_order_books_T,
+    decode_all_order_books,
+)
 
 
 class TestOrderBookEntry:
@@ -162,6 +170,43 @@ class TestOrderBook:
             assert ask.quantity == Decimal(data["asks"][i][1])
         assert isinstance(order_book, OrderBook)
 
+    def test_top_of_book(self):
+        """Test cached best bid/ask, mid and spread."""
+        order_book = OrderBook.model_validate(
+            {"bids": [["99", "1"], ["100", "2"], ["98", "3"]], "asks": [["102", "1"], ["101", "2"]]}
+        )
+
+        assert [bid.price for bid in order_book.bids] == [Decimal("100"), Decimal("99"), Decimal("98")]
+        assert [ask.price for ask in order_book.asks] == [Decimal("101"), Decimal("102")]
+        assert order_book.best_bid == OrderBookEntry(price=Decimal("100"), quantity=Decimal("2"))
+        assert order_book.best_ask.price == Decimal("101")
+        assert order_book.mid == Decimal("100.5")
+        assert order_book.spread == Decimal("1")
+        assert order_book.spread_bps == Decimal("1") / Decimal("100.5") * 10000
+        assert order_book.best_bid is order_book.best_bid
+
+    @mark.parametrize("sample", [{"bids": [], "asks": []}, {"bids": [["100", "1"]], "asks": []}])
+    def test_top_of_book_one_sided(self, sample):
+        """Test derived fields are None when a side is empty."""
+        order_book = OrderBook.model_validate(sample)
+
+        assert order_book.best_ask is None
+        assert order_book.mid is None
+        assert order_book.spread is None
+        assert order_book.spread_bps is None
+
+    def test_model_copy_drops_cache(self):
+        """Test an updated copy recomputes derived fields instead of inheriting the cached ones."""
+        order_book = OrderBook.model_validate({"bids": [["2", "1"]], "asks": [["3", "1"]]})
+        assert order_book.mid == Decimal("2.5")
+        assert order_book.depth is not None
+
+        copy = order_book.model_copy(update={"bids": []})
+
+        assert copy.best_bid is None and copy.mid is None
+        assert order_book.model_copy().mid == Decimal("2.5")
+        assert order_book.mid == Decimal("2.5")
+
 
 @mark.parametrize(
     "all_order_books_data",
@@ -214,3 +259,134 @@ def test_all_order_books_T(all_order_books_data):
 
     assert btcirt_order_book.bids[0].price == Decimal("1470001120")
     assert usdtirt_order_book.asks[1].quantity == Decimal("28185.03")
+
+
+class TestColumnarOrderBook:
+    sample = {
+        "asks": [["1476091000", "1.016"], ["1479700000", "0.2561"]],
+        "bids": [["1470001120", "0.126571"], ["1470000000", "0.818994"]],
+    }
+
+    def test_scaled_mode(self):
+        """Test scaled-integer columns built from raw lists."""
+        book = ColumnarOrderBook.from_lists(self.sample["bids"], self.sample["asks"], 0, 6)
+
+        assert book.scaled
+        assert book.bid_prices.typecode == "q"
+        assert list(book.bid_prices) == [1470001120, 1470000000]
+        assert list(book.bid_quantities) == [126571, 818994]
+        assert list(book.ask_quantities) == [1016000, 256100]
+        assert len(book) == 4
+
+    def test_float_mode(self):
+        """Test float64 columns built from raw lists."""
+        book = ColumnarOrderBook.from_lists(self.sample["bids"], self.sample["asks"])
+
+        assert not book.scaled
+        assert book.ask_prices.typecode == "d"
+        assert list(book.ask_quantities) == [1.016, 0.2561]
+
+    @mark.parametrize("price_scale, quantity_scale", [(0, 6), (2, 10), (None, None)])
+    def test_round_trip(self, price_scale, quantity_scale):
+        """Test conversion to and from OrderBook preserves every level."""
+        order_book = OrderBook.model_validate(self.sample)
+        book = ColumnarOrderBook.from_order_book(order_book, price_scale, quantity_scale)
+
+        assert book.to_order_book() == order_book
+
+    def test_to_order_book_is_sorted(self):
+        """Test the OrderBook side ordering guarantee holds for converted books."""
+        book = ColumnarOrderBook.from_lists(self.sample["bids"][::-1], self.sample["asks"][::-1], 0, 6)
+
+        assert book.to_order_book() == OrderBook.model_validate(self.sample)
+
+    def test_precision_overflow(self):
+        """Test values with more decimals than the scale are rejected."""
+        with raises(ValueError):
+            ColumnarOrderBook.from_lists(self.sample["bids"], [], 0, 4)
+
+    def test_mismatched_scales(self):
+        """Test that scaled mode needs both scales."""
+        with raises(ValueError):
+            ColumnarOrderBook(price_scale=0)
+
+    @mark.parametrize("scales, dtype", [((0, 6), "int64"), ((None, None), "float64")])
+    def test_to_numpy(self, scales, dtype):
+        """Test zero-copy NumPy views of the columns."""
+        importorskip("numpy")
+        book = ColumnarOrderBook.from_lists(self.sample["bids"], self.sample["asks"], *scales)
+
+        arrays = book.to_numpy()
+
+        assert set(arrays) == {"bid_prices", "bid_quantities", "ask_prices", "ask_quantities"}
+        assert arrays["bid_prices"].dtype == dtype
+        assert arrays["ask_quantities"].tolist() == list(book.ask_quantities)
+
+    def test_empty(self):
+        book = ColumnarOrderBook.from_lists([], [], 0, 8)
+        assert len(book) == 0
+        assert book.to_order_book() == OrderBook(bids=[], asks=[])
+        assert "bids=0" in repr(book)
+
+
+class TestDecodeAllOrderBooks:
+    data = """{
+        "status": "ok",
+        "BTCIRT": {"lastUpdate": 1644991756704,
+                   "asks": [["1476091000", "1.016"], ["1479700000", "0.2561"]],
+                   "bids": [["1470001120", "0.126571"], ["1470000000", "0.818994"]]},
+        "USDTBTC": {"lastUpdate": 1644991767392, "asks": [], "bids": []}
+    }"""
+
+    def test_matches_adapter(self):
+        """Test the scaled bulk path is exact against all_order_books_T."""
+        books = decode_all_order_books(self.data, 0, 6)
+        expected = all_order_books_T.validate_python({k: v for k, v in json.loads(self.data).items() if k != "status"})
+
+        assert set(books) == {"BTCIRT", "USDTBTC"}
+        assert {symbol: book.to_order_book() for symbol, book in books.items()} == expected
+
+    def test_float_mode(self):
+        """Test the float64 bulk path."""
+        books = decode_all_order_books(self.data.encode())
+
+        assert list(books["BTCIRT"].bid_prices) == [1470001120.0, 1470000000.0]
+        assert list(books["BTCIRT"].ask_quantities) == [1.016, 0.2561]
+        assert len(books["USDTBTC"]) == 0
+
+    @mark.parametrize("scales", [(None, None), (0, 6)])
+    def test_invalid_level(self, scales):
+        """Test malformed levels are rejected."""
+        with raises((ValidationError, ValueError)):
+            decode_all_order_books('{"BTCIRT": {"bids": [["abc", "1"]], "asks": []}}', *scales)
+
+
+class TestScaledOrderBook:
+    scale = MarketScale(0, 6)
+
+    def test_entry_round_trip(self):
+        """Test OrderBookEntry conversion to fixed-point integers and back is exact."""
+        entry = OrderBookEntry.model_validate(["1470001120", "0.126571"])
+
+        assert entry.to_scaled(self.scale) == (1470001120, 126571)
+        assert OrderBookEntry.from_scaled(1470001120, 126571, self.scale) == entry
+
+    def test_entry_precision_loss(self):
+        with raises(ValueError):
+            OrderBookEntry.model_validate(["1.5", "1"]).to_scaled(self.scale)
+
+    @mark.parametrize("scale, typecode", [(MarketScale(0, 6), "q"), (None, "d")])
+    def test_to_columnar(self, scale, typecode):
+        """Test OrderBook.to_columnar and the spread/mid computed on columns."""
+        order_book = OrderBook.model_validate(TestColumnarOrderBook.sample)
+        book = order_book.to_columnar(scale)
+
+        assert book.bid_prices.typecode == typecode
+        assert book.spread == order_book.spread
+        assert book.mid == order_book.mid
+
+    def test_columnar_empty_side(self):
+        book = ColumnarOrderBook.from_lists([["1", "1"]], [], 0, 0)
+
+        assert book.spread is None
+        assert book.mid is None
@@ -0,0 +1,41 @@
+from pytest import raises
+
+from nobitex.schema.symbols import TradeSide, intern_market, market_id, market_symbol
+from nobitex.schema.trade_schema import TradeEntry, all_trades_T
+
+
+class TestMarketRegistry:
+    def test_intern(self):
+        """Test equal symbols share one instance and one id."""
+        symbol = "".join(["XYZ", "IRT"])
+
+        assert intern_market(symbol) is intern_market("XYZIRT")
+        assert market_id(symbol) == market_id("XYZIRT")
+        assert market_symbol(market_id(symbol)) == "XYZIRT"
+        assert market_id("XYZUSDT") != market_id("XYZIRT")
+
+    def test_unknown_id(self):
+        with raises(IndexError):
+            market_symbol(-1)
+        with raises(IndexError):
+            market_symbol(10**9)
+
+    def test_trades_share_symbols(self):
+        """Test parsed trades reference a single interned market string."""
+        trade = {"market": "BTCIRT", "price": "1", "amount": "1", "total": "1", "type": "sell", "timestamp": 0}
+        parsed = all_trades_T.validate_python({"BTCIRT": {"trades": [trade, dict(trade)], "status": "ok"}})
+        first, second = parsed["BTCIRT"].trades
+
+        assert first.market is second.market is intern_market("BTCIRT")
+        assert first.market_id == market_id("BTCIRT")
+
+
+class TestTradeSide:
+    def test_compares_as_string(self):
+        trade = TradeEntry(market="BTCIRT", price=1, amount=1, total=1, type="buy", timestamp=0)
+
+        assert trade.type is TradeSide.BUY
+        assert trade.type == "buy"
+        assert str(trade.type) == "buy"
+        assert trade.model_dump(mode="json")["type"] == "buy"
+        assert (TradeSide.BUY.sign, TradeSide.SELL.sign) == (1, -1)
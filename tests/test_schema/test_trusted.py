@@ -0,0 +1,178 @@
+import gc
+import json
+import random
+from decimal import Decimal
+
+from pytest import fixture, mark
+
+from nobitex.schema import trusted
+from nobitex.schema.ohcl_schema import OHCLEntry
+from nobitex.schema.orderbook import OrderBook
+from nobitex.schema.trade_schema import NubitexTrades
+from nobitex.schema.trusted import (
+    construct_ohlc,
+    load_all_order_books,
+    load_all_trades,
+    load_ohlc,
+    load_order_book,
+    load_trades,
+    set_trusted_input,
+    trusted_input_enabled,
+)
+
+
+def make_corpus(seed):
+    rng = random.Random(seed)
+    books, trades = {}, {}
+    for m in range(5):
+        symbol = f"M{m}IRT"
+        mid = rng.randint(1000, 10**10)
+        books[symbol] = {
+            "lastUpdate": 1644991756704,
+            "bids": [[str(mid - i), f"{rng.random() * 10:.{rng.randint(0, 10)}f}"] for i in range(1, 30)],
+            "asks": [[mid + i, rng.random()] for i in range(1, 30)],
+        }
+        trades[symbol] = {
+            "status": "ok",
+            "trades": [
+                {
+                    "market": symbol,
+                    "price": str(mid),
+                    "amount": f"{rng.random():.8f}",
+                    "total": f"{rng.random() * mid:.4f}",
+                    "type": rng.choice(["buy", "sell"]),
+                    "timestamp": f"2024-01-01T10:00:{i:02d}.{rng.randint(0, 999999):06d}+00:00",
+                }
+                for i in range(30)
+            ],
+        }
+    return books, trades
+
+
+def make_endpoint_trades(seed):
+    """Recorded ``/v2/trades`` responses: ``time`` and ``volume``, no market or total."""
+    rng = random.Random(seed)
+    return {
+        "status": "ok",
+        "trades": [
+            {
+                "time": 1700000000000 + i * rng.randint(1, 1000),
+                "price": str(rng.randint(1000, 10**10)),
+                "volume": f"{rng.random():.8f}",
+                "type": rng.choice(["buy", "sell"]),
+            }
+            for i in range(30)
+        ],
+    }
+
+
+@fixture(autouse=True)
+def reset_mode():
+    yield
+    set_trusted_input(False)
+
+
+class TestTrustedInput:
+    @mark.parametrize("seed", range(5))
+    def test_order_books_identical(self, seed):
+        """Test trusted construction matches validated parsing on a corpus, from JSON and from Python data."""
+        books, _ = make_corpus(seed)
+        data = json.dumps(books)
+
+        assert load_all_order_books(data, trusted=True) == load_all_order_books(data, trusted=False)
+        assert load_all_order_books(books, trusted=True) == load_all_order_books(books, trusted=False)
+
+    @mark.parametrize("seed", range(5))
+    def test_trades_identical(self, seed):
+        _, trades = make_corpus(seed)
+        data = json.dumps(trades).encode()
+
+        assert load_all_trades(data, trusted=True) == load_all_trades(data, trusted=False)
+        assert load_all_trades(trades, trusted=True) == load_all_trades(trades, trusted=False)
+
+    @mark.parametrize("seed", range(5))
+    def test_endpoint_trades_identical(self, seed):
+        """Test raw /v2/trades rows take the market from the caller and get computed totals on both paths."""
+        trades = make_endpoint_trades(seed)
+        data = json.dumps(trades)
+
+        validated = load_trades(data, trusted=False, market="BTCIRT")
+        assert load_trades(data, trusted=True, market="BTCIRT") == validated
+        assert load_trades(trades, trusted=True, market="BTCIRT") == validated
+        assert {trade.market for trade in validated.trades} == {"BTCIRT"}
+
+    @mark.parametrize(
+        "data",
+        [
+            {"s": "ok", "t": [1699000000, 1699000060], "o": [1, 2], "h": [3, 2], "l": [0.5, 2], "c": [2, 2]},
+            {"s": "ok", "t": [1699000000], "o": ["1"], "h": ["3"], "l": ["0.5"], "c": ["2"], "v": ["10"]},
+            {"s": "no_data"},
+            [[1699000000, "1", "3", "0.5", "2", "10"], [1699000060, "2", "2", "2", "2"]],
+            [],
+        ],
+    )
+    def test_ohlc_shapes_identical(self, data):
+        """Test UDF history responses and bare row lists are accepted like OHCL.parse_rows accepts them."""
+        assert load_ohlc(data, trusted=True) == load_ohlc(data, trusted=False)
+        assert load_ohlc(json.dumps(data), trusted=True) == load_ohlc(json.dumps(data), trusted=False)
+
+    def test_dumped_models_round_trip(self):
+        """Test replaying our own model_dump_json output."""
+        books, trades = make_corpus(0)
+        book = OrderBook.model_validate(books["M0IRT"])
+        trade_list = NubitexTrades.model_validate(trades["M0IRT"])
+
+        assert load_order_book(book.model_dump_json(), trusted=True) == book
+        assert load_trades(trade_list.model_dump(), trusted=True) == trade_list
+
+    def test_ohlc(self):
+        data = '{"values": [[1699000000, "1", "3", "0.5", "2", "10"], [1699000060, "2", "2", "2", "2"]]}'
+
+        ohlc = construct_ohlc(data)
+
+        assert ohlc == load_ohlc(data, trusted=False)
+
+        assert ohlc.values[0] == OHCLEntry.model_construct(
+            timestamp=1699000000000,
+            open=Decimal("1"),
+            high=Decimal("3"),
+            low=Decimal("0.5"),
+            close=Decimal("2"),
+            volume=Decimal("10"),
+        )
+        assert ohlc.values[1].volume == 0
+        assert construct_ohlc(ohlc.model_dump()) == ohlc
+
+    def test_number_types_kept(self):
+        """Test equal ints and floats keep the exponent validation gives them (1 -> 1, 1.0 -> 1.0)."""
+        data = {"bids": [[1, 1], [1.0, 2.5]], "asks": [["1.50", 1.0], [2, "1"]]}
+        trusted_book, validated = load_order_book(data, trusted=True), load_order_book(data, trusted=False)
+
+        for trusted_side, validated_side in ((trusted_book.bids, validated.bids), (trusted_book.asks, validated.asks)):
+            assert [(str(level.price), str(level.quantity)) for level in trusted_side] == [
+                (str(level.price), str(level.quantity)) for level in validated_side
+            ]
+
+    def test_trusted_books_are_sorted(self):
+        book = load_order_book({"bids": [["1", "1"], ["2", "1"]], "asks": [["4", "1"], ["3", "1"]]}, trusted=True)
+
+        assert [bid.price for bid in book.bids] == [2, 1]
+        assert [ask.price for ask in book.asks] == [3, 4]
+
+    def test_global_switch(self, monkeypatch):
+        """Test the process-wide default and per-call override."""
+        calls = []
+        monkeypatch.setattr(trusted, "construct_order_book", lambda data: calls.append(data))
+        books, _ = make_corpus(1)
+
+        load_order_book(books["M0IRT"])
+        set_trusted_input(True)
+        assert trusted_input_enabled()
+        load_order_book(books["M0IRT"])
+        load_order_book(books["M0IRT"], trusted=False)
+
+        assert len(calls) == 1
+
+    def test_gc_restored(self):
+        load_all_order_books(make_corpus(2)[0], trusted=True)
+        assert gc.isenabled()
@@ -7,8 +7,17 @@ schema uses Nubitex format with fields:
 
 import pytest
 from decimal import Decimal
-from datetime import datetime
-from trade_schema import TradeEntry, NubitexTrades, all_trades_T
+from datetime import datetime, timezone
+from pydantic import ValidationError
+from nobitex.schema.numeric import MarketScale
+from nobitex.schema.trade_schema import (
+    TradeColumns,
+    TradeEntry,
+    NubitexTrades,
+    all_trades_T,
+    decode_all_trades,
+    parse_epoch_ms,
+)
 
 
 class TestTradeEntry:
@@ -30,7 +39,27 @@ class TestTradeEntry:
         assert trade.amount == Decimal("0.1")
         assert trade.total == Decimal("5000.05")
         assert trade.type == "buy"
-        assert "2024-01-01" in trade.timestamp
+        assert trade.timestamp == 1704103200000
+        assert "2024-01-01" in trade.iso_timestamp
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            "2018-11-18T11:56:07.798845+00:00",
+            "2018-11-18T11:56:07.798Z",
+            datetime(2018, 11, 18, 11, 56, 7, 798845),
+            1542542167798,
+            "1542542167798",
+        ],
+    )
+    def test_epoch_timestamp(self, timestamp):
+
+        trade = TradeEntry(market="BTCIRT", price=1, amount=1, total=1, type="buy", timestamp=timestamp)
+
+        assert trade.timestamp == 1542542167798
+        assert trade.time == datetime(2018, 11, 18, 11, 56, 7, 798000, tzinfo=timezone.utc)
+        assert trade.iso_timestamp == "2018-11-18T11:56:07.798000+00:00"
+        assert trade == trade.model_copy()
     
     def test_buy_type(self):
 
@@ -68,6 +97,19 @@ class TestTradeEntry:
                 "timestamp": "2024-01-01T10:00:00+00:00"
             })
     
+    @pytest.mark.parametrize(
+        "row",
+        [
+            {"time": 1700000000000, "volume": "1", "type": "buy"},
+            {"time": 1700000000000, "price": "abc", "volume": "1", "type": "buy"},
+            {"time": 1700000000000, "price": "1", "volume": "1"},
+        ],
+    )
+    def test_malformed_api_row(self, row):
+        """Test missing or malformed API row values raise ValidationError, not KeyError or InvalidOperation."""
+        with pytest.raises(ValidationError):
+            TradeEntry.model_validate(row, context={"market": "BTCIRT"})
+
     def test_preserves_decimal_precision(self):
         
         trade = TradeEntry.model_validate({
@@ -83,6 +125,38 @@ class TestTradeEntry:
         assert str(trade.amount) == "0.987654321"
 
 
+    def test_scaled_round_trip(self):
+
+        trade = TradeEntry.model_validate({
+            "market": "BTCIRT",
+            "price": "750032220",
+            "amount": "0.13326",
+            "total": "99949293.63720000000000000000",
+            "type": "buy",
+            "timestamp": "2018-11-18T11:56:07.798845+00:00"
+        })
+
+        scaled = trade.to_scaled()
+
+        assert (scaled.price, scaled.amount, scaled.total) == (750032220, 133260, 99949294)
+        assert TradeEntry.from_scaled(scaled) == trade.model_copy(update={"total": Decimal("99949294")})
+
+    def test_scaled_precision_loss(self):
+
+        trade = TradeEntry.model_validate({
+            "market": "BTCIRT",
+            "price": "750032220.5",
+            "amount": "0.1",
+            "total": "75003222.05",
+            "type": "sell",
+            "timestamp": "2018-11-18T11:56:07.798845+00:00"
+        })
+
+        with pytest.raises(ValueError):
+            trade.to_scaled()
+        assert trade.to_scaled(MarketScale(1, 1)).price == 7500322205
+
+
 class TestNubitexTrades:
     
     def test_parses_multiple_trades(self):
@@ -149,6 +223,68 @@ class TestRealNubitexFormat:
         assert trades.trades[0].type == "buy"
 
 
+class TestParseEpochMs:
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2018-11-18T11:56:07.798845+00:00", 1542542167798),
+        ("2018-11-18T15:26:07.798+03:30", 1542542167798),
+        ("2018-11-18T11:56:07Z", 1542542167000),
+        (datetime(2018, 11, 18, 11, 56, 7), 1542542167000),
+        (1542542167, 1542542167000),
+        ("1542542167798", 1542542167798),
+    ])
+    def test_parse(self, value, expected):
+        assert parse_epoch_ms(value) == expected
+
+
+class TestTradeColumns:
+
+    payload = """{
+        "BTCIRT": {"status": "ok", "trades": [
+            {"market": "BTCIRT", "price": "750032220", "amount": "0.13326", "total": "99949293.6372",
+             "type": "buy", "timestamp": "2018-11-18T11:56:07.798845+00:00"},
+            {"market": "BTCIRT", "price": "750032200", "amount": "0.5", "total": "375016100",
+             "type": "sell", "timestamp": "2018-11-18T11:56:08+00:00"}
+        ]},
+        "USDTIRT": {"status": "ok", "trades": []}
+    }"""
+
+    def test_decode_all_trades(self):
+        columns = decode_all_trades(self.payload)
+
+        btc = columns["BTCIRT"]
+        assert len(btc) == 2
+        assert list(btc.timestamps) == [1542542167798, 1542542168000]
+        assert list(btc.prices) == [750032220.0, 750032200.0]
+        assert list(btc.sides) == [1, -1]
+        assert len(columns["USDTIRT"]) == 0
+
+    def test_matches_trade_entries(self):
+        trades = all_trades_T.validate_json(self.payload)["BTCIRT"].trades
+        decoded = decode_all_trades(self.payload)["BTCIRT"]
+
+        columns = TradeColumns.from_trades(trades)
+
+        assert list(columns.totals) == list(decoded.totals)
+        assert list(columns.timestamps) == list(decoded.timestamps)
+        assert "trades=2" in repr(columns)
+
+    def test_scaled(self):
+        trades = all_trades_T.validate_json(self.payload)["BTCIRT"].trades
+
+        columns = TradeColumns.from_trades(trades, MarketScale(0, 5))
+
+        assert list(columns.amounts) == [13326, 50000]
+        assert list(columns.totals) == [99949294, 375016100]
+
+    def test_to_numpy(self):
+        pytest.importorskip("numpy")
+        arrays = decode_all_trades(self.payload)["BTCIRT"].to_numpy()
+
+        assert arrays["side"].dtype == "int8"
+        assert arrays["timestamp"].tolist() == [1542542167798, 1542542168000]
+
+
 if __name__ == "__main__":
     print("\n" + "="*60)
     print("NUBITEX TRADE SCHEMA TESTS")